@@ -0,0 +1,7 @@
+"""Benchmark suite for the dash-builder hot paths.
+
+Run from the repository root:
+
+* `python -m benchmarks --save baseline.json` - record a baseline.
+* `python -m benchmarks --compare baseline.json` - flag regressions against it.
+"""
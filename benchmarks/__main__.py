@@ -0,0 +1,57 @@
+"""Run the benchmark suite, optionally saving or comparing a JSON baseline."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from .cases import cases
+from .harness import compare, load_baseline, measure, save_baseline
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks.
+
+    Args:
+        argv: command-line arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        process exit code, `1` if any case regressed.
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--save", type=Path, help="Write results to a baseline.")
+    parser.add_argument("--compare", type=Path, help="Compare with a baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown that counts as a regression (default 0.2).",
+    )
+    parser.add_argument("--filter", default="", help="Only run matching cases.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for case in cases():
+        if args.filter not in case.name:
+            continue
+        results[case.name] = timing = measure(case, repeat=args.repeat)
+        print(f"{case.name:<32} {timing['min'] * 1e6:>12.2f} us")
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"Saved baseline to {args.save}")
+    if args.compare:
+        rows = compare(load_baseline(args.compare), results, args.threshold)
+        regressions = [name for name, _, regressed in rows if regressed]
+        for name, ratio, regressed in rows:
+            flag = "REGRESSION" if regressed else "ok"
+            print(f"{name:<32} {ratio:>8.2f}x  {flag}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Module containing the benchmark cases for the dash-builder hot paths."""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from dash import html
+from dash._utils import to_json
+from rich.console import Console
+
+from dash_builder import DashPage, DashView
+from dash_builder.cli import Project
+from dash_builder.profiling import load_project
+
+from .harness import Benchmark
+
+__all__ = ["cases"]
+
+EXAMPLE = Path(__file__).parents[1] / "src" / "dash_builder" / "examples"
+"""Directory of the bundled project templates."""
+
+
+class BenchmarkPage(DashPage):
+    """Page with a small, successful layout."""
+
+    @classmethod
+    def valid_layout(cls, **kwargs):
+        """Render a small component tree."""
+        return html.Div([html.H1("Title"), html.P("Body", className="body")])
+
+
+class BrokenBenchmarkPage(DashPage):
+    """Page whose layout always fails."""
+
+    @classmethod
+    def valid_layout(cls, **kwargs):
+        """Raise to exercise the `error_container` path."""
+        raise RuntimeError("backend unavailable")
+
+
+class BenchmarkSummaryView(DashView):
+    """View used for ID generation."""
+
+    @classmethod
+    def valid_layout(cls, id: str, **kwargs):
+        """Render a single component."""
+        return html.Div(id=cls.id(id))
+
+
+def _scaffold_views(count: int) -> None:
+    """Create a project and scaffold `count` views into it."""
+    with tempfile.TemporaryDirectory() as directory:
+        project = Project("bench", "basic-mantine", directory)
+        project.console = Console(quiet=True)
+        project.build()
+        project.add_views([f"Generated{i}" for i in range(count)])
+
+
+def _import_in_subprocess(statement: str) -> None:
+    """Run an import statement in a fresh interpreter."""
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+def cases() -> list[Benchmark]:
+    """Build the benchmark cases."""
+    app = load_project(EXAMPLE / "basic-mantine").app
+    return [
+        Benchmark("layout.success", lambda: BenchmarkPage.layout()),
+        Benchmark("layout.error", lambda: BrokenBenchmarkPage.layout()),
+        Benchmark("view.id", lambda: BenchmarkSummaryView.id("summary", "title")),
+        Benchmark("view.matched_id", BenchmarkSummaryView.matched_id),
+        Benchmark("view.all_ids", BenchmarkSummaryView.all_ids),
+        Benchmark("name.cached", lambda: BenchmarkSummaryView.name("title")),
+        Benchmark(
+            "name.convert",
+            lambda: DashPage._convert_pascal_to_kebab_case("BenchmarkSummaryView"),
+        ),
+        Benchmark("serialize.basic_mantine", lambda: to_json(app.layout)),
+        Benchmark("cli.scaffold_200_views", lambda: _scaffold_views(200), number=1),
+        Benchmark(
+            "import.cli",
+            lambda: _import_in_subprocess("import dash_builder.cli"),
+            number=1,
+        ),
+        Benchmark(
+            "import.runtime",
+            lambda: _import_in_subprocess("from dash_builder import DashPage"),
+            number=1,
+        ),
+    ]
@@ -0,0 +1,95 @@
+"""Module containing the timing, baseline and comparison helpers."""
+
+import json
+import platform
+import statistics
+import sys
+import timeit
+import typing
+from pathlib import Path
+
+__all__ = ["Benchmark", "compare", "load_baseline", "measure", "save_baseline"]
+
+
+class Benchmark(typing.NamedTuple):
+    """A named benchmark case."""
+
+    name: str
+    """Unique name of the case, used as the baseline key."""
+    func: typing.Callable[[], typing.Any]
+    """Zero-argument callable to time."""
+    number: int | None = None
+    """Calls per repeat, or `None` to pick automatically."""
+
+
+def measure(benchmark: Benchmark, repeat: int = 5) -> dict[str, float]:
+    """Time a benchmark case.
+
+    Args:
+        benchmark: the case to time.
+        repeat: number of timed repeats.
+
+    Returns:
+        dictionary of the `min` and `median` seconds per call.
+
+    """
+    timer = timeit.Timer(benchmark.func)
+    number = benchmark.number or timer.autorange()[0]
+    per_call = [total / number for total in timer.repeat(repeat, number)]
+    return {"min": min(per_call), "median": statistics.median(per_call)}
+
+
+def save_baseline(path: Path, results: dict[str, dict[str, float]]) -> None:
+    """Write benchmark results and the environment to a JSON baseline.
+
+    Args:
+        path: destination file.
+        results: per-case timings from `measure`.
+
+    """
+    document = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, float]]:
+    """Read the per-case timings of a JSON baseline.
+
+    Args:
+        path: baseline file written by `save_baseline`.
+
+    Returns:
+        per-case timings.
+
+    """
+    return json.loads(path.read_text())["results"]
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float = 0.2,
+) -> list[tuple[str, float, bool]]:
+    """Compare current timings with a baseline.
+
+    Cases are compared on their `min` time, the least noisy statistic.
+
+    Args:
+        baseline: per-case timings of the baseline.
+        current: per-case timings of the current run.
+        threshold: relative slowdown above which a case regresses.
+
+    Returns:
+        list of `(name, ratio, regressed)` for cases present in both runs.
+
+    """
+    rows = []
+    for name, timing in current.items():
+        if name not in baseline:
+            continue
+        ratio = timing["min"] / baseline[name]["min"]
+        rows.append((name, ratio, ratio > 1 + threshold))
+    return rows
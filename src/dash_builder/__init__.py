@@ -4,10 +4,93 @@
 
 * Using `pip` - `pip install dash-builder`
 * Using `uv` - `uv add dash-builder`
+
+Submodules and public classes are imported on first access, so the CLI does not
+pay for Dash and app servers do not pay for the CLI dependencies.
 """
 
-from . import cli, dash_page, dash_view
-from .dash_page import DashPage
-from .dash_view import DashView
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from . import (
+        backends,
+        cache,
+        check,
+        cli,
+        compose,
+        dash_page,
+        dash_view,
+        errors,
+        fragments,
+        graph,
+        index,
+        limits,
+        loaders,
+        metrics,
+        patches,
+        prerender,
+        shared,
+        skeleton,
+        snapshot,
+        table,
+        timeseries,
+    )
+    from .cache import LayoutCache
+    from .dash_page import DashPage
+    from .dash_view import DashView
+    from .snapshot import LayoutSnapshot
+
+__all__ = [
+    "DashPage",
+    "DashView",
+    "LayoutCache",
+    "LayoutSnapshot",
+    "backends",
+    "cache",
+    "check",
+    "cli",
+    "compose",
+    "dash_page",
+    "dash_view",
+    "errors",
+    "fragments",
+    "graph",
+    "index",
+    "limits",
+    "loaders",
+    "metrics",
+    "patches",
+    "prerender",
+    "shared",
+    "skeleton",
+    "snapshot",
+    "table",
+    "timeseries",
+]
+
+_ATTRIBUTES: dict[str, str] = {
+    "DashPage": "dash_page",
+    "DashView": "dash_view",
+    "LayoutCache": "cache",
+    "LayoutSnapshot": "snapshot",
+}
+"""Public classes mapped to the submodule that defines them."""
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import public submodules and classes on first access."""
+    if name in _ATTRIBUTES:
+        module = importlib.import_module(f".{_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in __all__:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-__all__ = ["DashPage", "DashView", "cli", "dash_page", "dash_view"]
+def __dir__() -> list[str]:
+    """List the module attributes, including not-yet-imported public names."""
+    return sorted({*globals(), *__all__})
@@ -1,12 +1,26 @@
 """Module containing the basic DashObject class for creating Dash objects."""
 
 import abc
+import asyncio
+import concurrent.futures
+import contextvars
+import inspect
 import re
-import traceback
+import time
+import typing
 
-import dash_mantine_components as dmc
 from dash import html
 
+from ._pool import in_render_worker, render_pool
+from .backends import BackendCache
+from .cache import MISSING, LayoutCache
+from .errors import ErrorPolicy, default_error_policy
+from .limits import ConcurrencyLimiter
+from .metrics import RenderMetrics, render_metrics
+from .shared import SharedLayoutStore
+from .skeleton import LayoutTemplate
+from .snapshot import LayoutSnapshot
+
 __all__ = ["DashObject"]
 
 PASCAL_TO_KEBAB_REGEX = re.compile(r"(?<!^)(?=[A-Z])")
@@ -15,6 +29,31 @@ PASCAL_TO_KEBAB_REGEX = re.compile(r"(?<!^)(?=[A-Z])")
 class DashObject(abc.ABC):
     """Abstract base class for creating Dash objects."""
 
+    layout_cache: LayoutCache | SharedLayoutStore | BackendCache | None = None
+    """Opt-in cache for rendered layouts. Disabled when `None`.
+
+    A `SharedLayoutStore` or `BackendCache` serves layouts shared between
+    processes as `LayoutSnapshot` objects.
+    """
+    snapshot_cache: LayoutCache | SharedLayoutStore | BackendCache | None = None
+    """Opt-in cache for `LayoutSnapshot` objects. Disabled when `None`."""
+    cache_tags: tuple[str, ...] = ()
+    """Extra tags of the entries a `BackendCache` stores for this class."""
+    render_metrics: RenderMetrics = render_metrics
+    """`RenderMetrics` registry that records `layout` calls when enabled."""
+    error_policy: ErrorPolicy = default_error_policy
+    """`ErrorPolicy` applied when `valid_layout` raises."""
+    render_timeout: float | None = None
+    """Seconds `valid_layout` may run before the error fallback is served."""
+    admission: ConcurrencyLimiter | None = None
+    """Opt-in `ConcurrencyLimiter` that sheds excess renders. Disabled when `None`."""
+    _kebab_name: str
+    """Kebab-case class name, computed once per class."""
+    _name_cache: dict[str | None, str]
+    """Cache of `name` results keyed by subname."""
+    _name_cache_maxsize: int = 4096
+    """Maximum number of cached names per class; further names are built on demand."""
+
     @staticmethod
     def _convert_pascal_to_kebab_case(input: str) -> str:
         """Convert PascalCaseString to kebab-case-string.
@@ -28,6 +67,17 @@ class DashObject(abc.ABC):
         """
         return PASCAL_TO_KEBAB_REGEX.sub("-", input).lower()
 
+    def __init_subclass__(cls, **kwargs):
+        """Precompute class-level name caches for each subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._reset_name_cache()
+
+    @classmethod
+    def _reset_name_cache(cls) -> None:
+        """Compute the kebab-case class name and reset the `name` cache."""
+        cls._kebab_name = cls._convert_pascal_to_kebab_case(cls.__name__)
+        cls._name_cache = {None: cls._kebab_name}
+
     @classmethod
     def name(cls, subname: str | None = None) -> str:
         """View name, used as the `type` field of component IDs.
@@ -39,10 +89,14 @@ class DashObject(abc.ABC):
             string of the view name.
 
         """
-        n: str = cls._convert_pascal_to_kebab_case(cls.__name__)
-        if subname is not None:
-            n += f"-{subname}"
-        return n
+        names = cls._name_cache
+        try:
+            return names[subname]
+        except KeyError:
+            n: str = f"{cls._kebab_name}-{subname}"
+            if len(names) < cls._name_cache_maxsize:
+                names[subname] = n
+            return n
 
     @classmethod
     def error_container(cls, message: str) -> html.Div:
@@ -55,6 +109,8 @@ class DashObject(abc.ABC):
             `dash.html.Div` container.
 
         """
+        import dash_mantine_components as dmc
+
         return dmc.Container(
             dmc.Code(
                 message,
@@ -64,6 +120,20 @@ class DashObject(abc.ABC):
             )
         )
 
+    @classmethod
+    def busy_container(cls) -> html.Div:
+        """Generate the cheap layout served when a render is shed under load.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        import dash_mantine_components as dmc
+
+        return dmc.Container(
+            dmc.Text("This content is busy. Please try again shortly.", c="dimmed")
+        )
+
     @classmethod
     @abc.abstractmethod
     def valid_layout(cls, **kwargs):
@@ -78,6 +148,250 @@ class DashObject(abc.ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def _cache_lookup(
+        cls,
+        cache: LayoutCache | SharedLayoutStore | BackendCache | None,
+        args: tuple,
+        kwargs: dict,
+    ) -> tuple[typing.Hashable | None, typing.Any]:
+        """Look up a `layout` call in a cache.
+
+        Args:
+            cache: the cache to search, or `None` if caching is disabled.
+            args: positional arguments for `valid_layout`.
+            kwargs: keyword arguments for `valid_layout`.
+
+        Returns:
+            tuple of the cache key (`None` if uncacheable) and the cached value or
+            `MISSING`.
+
+        """
+        key = None if cache is None else cache.make_key(cls, args, kwargs)
+        if key is None:
+            return None, MISSING
+        return key, cache.get(key)
+
+    @classmethod
+    def _run_coroutine(cls, coroutine: typing.Coroutine) -> typing.Any:
+        """Run an async `valid_layout` to completion from synchronous code.
+
+        Args:
+            coroutine: coroutine returned by `valid_layout`.
+
+        Raises:
+            `RuntimeError`: if called from inside a running event loop.
+
+        Returns:
+            the rendered layout.
+
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        coroutine.close()
+        raise RuntimeError(
+            f"{cls.__name__}.valid_layout is async and an event loop is running; "
+            f"use `await {cls.__name__}.alayout(...)` instead."
+        )
+
+    @classmethod
+    def _call_valid_layout(cls, args: tuple, kwargs: dict) -> typing.Any:
+        """Call `valid_layout`, running async implementations to completion.
+
+        Args:
+            args: positional arguments for `valid_layout`.
+            kwargs: keyword arguments for `valid_layout`.
+
+        Returns:
+            the rendered layout.
+
+        """
+        rendered = cls.valid_layout(*args, **kwargs)
+        if inspect.isawaitable(rendered):
+            rendered = cls._run_coroutine(rendered)
+        return rendered
+
+    @classmethod
+    def _call_with_budget(
+        cls, args: tuple, kwargs: dict, release: typing.Callable[[], None] | None
+    ) -> typing.Any:
+        """Call `valid_layout` within `render_timeout`.
+
+        With a timeout the render runs on the shared render pool, and the
+        admission slot is only released once it actually finishes, so hung
+        renders keep counting against `admission`. Inside a pool worker, e.g. a
+        child of `render_parallel`, the render runs inline so nested renders
+        cannot exhaust the pool; the caller waiting on that worker enforces the
+        deadline, and a render that completes is always returned.
+
+        Args:
+            args: positional arguments for `valid_layout`.
+            kwargs: keyword arguments for `valid_layout`.
+            release: callback freeing the admission slot, if one was reserved.
+
+        Raises:
+            `TimeoutError`: if the render exceeds `render_timeout`.
+
+        Returns:
+            the rendered layout.
+
+        """
+        timeout = cls.render_timeout
+        if timeout is None or in_render_worker():
+            try:
+                return cls._call_valid_layout(args, kwargs)
+            finally:
+                if release is not None:
+                    release()
+        future = render_pool().submit(
+            contextvars.copy_context().run, cls._call_valid_layout, args, kwargs
+        )
+        if release is not None:
+            future.add_done_callback(lambda _: release())
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(
+                f"{cls.__name__}.valid_layout did not finish within {timeout}s."
+            ) from None
+
+    @classmethod
+    def _build(cls, args: tuple, kwargs: dict) -> tuple[typing.Any, bool, bool]:
+        """Render the layout through the cache, error policy and admission control.
+
+        Args:
+            args: positional arguments for `valid_layout`.
+            kwargs: keyword arguments for `valid_layout`.
+
+        Returns:
+            tuple of the layout, whether it rendered successfully and whether it
+            was served from the layout cache.
+
+        """
+        key, cached = cls._cache_lookup(cls.layout_cache, args, kwargs)
+        if cached is not MISSING:
+            return cached, True, True
+        policy = cls.error_policy
+        if not policy.allow(cls):
+            return policy.fallback(cls), False, False
+        limiter = cls.admission
+        if limiter is not None and not limiter.acquire():
+            return limiter.busy(cls), False, False
+        release = None if limiter is None else limiter.release
+        try:
+            rendered = cls._call_with_budget(args, kwargs, release)
+        except Exception as exc:
+            return policy.handle(cls, exc), False, False
+        policy.record_success(cls)
+        if key is not None:
+            stored = cls.layout_cache.set(key, rendered)
+            rendered = rendered if stored is None else stored
+        return rendered, True, False
+
+    @classmethod
+    async def _abuild(cls, args: tuple, kwargs: dict) -> tuple[typing.Any, bool, bool]:
+        """Render the layout through the layout cache without blocking the loop.
+
+        Async `valid_layout` implementations are awaited, synchronous ones run on
+        the shared render pool. The admission slot of a synchronous render is
+        released when the render finishes, even after `render_timeout` expired.
+
+        Args:
+            args: positional arguments for `valid_layout`.
+            kwargs: keyword arguments for `valid_layout`.
+
+        Returns:
+            tuple of the layout, whether it rendered successfully and whether it
+            was served from the layout cache.
+
+        """
+        key, cached = cls._cache_lookup(cls.layout_cache, args, kwargs)
+        if cached is not MISSING:
+            return cached, True, True
+        policy = cls.error_policy
+        if not policy.allow(cls):
+            return policy.fallback(cls), False, False
+        limiter = cls.admission
+        if limiter is not None and not await limiter.acquire_async():
+            return limiter.busy(cls), False, False
+        release = None if limiter is None else limiter.release
+        try:
+            if inspect.iscoroutinefunction(cls.valid_layout):
+                call = cls.valid_layout(*args, **kwargs)
+            else:
+                future = render_pool().submit(
+                    contextvars.copy_context().run,
+                    cls._call_valid_layout,
+                    args,
+                    kwargs,
+                )
+                if release is not None:
+                    # The worker keeps running after a timeout; free its slot
+                    # only when it is done.
+                    future.add_done_callback(lambda _: limiter.release())
+                    release = None
+                call = asyncio.wrap_future(future)
+            rendered = await asyncio.wait_for(call, cls.render_timeout)
+        except asyncio.TimeoutError:
+            exc = TimeoutError(
+                f"{cls.__name__}.valid_layout did not finish within "
+                f"{cls.render_timeout}s."
+            )
+            return policy.handle(cls, exc), False, False
+        except Exception as exc:
+            return policy.handle(cls, exc), False, False
+        finally:
+            if release is not None:
+                release()
+        policy.record_success(cls)
+        if key is not None:
+            stored = cls.layout_cache.set(key, rendered)
+            rendered = rendered if stored is None else stored
+        return rendered, True, False
+
+    @classmethod
+    def _render(cls, args: tuple, kwargs: dict) -> tuple[typing.Any, bool]:
+        """Render the layout, recording it in `render_metrics` when enabled.
+
+        Args:
+            args: positional arguments for `valid_layout`.
+            kwargs: keyword arguments for `valid_layout`.
+
+        Returns:
+            tuple of the layout and whether it rendered successfully.
+
+        """
+        metrics = cls.render_metrics
+        if not metrics.enabled:
+            return cls._build(args, kwargs)[:2]
+        start = time.perf_counter()
+        rendered, ok, cached = cls._build(args, kwargs)
+        metrics.record(cls.name(), time.perf_counter() - start, ok, rendered, cached)
+        return rendered, ok
+
+    @classmethod
+    async def _arender(cls, args: tuple, kwargs: dict) -> tuple[typing.Any, bool]:
+        """Render the layout asynchronously, recording it in `render_metrics`.
+
+        Args:
+            args: positional arguments for `valid_layout`.
+            kwargs: keyword arguments for `valid_layout`.
+
+        Returns:
+            tuple of the layout and whether it rendered successfully.
+
+        """
+        metrics = cls.render_metrics
+        if not metrics.enabled:
+            return (await cls._abuild(args, kwargs))[:2]
+        start = time.perf_counter()
+        rendered, ok, cached = await cls._abuild(args, kwargs)
+        metrics.record(cls.name(), time.perf_counter() - start, ok, rendered, cached)
+        return rendered, ok
+
     @classmethod
     def layout(cls, *args, **kwargs):
         """Generate the page layout.
@@ -90,7 +404,125 @@ class DashObject(abc.ABC):
             `dash.html.Div` container.
 
         """
-        try:
-            return cls.valid_layout(*args, **kwargs)
-        except Exception:
-            return cls.error_container(traceback.format_exc())
+        return cls._render(args, kwargs)[0]
+
+    @classmethod
+    async def alayout(cls, *args, **kwargs):
+        """Generate the page layout from inside an event loop.
+
+        Supports both `async def valid_layout` and synchronous implementations.
+
+        Args:
+            *args: additional positional arguments.
+            **kwargs: additional keyword arguments.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        return (await cls._arender(args, kwargs))[0]
+
+    @classmethod
+    def snapshot(cls, *args, **kwargs) -> LayoutSnapshot:
+        """Generate the layout pre-serialized as JSON bytes.
+
+        Page `layout` functions can return the snapshot in place of the
+        component tree. Snapshots of failed renders are never cached.
+
+        Args:
+            *args: additional positional arguments.
+            **kwargs: additional keyword arguments.
+
+        Returns:
+            `LayoutSnapshot` of the layout.
+
+        """
+        key, cached = cls._cache_lookup(cls.snapshot_cache, args, kwargs)
+        if cached is not MISSING:
+            return cached
+        rendered, ok = cls._render(args, kwargs)
+        snapshot = (
+            rendered
+            if isinstance(rendered, LayoutSnapshot)
+            else LayoutSnapshot.from_layout(rendered)
+        )
+        if ok and key is not None:
+            cls.snapshot_cache.set(key, snapshot)
+        return snapshot
+
+    @classmethod
+    def render_children(
+        cls, specs: typing.Iterable[tuple], timeout: float | None = None
+    ) -> list[typing.Any]:
+        """Render synchronous child layouts in parallel on the shared render pool.
+
+        Shorthand for `compose.render_parallel`, for use in `valid_layout`.
+
+        # Example
+        ```python
+        class App(DashPage):
+            @classmethod
+            def valid_layout(cls, **kwargs):
+                header, sidebar = cls.render_children(
+                    [(HeaderView, "header"), (SidebarView, "sidebar")], timeout=2
+                )
+                return dmc.AppShell([header, sidebar])
+        ```
+
+        Args:
+            specs: `(ViewClass, id)` or `(ViewClass, id, kwargs)` specifications.
+            timeout: seconds each child may take, `None` to wait.
+
+        Returns:
+            list of rendered layouts in the order of `specs`, with the
+            `error_container` of any child that failed or timed out.
+
+        """
+        from .compose import render_parallel
+
+        return render_parallel(specs, timeout)
+
+    @classmethod
+    def skeleton(cls) -> typing.Any:
+        """Generate the static structure of the layout, with `Hole` markers.
+
+        Override together with `valid_layout` returning `cls.template().fill(...)`
+        or `cls.template().snapshot(...)`.
+
+        Raises:
+            `NotImplementedError`: if the class does not define a skeleton.
+
+        """
+        raise NotImplementedError(f"{cls.__name__} does not define a skeleton.")
+
+    @classmethod
+    def template(cls) -> LayoutTemplate:
+        """Return the `LayoutTemplate` of `skeleton`, compiled once per class.
+
+        Returns:
+            the compiled template.
+
+        """
+        template = cls.__dict__.get("_template")
+        if template is None:
+            template = LayoutTemplate(cls.skeleton())
+            cls._template = template
+        return template
+
+    @classmethod
+    def invalidate_layout_cache(cls) -> int:
+        """Remove this class' layouts from its `layout_cache` and `snapshot_cache`.
+
+        Returns:
+            number of cached layouts removed.
+
+        """
+        caches = {
+            id(cache): cache
+            for cache in (cls.layout_cache, cls.snapshot_cache)
+            if cache is not None
+        }
+        return sum(cache.invalidate(cls) for cache in caches.values())
+
+
+DashObject._reset_name_cache()
@@ -0,0 +1,57 @@
+"""Module containing the shared, bounded thread pool used to render layouts."""
+
+import concurrent.futures
+import os
+import threading
+
+__all__ = ["configure_render_pool", "in_render_worker", "render_pool"]
+
+DEFAULT_POOL_SIZE: int = min(32, (os.cpu_count() or 1) + 4)
+"""Default number of worker threads in the shared render pool."""
+
+_pool: concurrent.futures.ThreadPoolExecutor | None = None
+_pool_size: int = DEFAULT_POOL_SIZE
+_pool_lock = threading.Lock()
+_worker = threading.local()
+
+
+def _mark_worker() -> None:
+    """Flag the current thread as a render pool worker."""
+    _worker.active = True
+
+
+def render_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared render pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_pool_size,
+                thread_name_prefix="dash-builder-render",
+                initializer=_mark_worker,
+            )
+        return _pool
+
+
+def configure_render_pool(max_workers: int) -> None:
+    """Set the size of the shared render pool.
+
+    Call once while configuring the app. An existing pool finishes its queued
+    renders in the background and is replaced.
+
+    Args:
+        max_workers: maximum number of concurrent renders.
+
+    """
+    global _pool, _pool_size
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    with _pool_lock:
+        old, _pool, _pool_size = _pool, None, max_workers
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def in_render_worker() -> bool:
+    """Check whether the current thread is a render pool worker."""
+    return getattr(_worker, "active", False)
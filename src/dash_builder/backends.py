@@ -0,0 +1,796 @@
+"""Module containing pluggable cache backends shared across processes and hosts."""
+
+import abc
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import socket
+import struct
+import tempfile
+import threading
+import time
+import typing
+from collections import OrderedDict
+from pathlib import Path
+
+from .cache import MISSING, content_key, qualified_name
+from .errors import logger
+from .snapshot import LayoutSnapshot
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+__all__ = [
+    "BackendCache",
+    "CacheBackend",
+    "CacheBackendError",
+    "FileSystemBackend",
+    "MemoryBackend",
+    "RedisBackend",
+]
+
+
+class CacheBackendError(RuntimeError):
+    """Raised when a cache backend cannot serve a command."""
+
+
+class CacheBackend(abc.ABC):
+    """Byte store with expiry and tag-based invalidation."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key.
+
+        Args:
+            key: entry key.
+
+        Returns:
+            the stored bytes, or `None` if missing or expired.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: typing.Iterable[str] = (),
+    ) -> None:
+        """Store a value.
+
+        Args:
+            key: entry key.
+            value: bytes to store.
+            ttl: seconds after which the entry expires, `None` to never expire.
+            tags: tags the entry can be invalidated by.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove an entry.
+
+        Args:
+            key: entry key.
+
+        Returns:
+            `True` if an entry was removed.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate_tags(self, tags: typing.Iterable[str]) -> int:
+        """Remove every entry carrying any of the tags.
+
+        Args:
+            tags: tags to invalidate.
+
+        Returns:
+            number of entries removed.
+
+        """
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU backend, mainly for tests and single-process apps."""
+
+    def __init__(
+        self,
+        maxsize: int | None = 1024,
+        timer: typing.Callable[[], float] = time.monotonic,
+    ):
+        """Create an in-memory backend.
+
+        Args:
+            maxsize: maximum number of entries, `None` for unbounded.
+            timer: monotonic clock used for expiry.
+
+        """
+        self.maxsize: int | None = maxsize
+        """Maximum number of entries."""
+        self._timer = timer
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, tuple[float, bytes, frozenset[str]]] = (
+            OrderedDict()
+        )
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of entries, including unevicted expired ones."""
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < self._timer():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: typing.Iterable[str] = (),
+    ) -> None:
+        """Store a value, evicting the least recently used entries."""
+        expires = float("inf") if ttl is None else self._timer() + ttl
+        tags = frozenset(tags)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry."""
+        with self._lock:
+            return self._remove(key)
+
+    def invalidate_tags(self, tags: typing.Iterable[str]) -> int:
+        """Remove every entry carrying any of the tags."""
+        with self._lock:
+            keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+            return sum(self._remove(key) for key in keys)
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and its tag memberships."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[2]:
+            members = self._tags.get(tag)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._tags[tag]
+        return True
+
+
+def _digest(value: str) -> str:
+    """Return a file-name safe digest of a key or tag."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class FileSystemBackend(CacheBackend):
+    """Backend storing one file per entry, shared by processes on a host.
+
+    Entries are written to a temporary file and renamed into place, so readers
+    never see partial values. Each entry file records its tags, and tags are
+    directories of empty marker files named after the entries they contain.
+    Entries and their markers are only changed under a lock shared by the
+    processes of the host, so an entry is never left without its markers. Once
+    `max_entries` is exceeded, the least recently written entries are evicted,
+    together with temporary files abandoned by crashed writers.
+    """
+
+    _HEADER = struct.Struct("<dI")
+    """Expiry timestamp and byte length of the JSON list of tags."""
+
+    PRUNE_INTERVAL: int = 64
+    """Number of writes by this process between checks of `max_entries`."""
+    TEMPORARY_MAX_AGE: float = 600.0
+    """Seconds after which `prune` removes a leftover temporary file."""
+
+    def __init__(self, directory: str | Path, max_entries: int | None = 10_000):
+        """Create a filesystem backend.
+
+        Args:
+            directory: cache directory, created if missing.
+            max_entries: number of entries above which the oldest are evicted,
+                `None` for unbounded.
+
+        """
+        self.directory: Path = Path(directory)
+        """Cache directory."""
+        self.max_entries: int | None = max_entries
+        """Number of entries above which the oldest are evicted."""
+        self._entries = self.directory / "entries"
+        self._tags = self.directory / "tags"
+        self._entries.mkdir(parents=True, exist_ok=True)
+        self._tags.mkdir(parents=True, exist_ok=True)
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._entries_lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _locked(self) -> typing.Iterator[None]:
+        """Serialize changes to entries and markers across threads and processes."""
+        with self._entries_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.directory / "lock", "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self, path: Path) -> tuple[float, list[str], bytes] | None:
+        """Read an entry file, returning `None` if it is missing or corrupted."""
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            expires, size = self._HEADER.unpack_from(data)
+            start = self._HEADER.size
+            tags = json.loads(data[start : start + size])
+        except (struct.error, ValueError):
+            # Truncated entry, e.g. by a full disk: drop it and report a miss.
+            path.unlink(missing_ok=True)
+            return None
+        return expires, tags, data[start + size :]
+
+    def _stored_tags(self, path: Path) -> list[str]:
+        """Read the tags recorded in an entry file's header."""
+        try:
+            with open(path, "rb") as file:
+                header = file.read(self._HEADER.size)
+                _, size = self._HEADER.unpack(header)
+                return json.loads(file.read(size))
+        except (OSError, struct.error, ValueError):
+            return []
+
+    def _remove(self, name: str, tags: typing.Iterable[str] | None = None) -> bool:
+        """Remove an entry file and the markers of its tags; call with the lock."""
+        path = self._entries / name
+        if tags is None:
+            tags = self._stored_tags(path)
+        try:
+            path.unlink()
+            removed = True
+        except FileNotFoundError:
+            removed = False
+        for tag in tags:
+            (self._tags / _digest(tag) / name).unlink(missing_ok=True)
+        return removed
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key."""
+        name = _digest(key)
+        entry = self._read(self._entries / name)
+        if entry is None:
+            return None
+        expires, tags, value = entry
+        if expires < time.time():
+            with self._locked():
+                self._remove(name, tags)
+            return None
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: typing.Iterable[str] = (),
+    ) -> None:
+        """Store a value with an atomic rename, then record its tags."""
+        name = _digest(key)
+        path = self._entries / name
+        tags = list(dict.fromkeys(tags))
+        expires = float("inf") if ttl is None else time.time() + ttl
+        encoded = json.dumps(tags).encode("utf-8")
+        descriptor, temporary = tempfile.mkstemp(dir=self._entries, prefix=".")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(self._HEADER.pack(expires, len(encoded)))
+                file.write(encoded)
+                file.write(value)
+            # The rename and the markers are one step for invalidations, which
+            # would otherwise miss an entry whose markers are not written yet.
+            with self._locked():
+                previous = self._stored_tags(path)
+                os.replace(temporary, path)
+                for tag in tags:
+                    directory = self._tags / _digest(tag)
+                    directory.mkdir(exist_ok=True)
+                    (directory / name).touch()
+                for tag in set(previous) - set(tags):
+                    (self._tags / _digest(tag) / name).unlink(missing_ok=True)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.PRUNE_INTERVAL == 0
+        if prune:
+            self.prune()
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry."""
+        with self._locked():
+            return self._remove(_digest(key))
+
+    def invalidate_tags(self, tags: typing.Iterable[str]) -> int:
+        """Remove every entry carrying any of the tags."""
+        removed = 0
+        with self._locked():
+            for tag in tags:
+                directory = self._tags / _digest(tag)
+                if not directory.is_dir():
+                    continue
+                for marker in os.scandir(directory):
+                    removed += self._remove(marker.name)
+                shutil.rmtree(directory, ignore_errors=True)
+        return removed
+
+    def prune(self) -> int:
+        """Evict the least recently written entries beyond `max_entries`.
+
+        Temporary files older than `TEMPORARY_MAX_AGE`, left behind by writers
+        that crashed, are removed as well.
+
+        Returns:
+            number of entries removed.
+
+        """
+        entries = []
+        abandoned = time.time() - self.TEMPORARY_MAX_AGE
+        with os.scandir(self._entries) as scan:
+            for entry in scan:
+                if not entry.name.startswith("."):
+                    entries.append(entry)
+                    continue
+                with contextlib.suppress(FileNotFoundError):
+                    if entry.stat().st_mtime < abandoned:
+                        os.unlink(entry.path)
+        if self.max_entries is None or len(entries) <= self.max_entries:
+            return 0
+        written = []
+        for entry in entries:
+            try:
+                written.append((entry.stat().st_mtime_ns, entry.name))
+            except FileNotFoundError:
+                continue
+        written.sort()
+        excess = len(entries) - self.max_entries
+        with self._locked():
+            return sum(self._remove(name) for _, name in written[:excess])
+
+
+class _RespConnection:
+    """Minimal blocking client for the Redis serialization protocol (RESP2)."""
+
+    def __init__(self, host: str, port: int, db: int, timeout: float | None):
+        self.address = (host, port)
+        self.db = db
+        self.timeout = timeout
+        self._socket: socket.socket | None = None
+        self._reader: typing.BinaryIO | None = None
+
+    def _connect(self) -> None:
+        """Open the socket and select the database."""
+        self._socket = socket.create_connection(self.address, timeout=self.timeout)
+        self._reader = self._socket.makefile("rb")
+        if self.db:
+            self._send([("SELECT", self.db)])
+            self._read()
+
+    def close(self) -> None:
+        """Close the socket."""
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+        self._socket = self._reader = None
+
+    def execute(self, *commands: tuple) -> list[typing.Any]:
+        """Send pipelined commands and return their replies, reconnecting once.
+
+        Args:
+            commands: tuples of command name and arguments.
+
+        Returns:
+            list with one reply per command.
+
+        """
+        try:
+            return self._round_trip(commands)
+        except OSError:
+            # The server may have dropped an idle connection: retry once.
+            self.close()
+        try:
+            return self._round_trip(commands)
+        except OSError:
+            self.close()
+            raise
+
+    def _round_trip(self, commands: tuple[tuple, ...]) -> list[typing.Any]:
+        """Send commands and read every reply before raising any server error."""
+        if self._socket is None:
+            self._connect()
+        self._send(commands)
+        replies = []
+        error = None
+        for _ in commands:
+            try:
+                replies.append(self._read())
+            except CacheBackendError as exc:
+                error = error or exc
+                replies.append(None)
+        if error is not None:
+            raise error
+        return replies
+
+    def _send(self, commands: typing.Iterable[tuple]) -> None:
+        """Encode commands as RESP arrays of bulk strings and send them."""
+        chunks = []
+        for command in commands:
+            chunks.append(b"*%d\r\n" % len(command))
+            for argument in command:
+                if not isinstance(argument, bytes):
+                    argument = str(argument).encode("utf-8")
+                chunks.append(b"$%d\r\n%s\r\n" % (len(argument), argument))
+        self._socket.sendall(b"".join(chunks))
+
+    def _read(self) -> typing.Any:
+        """Read and decode one reply.
+
+        Raises:
+            `CacheBackendError`: if the server replied with an error or a
+                malformed reply.
+
+        """
+        try:
+            return self._decode()
+        except ValueError as exc:
+            raise CacheBackendError(f"Malformed reply: {exc}") from exc
+
+    def _decode(self) -> typing.Any:
+        """Read and decode one reply, raising `ValueError` if it is malformed."""
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the cache server.")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            raise CacheBackendError(payload.decode("utf-8"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            return None if length < 0 else [self._decode() for _ in range(length)]
+        raise CacheBackendError(f"Unexpected reply {line!r}.")
+
+
+class RedisBackend(CacheBackend):
+    """Backend for any server speaking the Redis protocol, shared across hosts.
+
+    Each tag is a set of the keys carrying it, so invalidating any number of tags
+    costs two round trips. Keys stored with a TTL go to a tag set that expires no
+    sooner than its longest-lived member, so sets of expired keys do not grow
+    forever; keys without one go to a separate set without expiry. Requires
+    Redis 7 or a compatible server for the `NX` and `GT` options of `PEXPIRE`.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        timeout: float | None = 1.0,
+    ):
+        """Create a Redis-protocol backend. The connection is opened lazily.
+
+        Args:
+            host: server host name.
+            port: server port.
+            db: database number.
+            timeout: socket timeout in seconds.
+
+        """
+        self._connection = _RespConnection(host, port, db, timeout)
+        self._lock = threading.Lock()
+
+    def execute(self, *commands: tuple) -> list[typing.Any]:
+        """Send pipelined commands to the server.
+
+        Args:
+            commands: tuples of command name and arguments.
+
+        Returns:
+            list with one reply per command.
+
+        """
+        with self._lock:
+            return self._connection.execute(*commands)
+
+    def close(self) -> None:
+        """Close the connection to the server."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key."""
+        return self.execute(("GET", key))[0]
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: typing.Iterable[str] = (),
+    ) -> None:
+        """Store a value and add it to the sets of its tags."""
+        if ttl is None:
+            self.execute(
+                ("SET", key, value),
+                *(("SADD", f"persistent-tag:{tag}", key) for tag in tags),
+            )
+            return
+        milliseconds = max(1, int(ttl * 1000))
+        commands = [("SET", key, value, "PX", milliseconds)]
+        for tag in tags:
+            # Expire a new set with its first key, then only ever extend it.
+            commands += [
+                ("SADD", f"tag:{tag}", key),
+                ("PEXPIRE", f"tag:{tag}", milliseconds, "NX"),
+                ("PEXPIRE", f"tag:{tag}", milliseconds, "GT"),
+            ]
+        self.execute(*commands)
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry."""
+        return bool(self.execute(("DEL", key))[0])
+
+    def invalidate_tags(self, tags: typing.Iterable[str]) -> int:
+        """Remove every entry carrying any of the tags."""
+        tag_keys = [
+            f"{prefix}:{tag}" for tag in tags for prefix in ("tag", "persistent-tag")
+        ]
+        if not tag_keys:
+            return 0
+        members = self.execute(*(("SMEMBERS", tag) for tag in tag_keys))
+        keys = {key for reply in members for key in reply or ()}
+        removed = 0
+        if keys:
+            removed = self.execute(("DEL", *keys))[0]
+        self.execute(("DEL", *tag_keys))
+        return removed
+
+
+class BackendCache:
+    """Layout and data cache stored in a `CacheBackend`.
+
+    The cache implements the `LayoutCache` interface, so it can be assigned to
+    `layout_cache` or `snapshot_cache`. Layouts are stored as serialized
+    `LayoutSnapshot`s, keyed by the module-qualified class name and a hash of the
+    JSON-serializable `layout` arguments, and tagged with that name and the
+    class' `cache_tags`, so same-named classes of different modules never share
+    entries. Backend failures are logged and treated as misses, so an unavailable
+    server degrades to rendering.
+
+    # Example
+    ```python
+    from dash_builder import DashView
+    from dash_builder.backends import BackendCache, RedisBackend
+
+    shared_cache = BackendCache(RedisBackend("cache.internal"), ttl=600)
+
+
+    class HeaderView(DashView):
+        layout_cache = shared_cache
+        cache_tags = ("navigation",)
+
+
+    shared_cache.invalidate_tags("navigation")
+    ```
+    """
+
+    def __init__(
+        self, backend: CacheBackend, ttl: float | None = None, namespace: str = "dash"
+    ):
+        """Create a cache on top of a backend.
+
+        Args:
+            backend: the storage backend.
+            ttl: seconds after which an entry expires, `None` to never expire.
+            namespace: prefix of every key and tag, to share a backend.
+
+        """
+        self.backend: CacheBackend = backend
+        """The storage backend."""
+        self.ttl: float | None = ttl
+        """Time-to-live of cached entries in seconds."""
+        self.namespace: str = namespace
+        """Prefix of every key and tag."""
+        self.hits: int = 0
+        """Number of lookups served from the backend by this process."""
+        self.misses: int = 0
+        """Number of lookups by this process that required a render."""
+
+    def _tag(self, tag: str) -> str:
+        """Return the namespaced name of a tag."""
+        return f"{self.namespace}:{tag}"
+
+    def make_key(self, cls: type, args: tuple, kwargs: dict) -> tuple | None:
+        """Build the cache key for a `layout` call.
+
+        Args:
+            cls: the `DashObject` subclass being rendered.
+            args: positional arguments passed to `layout`.
+            kwargs: keyword arguments passed to `layout`.
+
+        Returns:
+            tuple of the class and backend key, or `None` if the arguments are not
+            JSON data.
+
+        """
+        key = content_key(cls, args, kwargs)
+        return None if key is None else (cls, f"{self.namespace}:layout:{key}")
+
+    def get(self, key: tuple) -> LayoutSnapshot | typing.Any:
+        """Look up a layout and record a hit or miss.
+
+        Args:
+            key: key produced by `make_key`.
+
+        Returns:
+            the cached `LayoutSnapshot`, or `MISSING`.
+
+        """
+        data = self._call(self.backend.get, key[1])
+        if data is None:
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        return LayoutSnapshot(data)
+
+    def set(self, key: tuple, value: typing.Any) -> LayoutSnapshot | typing.Any:
+        """Store a layout, tagged with its qualified class name and `cache_tags`.
+
+        Args:
+            key: key produced by `make_key`.
+            value: `LayoutSnapshot` or rendered layout, serialized if needed.
+
+        Returns:
+            the stored `LayoutSnapshot`, to be served in place of the layout, or
+            `value` if it could not be serialized.
+
+        """
+        cls, backend_key = key
+        tags = ("*", qualified_name(cls), *cls.cache_tags)
+
+        snapshot = value
+        if not isinstance(snapshot, LayoutSnapshot):
+            snapshot = self._call(LayoutSnapshot.from_layout, value)
+            if snapshot is None:
+                return value
+        self._call(
+            self.backend.set,
+            backend_key,
+            snapshot.data,
+            self.ttl,
+            [self._tag(tag) for tag in tags],
+        )
+        return snapshot
+
+    def invalidate(self, cls: type | None = None) -> int:
+        """Remove cached layouts.
+
+        Args:
+            cls: only remove layouts rendered by this class, or all if `None`.
+
+        Returns:
+            number of entries removed.
+
+        """
+        return self.invalidate_tags("*" if cls is None else qualified_name(cls))
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Remove every entry carrying any of the tags.
+
+        Args:
+            tags: module-qualified class names, `cache_tags` or data tags.
+
+        Returns:
+            number of entries removed.
+
+        """
+        removed = self._call(
+            self.backend.invalidate_tags, [self._tag(tag) for tag in tags]
+        )
+        return removed or 0
+
+    def data(
+        self,
+        name: str,
+        compute: typing.Callable[[], typing.Any],
+        tags: typing.Iterable[str] = (),
+    ) -> typing.Any:
+        """Return cached JSON data, computing and storing it on a miss.
+
+        Args:
+            name: unique name of the data.
+            compute: zero-argument callable producing JSON-serializable data.
+            tags: tags the data can be invalidated by.
+
+        Returns:
+            the cached or computed data.
+
+        """
+        key = f"{self.namespace}:data:{name}"
+        cached = self._call(self.backend.get, key)
+        if cached is not None:
+            try:
+                value = json.loads(cached)
+            except ValueError:
+                logger.warning("Cache entry %s is corrupted, recomputing.", key)
+            else:
+                self.hits += 1
+                return value
+        self.misses += 1
+        value = compute()
+        self._call(
+            lambda: self.backend.set(
+                key,
+                json.dumps(value).encode("utf-8"),
+                self.ttl,
+                [self._tag(tag) for tag in ("*", *tags)],
+            )
+        )
+        return value
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters of this process."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _call(self, method: typing.Callable, *args: typing.Any) -> typing.Any:
+        """Call a backend method, logging failures instead of raising.
+
+        Any exception, including corrupted entries and values that cannot be
+        serialized, is treated as a miss so that caching never breaks rendering.
+        """
+        try:
+            return method(*args)
+        except Exception as exc:
+            logger.warning(
+                "Cache backend %s failed: %s", type(self.backend).__name__, exc
+            )
+            return None
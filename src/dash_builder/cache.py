@@ -0,0 +1,218 @@
+"""Module containing the opt-in layout cache for `DashObject` classes."""
+
+import hashlib
+import json
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+__all__ = ["LayoutCache", "MISSING", "content_key", "qualified_name"]
+
+MISSING: typing.Final = object()
+"""Sentinel returned by `LayoutCache.get` when no usable entry exists."""
+
+
+def _key_order(key: typing.Any) -> tuple[str, str]:
+    """Sort key of a dictionary key, defined for keys of any type."""
+    return (f"{type(key).__module__}.{type(key).__qualname__}", repr(key))
+
+
+def _freeze(value: typing.Any) -> typing.Hashable:
+    """Convert a layout argument into a hashable, order-independent value.
+
+    Dictionary items are ordered by the type and representation of their keys,
+    so keys of mixed types never need to be compared. Containers are tagged with
+    their kind, so e.g. a list and a tuple of the same items differ.
+
+    Args:
+        value: positional or keyword argument passed to `layout`.
+
+    Returns:
+        hashable equivalent of `value`.
+
+    """
+    if isinstance(value, dict):
+        items = sorted(value.items(), key=lambda item: _key_order(item[0]))
+        return ("dict", tuple((k, _freeze(v)) for k, v in items))
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(v) for v in value))
+    if isinstance(value, tuple):
+        return ("tuple", tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_freeze(v) for v in value))
+    return value
+
+
+def qualified_name(cls: type) -> str:
+    """Return the module-qualified name of a class.
+
+    Unlike `DashObject.name`, it differs between classes of the same name
+    defined in different modules, so shared caches key entries by it.
+
+    Args:
+        cls: the class.
+
+    Returns:
+        `<module>.<qualname>` of the class.
+
+    """
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def content_key(cls: type, args: tuple, kwargs: dict) -> str | None:
+    """Build a process-independent key for a `layout` call.
+
+    Args:
+        cls: the `DashObject` subclass being rendered.
+        args: positional arguments passed to `layout`.
+        kwargs: keyword arguments passed to `layout`.
+
+    Returns:
+        `<module>.<qualname>/<hash>` key, or `None` if the arguments are not
+        JSON data.
+
+    """
+    try:
+        arguments = json.dumps([args, kwargs], sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.sha256(arguments.encode("utf-8")).hexdigest()[:32]
+    return f"{qualified_name(cls)}/{digest}"
+
+
+class LayoutCache:
+    """Thread-safe LRU cache of rendered layouts with optional TTL expiry.
+
+    Assign an instance to `DashObject.layout_cache` to opt a class in.
+    Cached component trees are shared between callers and must be treated as
+    read-only.
+
+    # Example
+    ```python
+    from dash_builder import DashPage
+    from dash_builder.cache import LayoutCache
+
+
+    class ReportPage(DashPage):
+        layout_cache = LayoutCache(maxsize=64, ttl=300)
+    ```
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+        timer: typing.Callable[[], float] = time.monotonic,
+    ):
+        """Create a layout cache.
+
+        Args:
+            maxsize: maximum number of entries, `None` for unbounded.
+            ttl: seconds after which an entry expires, `None` to never expire.
+            timer: monotonic clock used for expiry.
+
+        """
+        self.maxsize: int | None = maxsize
+        """Maximum number of cached layouts."""
+        self.ttl: float | None = ttl
+        """Time-to-live of cached layouts in seconds."""
+        self._timer = timer
+        self._entries: OrderedDict[typing.Hashable, tuple[float, typing.Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+        self.hits: int = 0
+        """Number of lookups served from the cache."""
+        self.misses: int = 0
+        """Number of lookups that required a render."""
+
+    def __len__(self) -> int:
+        """Return the number of cached layouts, including unevicted expired ones."""
+        return len(self._entries)
+
+    def make_key(self, cls: type, args: tuple, kwargs: dict) -> typing.Hashable | None:
+        """Build the cache key for a `layout` call.
+
+        Args:
+            cls: the `DashObject` subclass being rendered.
+            args: positional arguments passed to `layout`.
+            kwargs: keyword arguments passed to `layout`.
+
+        Returns:
+            hashable key, or `None` if the arguments cannot be hashed.
+
+        """
+        key = (cls, _freeze(args), _freeze(kwargs))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: typing.Hashable) -> typing.Any:
+        """Look up a cached layout and record a hit or miss.
+
+        Args:
+            key: key produced by `make_key`.
+
+        Returns:
+            the cached layout, or `MISSING`.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires >= self._timer():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return MISSING
+
+    def set(self, key: typing.Hashable, value: typing.Any) -> typing.Any:
+        """Store a rendered layout, evicting the least recently used entries.
+
+        Args:
+            key: key produced by `make_key`.
+            value: rendered layout.
+
+        Returns:
+            the stored layout, which `layout` returns in place of `value`.
+
+        """
+        expires = float("inf") if self.ttl is None else self._timer() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, cls: type | None = None) -> int:
+        """Remove cached layouts.
+
+        Args:
+            cls: only remove layouts rendered by this class, or all if `None`.
+
+        Returns:
+            number of entries removed.
+
+        """
+        with self._lock:
+            if cls is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if key[0] is cls]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size of the cache."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self)}
@@ -0,0 +1,322 @@
+"""Module containing static analysis of a project's pages and views."""
+
+import ast
+import concurrent.futures
+import os
+import re
+import typing
+from collections import defaultdict
+from pathlib import Path
+
+from .index import PACKAGES, ProjectIndex
+
+__all__ = [
+    "ClassSummary",
+    "Finding",
+    "ModuleSummary",
+    "analyze_module",
+    "check_project",
+]
+
+PASCAL_TO_KEBAB_REGEX = re.compile(r"(?<!^)(?=[A-Z])")
+"""Same conversion as `DashObject.name`, without importing Dash."""
+
+ID_METHODS: frozenset[str] = frozenset({"id", "matched_id", "all_ids"})
+"""`DashView` methods building component IDs."""
+
+BASES: dict[str, str] = {
+    "DashPage": "page",
+    "DashView": "view",
+    "DataTableView": "view",
+    "DownsampledGraphView": "view",
+}
+"""Framework base classes and the kind of their subclasses."""
+
+PARALLEL_THRESHOLD: int = 32
+"""Number of modules from which parsing is spread over a process pool."""
+
+
+class ClassSummary(typing.NamedTuple):
+    """Class definition found in a module."""
+
+    name: str
+    """Class name."""
+    bases: tuple[str, ...]
+    """Names of the base classes."""
+    line: int
+    """Line of the definition."""
+    id_subnames: tuple[str | None, ...]
+    """Literal `subname`s of the `cls.id(...)` calls in the class body."""
+
+
+class ModuleSummary(typing.NamedTuple):
+    """Facts extracted from the syntax tree of a module."""
+
+    path: str
+    """Module path relative to the project."""
+    classes: tuple[ClassSummary, ...]
+    """Top-level class definitions."""
+    route: str | None
+    """URL path of the `register_page` call, inferred if not given."""
+    references: frozenset[str]
+    """Names and attributes referenced anywhere in the module."""
+    error: str | None = None
+    """Syntax error message, if the module could not be parsed."""
+
+
+class Finding(typing.NamedTuple):
+    """Problem reported by `check_project`."""
+
+    kind: str
+    """Category of the problem."""
+    message: str
+    """Human readable description."""
+    locations: tuple[str, ...]
+    """`module:line` locations involved."""
+
+
+def kebab_name(class_name: str, subname: str | None = None) -> str:
+    """Return the `DashObject.name` of a class without importing it.
+
+    Args:
+        class_name: class name.
+        subname: optional suffix.
+
+    Returns:
+        the kebab-case name.
+
+    """
+    name = PASCAL_TO_KEBAB_REGEX.sub("-", class_name).lower()
+    return name if subname is None else f"{name}-{subname}"
+
+
+def _base_name(node: ast.expr) -> str | None:
+    """Return the name of a base class expression."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _id_subname(call: ast.Call) -> str | None:
+    """Return the literal `subname` of a `cls.id(...)` call, if any."""
+    argument = call.args[1] if len(call.args) > 1 else None
+    for keyword in call.keywords:
+        if keyword.arg == "subname":
+            argument = keyword.value
+    if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+        return argument.value
+    return None
+
+
+def _infer_route(relative: str, package: str) -> str:
+    """Infer the URL path Dash gives a page registered without `path`."""
+    module = relative.removesuffix(".py").removeprefix(f"{package}/")
+    return "/" + module.replace("_", "-").lower()
+
+
+def _route(tree: ast.Module, relative: str) -> str | None:
+    """Return the URL path of a module's `register_page` call."""
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and _base_name(node.func) == "register_page"
+            and node.args
+            and isinstance(node.args[0], ast.Name)
+            and node.args[0].id == "__name__"
+        ):
+            for keyword in node.keywords:
+                if keyword.arg == "path" and isinstance(keyword.value, ast.Constant):
+                    return keyword.value.value
+            return _infer_route(relative, PACKAGES["page"])
+    return None
+
+
+def analyze_module(project: str, relative: str) -> ModuleSummary:
+    """Parse a module and extract its classes, route and references.
+
+    Args:
+        project: project directory.
+        relative: module path relative to the project.
+
+    Returns:
+        `ModuleSummary` of the module.
+
+    """
+    try:
+        source = Path(project, relative).read_bytes()
+        tree = ast.parse(source, filename=relative)
+    except (OSError, SyntaxError, ValueError) as exc:
+        return ModuleSummary(relative, (), None, frozenset(), error=str(exc))
+
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        subnames = tuple(
+            _id_subname(call)
+            for call in ast.walk(node)
+            if isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and call.func.attr in ID_METHODS
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id in {"cls", node.name}
+        )
+        bases = tuple(name for name in map(_base_name, node.bases) if name)
+        classes.append(ClassSummary(node.name, bases, node.lineno, subnames))
+
+    references = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            references.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            references.add(node.attr)
+        elif isinstance(node, ast.alias):
+            references.add(node.asname or node.name.split(".")[-1])
+    return ModuleSummary(
+        relative, tuple(classes), _route(tree, relative), frozenset(references)
+    )
+
+
+def _modules(project: Path) -> list[str]:
+    """List the page and view modules of a project, plus `app.py`."""
+    modules = sorted(ProjectIndex(project).refresh().modules)
+    if (project / "app.py").is_file():
+        modules.append("app.py")
+    return modules
+
+
+def _parse(project: Path, modules: list[str], workers: int | None) -> list:
+    """Parse modules, in a process pool when there are many of them."""
+    if workers == 1 or len(modules) < PARALLEL_THRESHOLD:
+        return [analyze_module(str(project), module) for module in modules]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(modules) // (workers * 4))
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        return list(
+            pool.map(
+                analyze_module,
+                [str(project)] * len(modules),
+                modules,
+                chunksize=chunksize,
+            )
+        )
+
+
+def _kinds(summaries: list[ModuleSummary]) -> dict[str, str]:
+    """Resolve which project classes are pages or views, following subclasses."""
+    bases = {
+        summary.path + ":" + cls.name: cls.bases
+        for summary in summaries
+        for cls in summary.classes
+    }
+    by_name = defaultdict(list)
+    for key in bases:
+        by_name[key.split(":")[1]].append(key)
+
+    kinds: dict[str, str] = {}
+    changed = True
+    while changed:
+        changed = False
+        for key, class_bases in bases.items():
+            if key in kinds:
+                continue
+            for base in class_bases:
+                kind = BASES.get(base) or next(
+                    (kinds[p] for p in by_name.get(base, ()) if p in kinds), None
+                )
+                if kind is not None:
+                    kinds[key] = kind
+                    changed = True
+                    break
+    return kinds
+
+
+def check_project(
+    project: Path, workers: int | None = None
+) -> tuple[list[ModuleSummary], list[Finding]]:
+    """Statically check the pages and views of a project without importing it.
+
+    Reports syntax errors, classes sharing a `name()`, component-ID types built
+    by more than one class, pages sharing a route and views that are neither
+    subclassed nor referenced by another module.
+
+    Args:
+        project: project directory containing `app.py`, `pages/` and `views/`.
+        workers: number of parser processes, `None` for one per CPU and `1` to
+            parse in this process.
+
+    Returns:
+        tuple of the module summaries and the findings.
+
+    """
+    summaries = _parse(project, _modules(project), workers)
+    kinds = _kinds(summaries)
+    findings = [
+        Finding("syntax-error", summary.error, (summary.path,))
+        for summary in summaries
+        if summary.error
+    ]
+
+    names = defaultdict(list)
+    id_types = defaultdict(set)
+    routes = defaultdict(list)
+    views = []
+    for summary in summaries:
+        if summary.route is not None and summary.path != "app.py":
+            routes[summary.route].append(summary.path)
+        for cls in summary.classes:
+            key = f"{summary.path}:{cls.name}"
+            location = f"{summary.path}:{cls.line}"
+            kind = kinds.get(key)
+            if kind is None or summary.path == "app.py":
+                continue
+            names[kebab_name(cls.name)].append((cls.name, location))
+            for subname in cls.id_subnames:
+                id_types[kebab_name(cls.name, subname)].add((cls.name, location))
+            if kind == "view":
+                views.append((cls.name, summary.path, location))
+
+    for name, classes in sorted(names.items()):
+        if len(classes) > 1:
+            findings.append(
+                Finding(
+                    "name-collision",
+                    f"{', '.join(cls for cls, _ in classes)} share the name '{name}'.",
+                    tuple(location for _, location in classes),
+                )
+            )
+    for id_type, classes in sorted(id_types.items()):
+        if len({cls for cls, _ in classes}) > 1:
+            classes = sorted(classes)
+            findings.append(
+                Finding(
+                    "duplicate-id-type",
+                    f"Component ID type '{id_type}' is built by "
+                    f"{', '.join(cls for cls, _ in classes)}.",
+                    tuple(location for _, location in classes),
+                )
+            )
+    for route, modules in sorted(routes.items()):
+        if len(modules) > 1:
+            findings.append(
+                Finding(
+                    "duplicate-route",
+                    f"Route '{route}' is registered by {len(modules)} pages.",
+                    tuple(modules),
+                )
+            )
+
+    subclassed = {
+        base for summary in summaries for cls in summary.classes for base in cls.bases
+    }
+    for name, path, location in views:
+        used = name in subclassed or any(
+            name in summary.references for summary in summaries if summary.path != path
+        )
+        if not used:
+            findings.append(
+                Finding("unused-view", f"{name} is never used.", (location,))
+            )
+    return summaries, findings
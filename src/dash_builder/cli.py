@@ -1,24 +1,86 @@
 """Module containing the main `typer` CLI for managing dash projects."""
 
+import os
 import pathlib
 import re
 import shutil
+import typing
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.markup import escape
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
 from typing_extensions import Annotated
 
+from .index import ProjectIndex, scan_directory
 from .templates import PageTemplate, ViewTemplate
+from .templates.object_template import ObjectTemplate
 
 app: typer.Typer = typer.Typer()
 """The `typer.Typer` application object."""
 
 
+def load_spec(path: Path) -> dict[str, list]:
+    """Load a scaffolding spec listing the views and pages to create.
+
+    TOML specs are always supported; YAML specs require `PyYAML`.
+
+    ```toml
+    views = ["Header", "Footer"]
+
+    [[pages]]
+    name = "Reports"
+    path = "/reports"
+    ```
+
+    Args:
+        path: `.toml`, `.yaml` or `.yml` spec file.
+
+    Raises:
+        `ValueError`: if the file type or its content is not supported.
+
+    Returns:
+        dictionary with `views` and `pages` lists of names or mappings with a
+        `name` and, for pages, an optional URL `path`.
+
+    """
+    if path.suffix == ".toml":
+        try:
+            import tomllib
+        except ModuleNotFoundError:  # Python < 3.11
+            import tomli as tomllib
+
+        spec = tomllib.loads(path.read_text())
+    elif path.suffix in {".yaml", ".yml"}:
+        try:
+            import yaml
+        except ModuleNotFoundError as exc:
+            raise ValueError("YAML specs require PyYAML to be installed.") from exc
+        try:
+            spec = yaml.safe_load(path.read_text()) or {}
+        except yaml.YAMLError as exc:
+            raise ValueError(f"Invalid YAML spec: {exc}") from exc
+    else:
+        raise ValueError(f"Unsupported spec file type '{path.suffix}'.")
+
+    if not isinstance(spec, dict):
+        raise ValueError("The spec must be a mapping with 'views' and 'pages'.")
+    result = {}
+    for kind in ("views", "pages"):
+        entries = spec.get(kind) or []
+        for entry in entries:
+            if not isinstance(entry, str) and not (
+                isinstance(entry, dict) and isinstance(entry.get("name"), str)
+            ):
+                raise ValueError(f"Invalid {kind[:-1]} entry {entry!r}.")
+        result[kind] = list(entries)
+    return result
+
+
 class Project:
     """Object to capture and process project initiation options and logic."""
 
@@ -40,6 +102,7 @@ class Project:
         """Project template."""
         self._location: str = location
         """Project destination directory."""
+        self._index: ProjectIndex | None = None
 
     @classmethod
     def detect(cls, location: str) -> "Project":
@@ -48,20 +111,23 @@ class Project:
             cwd: Path = Path(location)
         else:
             cwd = Path.cwd()
-        app = cwd / "app.py"
-        views = cwd / "views"
-        pages = cwd / "pages"
-        test = (
-            app.exists()
-            and views.exists()
-            and pages.exists()
-            and views.is_dir()
-            and pages.is_dir()
-        )
+        try:
+            with os.scandir(cwd) as entries:
+                found = {(entry.name, entry.is_dir()) for entry in entries}
+        except OSError:
+            found = set()
+        test = {("app.py", False), ("views", True), ("pages", True)} <= found
         if not test:
             raise ValueError("No app.py found in the current directory.")
         return cls(name=cwd.name, template="basic-mantine", location=cwd.parent)
 
+    @property
+    def index(self) -> ProjectIndex:
+        """Project index, refreshed on first access."""
+        if self._index is None:
+            self._index = ProjectIndex(self.project).refresh()
+        return self._index
+
     @property
     def template(self) -> Path:
         """Template directory."""
@@ -110,16 +176,10 @@ class Project:
 
     def walk_directory(self, directory: pathlib.Path, tree: Tree) -> None:
         """Recursively build a Tree with directory contents."""
-        # Sort dirs first then by filename
-        paths = sorted(
-            directory.iterdir(),
-            key=lambda path: (path.is_file(), path.name.lower()),
-        )
-        for path in paths:
-            # Remove hidden files
-            if path.name.startswith("."):
-                continue
-            if path.is_dir():
+        # Dirs first then by filename, without hidden and ignored entries
+        for entry in scan_directory(directory):
+            path = Path(entry.path)
+            if entry.is_dir():
                 style = "dim" if path.name.startswith("__") else ""
                 branch = tree.add(
                     f"[bold magenta]:open_file_folder: [link file://{path}]{escape(path.name)}",
@@ -151,83 +211,249 @@ class Project:
             return None
         with self.spinner(console=self.console, transient=True) as progress:
             progress.add_task("Creating project")
-            to_ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+            to_ignore = shutil.ignore_patterns("__pycache__", "*.pyc", ".dash-builder")
             output = shutil.copytree(
                 self.template, self.project, ignore=to_ignore, dirs_exist_ok=True
             )
+        ProjectIndex(self.project).refresh()
         self.print_completion()
         self.print_tree(output.absolute())
 
-    def create_new_view_module(self, template: ViewTemplate):
-        """Create a new view module."""
-        template.file_path.write_text(template.file_content)
+    def select_new_templates(
+        self, templates: list[ObjectTemplate]
+    ) -> list[ObjectTemplate]:
+        """Drop templates whose file exists or whose class or URL path is indexed."""
+        index = self.index
+        modules = set(index.modules)
+        class_names = index.class_names()
+        url_paths = index.url_paths()
+        selected = []
+        for template in templates:
+            kind = template._type
+            module = template.file_path.relative_to(self.project).as_posix()
+            url_path = getattr(template, "url_path", None)
+            if module in modules or template.file_path.exists():
+                error = f"{kind} '{template.file_name}' already exists."
+            elif template.class_name in class_names:
+                error = f"{kind} class '{template.class_name}' already exists."
+            elif url_path is not None and url_path in url_paths:
+                error = (
+                    f"URL path '{url_path}' is already used by {url_paths[url_path]}."
+                )
+            else:
+                selected.append(template)
+                modules.add(module)
+                class_names.add(template.class_name)
+                if url_path is not None:
+                    url_paths[url_path] = module
+                continue
+            self.console.print(f"[bold red]ERROR[/bold red] {escape(error)}")
+        return selected
+
+    def create_modules(
+        self,
+        templates: list[ObjectTemplate],
+        register: typing.Callable[[list], None] | None = None,
+    ):
+        """Create the modules of several templates, removing them all on failure.
 
-    def create_new_page_module(self, template: PageTemplate):
-        """Create a new page module."""
-        template.file_path.write_text(template.file_content)
+        Args:
+            templates: templates of the modules to create.
+            register: function recording the new modules, e.g. in the views
+                `__init__.py`; the modules are removed if it fails.
+
+        """
+        created = []
+        try:
+            for template in templates:
+                # Exclusive creation never overwrites a file written meanwhile.
+                with open(template.file_path, "x") as file:
+                    created.append(template.file_path)
+                    file.write(template.file_content)
+            if register is not None:
+                register(templates)
+        except BaseException:
+            for path in created:
+                path.unlink(missing_ok=True)
+            raise
+        for template in templates:
+            self.index.update(template._type.lower(), template.file_path)
+        self.index.save()
 
     def add_view_import_to_init_file(self, template: ViewTemplate):
         """Add a view import to the init file."""
-        init_file = template.file_path.parent / "__init__.py"
-        module_name = template.file_name.replace(".py", "")
-        if not init_file.exists():
-            init_file.write_text('"""Views module."""\n\n__all__ = []\n')
-
-        content = init_file.read_text()
-        import_line = f"from .{module_name} import {template.class_name}\n"
-        if import_line in content:
-            self.console.print(
-                f"[bold red]WARNING[/bold red] {template.class_name} already imported."
-            )
+        self.add_view_imports_to_init_file([template])
+
+    def add_view_imports_to_init_file(self, templates: list[ViewTemplate]):
+        """Add view imports to the init file with a single atomic write."""
+        if not templates:
+            return
+        init_file = templates[0].file_path.parent / "__init__.py"
+        if init_file.exists():
+            content = init_file.read_text()
+        else:
+            content = '"""Views module."""\n\n__all__ = []\n'
+
+        import_lines = []
+        class_names = []
+        for template in templates:
+            module_name = template.file_name.replace(".py", "")
+            import_line = f"from .{module_name} import {template.class_name}\n"
+            if import_line in content or import_line in import_lines:
+                self.console.print(
+                    f"[bold red]WARNING[/bold red] {template.class_name} already imported."
+                )
+                continue
+            import_lines.append(import_line)
+            class_names.append(f'"{template.class_name}"')
+        if not import_lines:
             return
 
-        # Insert import before __all__ using regex
+        # Insert imports before __all__ using regex
+        imports = "".join(import_lines)
         content = re.sub(
             r"(.*?)(\n__all__\s*=\s*\[.*?\])",
-            f"\\1{import_line}\\2",
+            lambda m: f"{m.group(1)}{imports}{m.group(2)}",
             content,
+            count=1,
             flags=re.DOTALL,
         )
 
-        # Add class to __all__ list using regex
+        # Add classes to __all__ list using regex
+        names = ", ".join(class_names)
         content = re.sub(
             r"(__all__\s*=\s*\[)(.*?)(\])",
-            lambda m: f'{m.group(1)}{m.group(2)}{", " if m.group(2) else ""}"{template.class_name}"{m.group(3)}',
+            lambda m: f"{m.group(1)}{self._join_names(m.group(2), names)}{m.group(3)}",
             content,
+            count=1,
+            flags=re.DOTALL,
         )
-        init_file.write_text(content)
+        temporary = init_file.with_name(f".{init_file.name}.tmp")
+        try:
+            temporary.write_text(content)
+            os.replace(temporary, init_file)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _join_names(existing: str, names: str) -> str:
+        """Append names to the body of an `__all__` list."""
+        existing = existing.rstrip().rstrip(",")
+        return f"{existing}, {names}" if existing.strip() else names
 
     def add_view(self, view_name: str):
         """Add a new view to the project."""
+        self.add_views([view_name])
+
+    def add_views(self, view_names: list[str]):
+        """Add new views to the project, updating the init file once."""
         view_path = self.project / "views"
-        template = ViewTemplate(view_name, view_path)
-        if template.file_path.exists():
+        templates = self.select_new_templates(
+            [ViewTemplate(view_name, view_path) for view_name in view_names]
+        )
+        self.create_modules(templates, self.add_view_imports_to_init_file)
+        for template in templates:
             self.console.print(
-                f"[bold red]ERROR[/bold red] View '{template.file_name}' already exists."
+                f"[bold green]CREATED[/bold green] {template.class_name} view."
             )
-            return None
-
-        self.create_new_view_module(template)
-        self.add_view_import_to_init_file(template)
-        self.console.print(
-            f"[bold green]CREATED[/bold green] {template.class_name} view."
-        )
 
     def add_page(self, page_name: str, url_path: str | None = None):
         """Add a new page to the project."""
+        self.add_pages([(page_name, url_path)])
+
+    def add_pages(self, pages: list[tuple[str, str | None]]):
+        """Add new pages to the project."""
         page_path = self.project / "pages"
-        template = PageTemplate(page_name, page_path, url_path)
-        if template.file_path.exists():
+        templates = self.select_new_templates(
+            [
+                PageTemplate(page_name, page_path, url_path)
+                for page_name, url_path in pages
+            ]
+        )
+        self.create_modules(templates)
+        for template in templates:
             self.console.print(
-                f"[bold red]ERROR[/bold red] Page '{template.file_name}' already exists."
+                f"[bold green]CREATED[/bold green] {template.class_name} page."
             )
-            return None
 
-        self.create_new_page_module(template)
+    def scaffold(self, spec: dict[str, list]):
+        """Add the views and pages of a spec loaded with `load_spec`."""
+        self.add_views(
+            [view if isinstance(view, str) else view["name"] for view in spec["views"]]
+        )
+        self.add_pages(
+            [
+                (page, None)
+                if isinstance(page, str)
+                else (page["name"], page.get("path"))
+                for page in spec["pages"]
+            ]
+        )
+
+    def print_index(self):
+        """Print the indexed pages and views as a table."""
+        table = Table(title="Project index")
+        table.add_column("Module", style="bold")
+        table.add_column("Kind", style="dim")
+        table.add_column("Classes")
+        table.add_column("URL path")
+        for module, entry in sorted(self.index.modules.items()):
+            table.add_row(
+                module,
+                entry["kind"],
+                ", ".join(entry["classes"]),
+                entry["url_path"] or "",
+            )
+        self.console.print(table)
+
+    def print_findings(self, modules: int, findings: list):
+        """Print static analysis findings."""
+        for finding in findings:
+            self.console.print(
+                f"[bold red]{finding.kind.upper()}[/bold red] "
+                f"{escape(finding.message)} [dim]({', '.join(finding.locations)})[/dim]"
+            )
+        colour = "red" if findings else "green"
         self.console.print(
-            f"[bold green]CREATED[/bold green] {template.class_name} page."
+            f"[bold {colour}]{len(findings)}[/bold {colour}] problem(s) found in "
+            f"{modules} module(s)."
         )
 
+    def print_profile(self, results: list, hotspots: list):
+        """Print render profiling results as tables."""
+        table = Table(title="Render latency")
+        table.add_column("Target", style="bold")
+        table.add_column("Kind", style="dim")
+        table.add_column("Calls", justify="right")
+        table.add_column("Mean (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+        table.add_column("Alloc (KiB)", justify="right")
+        for result in sorted(results, key=lambda result: result.p95, reverse=True):
+            table.add_row(
+                result.target,
+                result.kind,
+                str(result.calls),
+                f"{result.mean * 1000:.3f}",
+                f"{result.p95 * 1000:.3f}",
+                f"{result.allocated / 1024:.1f}",
+            )
+        self.console.print(table)
+
+        table = Table(title="cProfile hotspots")
+        table.add_column("Function", style="bold")
+        table.add_column("Calls", justify="right")
+        table.add_column("Own (ms)", justify="right")
+        table.add_column("Cumulative (ms)", justify="right")
+        for hotspot in hotspots:
+            table.add_row(
+                escape(hotspot.function),
+                str(hotspot.calls),
+                f"{hotspot.own * 1000:.3f}",
+                f"{hotspot.cumulative * 1000:.3f}",
+            )
+        self.console.print(table)
+
 
 @app.command("init")
 def init(
@@ -268,9 +494,7 @@ def create_view(
 
     """
     project = Project.detect(location=location)
-
-    for view_name in view_names:
-        project.add_view(view_name)
+    project.add_views(view_names)
 
 
 @app.command("page")
@@ -303,7 +527,183 @@ def create_page(
                 "[bold red]ERROR[/bold red] URL path is only available for single page creation."
             )
             return
-        for page_name in page_names:
-            project.add_page(page_name)
+        project.add_pages([(page_name, None) for page_name in page_names])
     else:
         project.add_page(page_names[0], url_path)
+
+
+@app.command("scaffold")
+def scaffold(
+    spec_file: Annotated[
+        Path, typer.Argument(help="TOML or YAML file listing the views and pages.")
+    ],
+    location: Annotated[
+        str, typer.Option(help="The destination directory for the project.")
+    ] = "",
+):
+    """Add every view and page listed in a spec file to the project.
+
+    Args:
+        spec_file: TOML or YAML file listing the views and pages.
+        location: the destination directory for the project.
+
+    """
+    project = Project.detect(location=location)
+    try:
+        spec = load_spec(spec_file)
+    except (OSError, ValueError) as exc:
+        project.console.print(f"[bold red]ERROR[/bold red] {escape(str(exc))}")
+        raise typer.Exit(code=1) from exc
+    project.scaffold(spec)
+
+
+@app.command("index")
+def index(
+    location: Annotated[
+        str, typer.Option(help="The destination directory for the project.")
+    ] = "",
+):
+    """Refresh and print the index of the project's pages and views.
+
+    Args:
+        location: the destination directory for the project.
+
+    """
+    project = Project.detect(location=location)
+    project.print_index()
+
+
+@app.command("check")
+def check(
+    workers: Annotated[
+        int, typer.Option(help="Parser processes, 0 for one per CPU.")
+    ] = 0,
+    location: Annotated[
+        str, typer.Option(help="The destination directory for the project.")
+    ] = "",
+):
+    """Statically check the project's pages and views without importing them.
+
+    Args:
+        workers: number of parser processes, 0 for one per CPU.
+        location: the destination directory for the project.
+
+    """
+    from .check import check_project
+
+    project = Project.detect(location=location)
+    modules, findings = check_project(project.project, workers or None)
+    project.print_findings(len(modules), findings)
+    if findings:
+        raise typer.Exit(code=1)
+
+
+@app.command("graph")
+def graph(
+    format: Annotated[
+        str, typer.Option(help="Output format, `dot` or `json`.")
+    ] = "dot",
+    output: Annotated[
+        str, typer.Option(help="File to write the graph to, stdout if empty.")
+    ] = "",
+    threshold: Annotated[
+        int, typer.Option(help="Callbacks per component that make a hotspot.")
+    ] = 3,
+    location: Annotated[
+        str, typer.Option(help="The destination directory for the project.")
+    ] = "",
+):
+    """Export the callback dependency graph of the project.
+
+    Args:
+        format: output format, `dot` or `json`.
+        output: file to write the graph to, stdout if empty.
+        threshold: callbacks per component that make a hotspot.
+        location: the destination directory for the project.
+
+    """
+    import json
+
+    from .graph import CallbackGraph
+    from .profiling import load_project
+
+    project = Project.detect(location=location)
+    if format not in {"dot", "json"}:
+        project.console.print(f"[bold red]ERROR[/bold red] Unknown format '{format}'.")
+        raise typer.Exit(code=1)
+    module = load_project(project.project)
+    callback_graph = CallbackGraph.from_app(getattr(module, "app", None))
+    if format == "dot":
+        content = callback_graph.to_dot(threshold)
+    else:
+        content = json.dumps(callback_graph.to_json(threshold), indent=2) + "\n"
+    if not output:
+        typer.echo(content, nl=False)
+        return
+    Path(output).write_text(content)
+    for hotspot in callback_graph.hotspots(threshold):
+        project.console.print(
+            f"[bold red]{hotspot.kind.upper()}[/bold red] {escape(hotspot.component)} "
+            f"({len(hotspot.callbacks)} callbacks)"
+        )
+    project.console.print(
+        f"[bold green]{len(callback_graph.callbacks)}[/bold green] callback(s) written "
+        f"to [bold purple]{output}[/bold purple]."
+    )
+
+
+@app.command("profile")
+def profile(
+    iterations: Annotated[
+        int, typer.Option(min=1, help="Number of renders per page and view.")
+    ] = 20,
+    top: Annotated[int, typer.Option(help="Number of cProfile hotspots to show.")] = 10,
+    location: Annotated[
+        str, typer.Option(help="The destination directory for the project.")
+    ] = "",
+):
+    """Profile the layout of every page and view in the project.
+
+    Args:
+        iterations: number of renders per page and view.
+        top: number of cProfile hotspots to show.
+        location: the destination directory for the project.
+
+    """
+    from .profiling import profile_project
+
+    project = Project.detect(location=location)
+    results, hotspots = profile_project(project.project, iterations, top, project.index)
+    project.print_profile(results, hotspots)
+
+
+@app.command("build")
+def build(
+    output: Annotated[
+        str, typer.Option(help="The build directory, relative to the project.")
+    ] = "build",
+    location: Annotated[
+        str, typer.Option(help="The destination directory for the project.")
+    ] = "",
+):
+    """Prerender every parameterless page into layout snapshots.
+
+    Args:
+        output: the build directory, relative to the project.
+        location: the destination directory for the project.
+
+    """
+    from .prerender import build_project
+
+    project = Project.detect(location=location)
+    build_dir = project.project / output
+    manifest = build_project(project.project, build_dir, project.index)
+    for qualified_name, entry in manifest["pages"].items():
+        project.console.print(
+            f"[bold green]PRERENDERED[/bold green] {qualified_name} "
+            f"({entry['size']} bytes) -> {entry['file']}"
+        )
+    project.console.print(
+        f"[bold green]{len(manifest['pages'])}[/bold green] page(s) written to "
+        f"[bold purple]{build_dir.absolute()}[/bold purple]."
+    )
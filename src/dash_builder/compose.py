@@ -0,0 +1,190 @@
+"""Module containing helpers for rendering several child layouts concurrently."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import time
+import traceback
+import typing
+
+from ._dash_object import DashObject
+from ._pool import (
+    DEFAULT_POOL_SIZE,
+    configure_render_pool,
+    in_render_worker,
+    render_pool,
+)
+
+__all__ = [
+    "DEFAULT_POOL_SIZE",
+    "ViewSpec",
+    "configure_render_pool",
+    "gather_layouts",
+    "render_concurrently",
+    "render_parallel",
+]
+
+STEAL_DELAY: float = 0.01
+"""Seconds a pool worker waits for idle workers to pick up its children before
+rendering the ones still queued itself."""
+
+ViewSpec = (
+    tuple[type[DashObject], str] | tuple[type[DashObject], str, dict[str, typing.Any]]
+)
+"""Child layout specification: `(ViewClass, id)` or `(ViewClass, id, kwargs)`."""
+
+
+def _unpack(spec: ViewSpec) -> tuple[type[DashObject], str, dict[str, typing.Any]]:
+    """Split a `ViewSpec` into class, id and keyword arguments.
+
+    Args:
+        spec: child layout specification.
+
+    Returns:
+        tuple of the view class, id and keyword arguments.
+
+    """
+    view, id, *rest = spec
+    return view, id, rest[0] if rest else {}
+
+
+async def gather_layouts(specs: typing.Iterable[ViewSpec]) -> list[typing.Any]:
+    """Render several child layouts at the same time with asyncio.
+
+    Each child falls back to its own `error_container` if it fails, so the
+    results always line up with `specs`.
+
+    # Example
+    ```python
+    class App(DashPage):
+        @classmethod
+        async def valid_layout(cls, **kwargs):
+            header, sidebar, footer = await gather_layouts(
+                [
+                    (HeaderView, "header"),
+                    (SidebarView, "sidebar"),
+                    (FooterView, "footer"),
+                ]
+            )
+            return dmc.AppShell([header, sidebar, footer])
+    ```
+
+    Args:
+        specs: child layout specifications.
+
+    Returns:
+        list of rendered layouts, in the order of `specs`.
+
+    """
+    calls = []
+    for spec in specs:
+        view, id, kwargs = _unpack(spec)
+        calls.append(view.alayout(id, **kwargs))
+    return list(await asyncio.gather(*calls))
+
+
+def render_concurrently(specs: typing.Iterable[ViewSpec]) -> list[typing.Any]:
+    """Render several child layouts concurrently from synchronous code.
+
+    Args:
+        specs: child layout specifications.
+
+    Raises:
+        `RuntimeError`: if called from inside a running event loop.
+
+    Returns:
+        list of rendered layouts, in the order of `specs`.
+
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(gather_layouts(specs))
+    raise RuntimeError(
+        "render_concurrently cannot run inside an event loop; "
+        "use `await gather_layouts(...)` instead."
+    )
+
+
+def _time_limit(view: type[DashObject], timeout: float | None) -> float | None:
+    """Return the seconds a child may take: `timeout` or its `render_timeout`."""
+    limits = [limit for limit in (timeout, view.render_timeout) if limit is not None]
+    return min(limits) if limits else None
+
+
+def render_parallel(
+    specs: typing.Iterable[ViewSpec], timeout: float | None = None
+) -> list[typing.Any]:
+    """Render several synchronous child layouts on the shared render pool.
+
+    Children that fail or miss their deadline, `timeout` or their own
+    `render_timeout` if shorter, are replaced with their `error_container`.
+    Calls made from inside a pool worker still fan out, but render the children
+    no worker picks up within `STEAL_DELAY` on the calling worker, so nested
+    composition cannot exhaust the pool; such a child only starts if its
+    deadline has not passed.
+
+    # Example
+    ```python
+    class App(DashPage):
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            header, sidebar, footer = render_parallel(
+                [
+                    (HeaderView, "header"),
+                    (SidebarView, "sidebar"),
+                    (FooterView, "footer"),
+                ],
+                timeout=2,
+            )
+            return dmc.AppShell([header, sidebar, footer])
+    ```
+
+    Args:
+        specs: child layout specifications.
+        timeout: seconds each child may take from submission, `None` to wait.
+
+    Returns:
+        list of rendered layouts, in the order of `specs`.
+
+    """
+    calls = [_unpack(spec) for spec in specs]
+    pool = render_pool()
+    start = time.monotonic()
+    limits = [_time_limit(view, timeout) for view, _, _ in calls]
+    futures = [
+        pool.submit(contextvars.copy_context().run, view.layout, id, **kwargs)
+        for view, id, kwargs in calls
+    ]
+    while in_render_worker():
+        _, waiting = concurrent.futures.wait(futures, timeout=STEAL_DELAY)
+        index = next(
+            (
+                index
+                for index in reversed(range(len(futures)))
+                if futures[index] in waiting and futures[index].cancel()
+            ),
+            None,
+        )
+        if index is None:
+            break
+        view, id, kwargs = calls[index]
+        futures[index] = stolen = concurrent.futures.Future()
+        if limits[index] is None or time.monotonic() - start < limits[index]:
+            try:
+                stolen.set_result(view.layout(id, **kwargs))
+            except Exception as exc:
+                stolen.set_exception(exc)
+
+    results = []
+    for (view, id, _), limit, future in zip(calls, limits, futures):
+        remaining = None if limit is None else max(0, start + limit - time.monotonic())
+        try:
+            results.append(future.result(timeout=remaining))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            message = f"{view.name()} '{id}' did not render within {limit}s."
+            results.append(view.error_container(message))
+        except Exception:
+            results.append(view.error_container(traceback.format_exc()))
+    return results
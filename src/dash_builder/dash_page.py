@@ -1,6 +1,10 @@
 """Module containing the abstract DashPage class for defining application pages."""
 
+from typing_extensions import override
+
 from ._dash_object import DashObject
+from .loaders import render_scope
+from .prerender import PrerenderedLayouts, prerendered_layouts
 
 __all__ = ["DashPage"]
 
@@ -27,4 +31,50 @@ class DashPage(DashObject):
     def layout(**kwargs):
         return Homepage.layout(**kwargs)
     ```
+
+    Each render runs in its own `render_scope`, so `DataLoader`s used by the
+    page's views share their results for the duration of the render only.
+
+    Pages prerendered by `dash build` are served from their snapshot when
+    `layout` is called without arguments, once the build directory has been
+    loaded with `prerendered_layouts.load`.
     """
+
+    prerendered: PrerenderedLayouts = prerendered_layouts
+    """Registry of prerendered snapshots consulted by `layout`."""
+
+    @override
+    @classmethod
+    def layout(cls, *args, **kwargs):
+        """Generate the page layout, serving the prerendered snapshot if available.
+
+        Args:
+            *args: additional positional arguments.
+            **kwargs: additional keyword arguments.
+
+        Returns:
+            `dash.html.Div` container, or the prerendered `LayoutSnapshot`.
+
+        """
+        if not args and not kwargs:
+            snapshot = cls.prerendered.get(cls)
+            if snapshot is not None:
+                return snapshot
+        with render_scope():
+            return super().layout(*args, **kwargs)
+
+    @override
+    @classmethod
+    async def alayout(cls, *args, **kwargs):
+        """Generate the page layout from inside an event loop, in a render scope.
+
+        Args:
+            *args: additional positional arguments.
+            **kwargs: additional keyword arguments.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        with render_scope():
+            return await super().alayout(*args, **kwargs)
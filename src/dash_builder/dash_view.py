@@ -1,32 +1,150 @@
 """Module containing the abstract DashView class for defining components of application pages."""
 
 import abc
+import functools
 import typing
 
-from dash import ALL, MATCH
+import dash
+from dash import ALL, MATCH, Input, Output, State, dcc, html
+from dash._callback import GLOBAL_CALLBACK_LIST
 from dash.dependencies import _Wildcard
 from typing_extensions import override
 
+from . import patches
 from ._dash_object import DashObject
+from .snapshot import LayoutSnapshot
 
 __all__ = ["DashView", "ComponentId"]
 
 
-class ComponentId(typing.TypedDict):
-    """Dictionary class for component IDs."""
+class ComponentId(dict):
+    """Immutable, hashable dictionary class for component IDs.
 
-    type: str
-    """`type` field of component IDs. Uses an encoded version of the view name / subname."""
-    index: str | _Wildcard
-    """`index` field of component IDs. User value allows for logical management of components within and across views and pages."""
+    Serializes exactly like `{"type": ..., "index": ...}` and compares equal to
+    the equivalent plain dictionary.
+
+    * `type` - uses an encoded version of the view name / subname.
+    * `index` - user value allows for logical management of components within and
+      across views and pages.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, type: str, index: str | _Wildcard):
+        """Create a component ID.
+
+        Args:
+            type: `type` field of the component ID.
+            index: `index` field of the component ID.
+
+        """
+        dict.__init__(self, type=type, index=index)
+
+    def __hash__(self) -> int:
+        """Hash of the `type` and `index` fields."""
+        return hash((self["type"], self["index"]))
+
+    def __repr__(self) -> str:
+        """Represent the ID as its constructor call."""
+        return f"ComponentId(type={self['type']!r}, index={self['index']!r})"
+
+    def __reduce__(self):
+        """Pickle via the constructor, as item assignment is disabled."""
+        return (type(self), (self["type"], self["index"]))
+
+    def __copy__(self) -> "ComponentId":
+        """Return self, as component IDs are immutable."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "ComponentId":
+        """Return self, as component IDs are immutable."""
+        return self
+
+    def _immutable(self, *args, **kwargs) -> typing.NoReturn:
+        raise TypeError("ComponentId objects are immutable.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
 
 
 class DashView(DashObject):
     """Abstract class for defining views in a Dash application.
 
     Views are single, or groups of, components that make up the application interface.
+
+    Set `lazy = True` on expensive views to render a skeleton placeholder on
+    first paint and load `valid_layout` through an automatically registered
+    callback. `layout`, `alayout` and `snapshot` all return the placeholder
+    container of a lazy view. Keyword arguments of lazy views must be JSON
+    serializable.
     """
 
+    lazy: bool = False
+    """Render `placeholder` first and fetch the real layout via a callback."""
+
+    max_patch_operations: int = patches.MAX_OPERATIONS
+    """Patch operations per index above which `batch_updates` sends full values."""
+
+    _id_cache: dict[tuple, ComponentId]
+    """Cache of interned `ComponentId` objects keyed by index and subname."""
+    _id_cache_maxsize: int = 4096
+    """Maximum number of interned IDs per class; further IDs are built on demand."""
+
+    @override
+    @classmethod
+    def _reset_name_cache(cls) -> None:
+        """Reset the name caches and the interned `ComponentId` cache."""
+        super()._reset_name_cache()
+        cls._id_cache = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the loading callback of lazy views."""
+        super().__init_subclass__(**kwargs)
+        if cls.lazy:
+            cls._register_lazy_callback()
+
+    @classmethod
+    def _callback(cls, *args, **kwargs) -> typing.Callable:
+        """Register a callback like `dash.callback`, replacing an earlier one.
+
+        Callbacks registered when a class is defined would otherwise be
+        registered twice when the class is redefined, e.g. on a module reload,
+        and Dash rejects duplicate outputs. The latest definition wins.
+
+        Args:
+            *args: outputs, inputs and states of the callback.
+            **kwargs: keyword arguments of `dash.callback`.
+
+        Returns:
+            the decorator registering the callback.
+
+        """
+        register = dash.callback(*args, **kwargs)
+
+        def decorator(function: typing.Callable) -> typing.Callable:
+            registered = register(function)
+            *earlier, latest = GLOBAL_CALLBACK_LIST
+            GLOBAL_CALLBACK_LIST[:-1] = [
+                callback
+                for callback in earlier
+                if callback["output"] != latest["output"]
+            ]
+            return registered
+
+        return decorator
+
+    @classmethod
+    def _register_lazy_callback(cls) -> None:
+        """Register the callback that swaps the placeholder for `valid_layout`."""
+
+        @cls._callback(
+            Output(cls.id(MATCH, "lazy"), "children"),
+            Input(cls.id(MATCH, "lazy"), "id"),
+            State(cls.id(MATCH, "lazy-kwargs"), "data"),
+        )
+        def load_lazy_view(component_id: ComponentId, kwargs: dict | None):
+            return cls.lazy_load(component_id["index"], **(kwargs or {}))
+
     @classmethod
     def id(cls, id: str | _Wildcard, subname: str | None = None) -> ComponentId:
         """Generate unique component ID to link callbacks between views.
@@ -45,7 +163,17 @@ class DashView(DashObject):
             `ComponentId` dictionary of the component ID.
 
         """
-        return ComponentId(type=cls.name(subname), index=id)
+        # Include the type so that equal-hashing indices (1, 1.0, True) stay distinct.
+        key = (id.__class__, id, subname)
+        try:
+            return cls._id_cache[key]
+        except KeyError:
+            component_id = ComponentId(type=cls.name(subname), index=id)
+            if len(cls._id_cache) < cls._id_cache_maxsize:
+                cls._id_cache[key] = component_id
+            return component_id
+        except TypeError:
+            return ComponentId(type=cls.name(subname), index=id)
 
     @classmethod
     def matched_id(cls) -> ComponentId:
@@ -73,6 +201,180 @@ class DashView(DashObject):
         """
         return cls.id(ALL)
 
+    @classmethod
+    def batch_updates(
+        cls,
+        ids: list[dict],
+        current: list[typing.Any],
+        compute: typing.Callable[[list], list | dict],
+    ) -> list[typing.Any]:
+        """Compute the outputs of an `ALL` pattern-matching callback in bulk.
+
+        `compute` is called once with every matched index. Values equal to the
+        current ones become `dash.no_update`, changed dictionaries and lists
+        become `dash.Patch` objects of the changed keys and items, so only the
+        differences are sent to the browser.
+
+        Args:
+            ids: component IDs matched by the `ALL` output.
+            current: current values of the output property, in the same order.
+            compute: function receiving the list of indices and returning the
+                new values as a list, or as a dictionary keyed by index.
+
+        Returns:
+            one `dash.no_update`, `dash.Patch` or full value per index.
+
+        """
+        return patches.batch_updates(ids, current, compute, cls.max_patch_operations)
+
+    @classmethod
+    def batch_callback(
+        cls, property: str, *inputs, subname: str | None = None, **kwargs
+    ) -> typing.Callable:
+        """Register a bulk callback updating a property of every view instance.
+
+        The decorated function receives the list of indices followed by the
+        values of `inputs`, and returns the new values as a list or as a
+        dictionary keyed by index. See `batch_updates`.
+
+        ```python
+        @ChartView.batch_callback("figure", Input("year", "value"))
+        def update_charts(indices, year):
+            return load_figures(indices, year)
+        ```
+
+        Args:
+            property: output property of the `cls.id(ALL, subname)` components.
+            *inputs: `Input` and `State` dependencies of the callback.
+            subname: subname of the output component IDs.
+            **kwargs: additional keyword arguments of `dash.callback`.
+
+        Returns:
+            decorator registering the callback and returning the function.
+
+        """
+        pattern = cls.id(ALL, subname)
+
+        def decorator(compute: typing.Callable) -> typing.Callable:
+            @dash.callback(
+                Output(pattern, property),
+                *inputs,
+                State(pattern, property),
+                State(pattern, "id"),
+                **kwargs,
+            )
+            @functools.wraps(compute)
+            def update(*values):
+                *arguments, current, ids = values
+                return cls.batch_updates(
+                    ids, current, lambda indices: compute(indices, *arguments)
+                )
+
+            return compute
+
+        return decorator
+
+    @classmethod
+    def placeholder(cls, id: str, **kwargs):
+        """Generate the lightweight layout shown until a lazy view loads.
+
+        Args:
+            id: logical identifier for the component.
+            kwargs: additional keyword arguments.
+
+        Returns:
+            `dmc.Stack` of skeleton rows.
+
+        """
+        import dash_mantine_components as dmc
+
+        return dmc.Stack([dmc.Skeleton(height=28, mt="sm") for _ in range(3)])
+
+    @override
+    @classmethod
+    def layout(cls, *args, **kwargs):
+        """Generate the view layout, or its placeholder if the view is lazy.
+
+        Args:
+            *args: additional positional arguments.
+            **kwargs: additional keyword arguments.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        if cls.lazy:
+            return cls.lazy_container(*args, **kwargs)
+        return cls._render(args, kwargs)[0]
+
+    @override
+    @classmethod
+    async def alayout(cls, *args, **kwargs):
+        """Generate the view layout from inside an event loop, or its placeholder.
+
+        Args:
+            *args: additional positional arguments.
+            **kwargs: additional keyword arguments.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        if cls.lazy:
+            return cls.lazy_container(*args, **kwargs)
+        return (await cls._arender(args, kwargs))[0]
+
+    @override
+    @classmethod
+    def snapshot(cls, *args, **kwargs) -> LayoutSnapshot:
+        """Generate the layout pre-serialized as JSON bytes, or its placeholder.
+
+        Args:
+            *args: additional positional arguments.
+            **kwargs: additional keyword arguments.
+
+        Returns:
+            `LayoutSnapshot` of the layout.
+
+        """
+        if cls.lazy:
+            return LayoutSnapshot.from_layout(cls.lazy_container(*args, **kwargs))
+        return super().snapshot(*args, **kwargs)
+
+    @classmethod
+    def lazy_container(cls, id: str, **kwargs) -> html.Div:
+        """Generate the container that a lazy view loads into.
+
+        Args:
+            id: logical identifier for the component.
+            kwargs: additional keyword arguments, stored for the loading callback.
+
+        Returns:
+            `dash.html.Div` container holding the placeholder.
+
+        """
+        return html.Div(
+            [
+                cls.placeholder(id, **kwargs),
+                dcc.Store(id=cls.id(id, "lazy-kwargs"), data=kwargs),
+            ],
+            id=cls.id(id, "lazy"),
+        )
+
+    @classmethod
+    def lazy_load(cls, id: str, **kwargs):
+        """Generate the real layout of a lazy view.
+
+        Args:
+            id: logical identifier for the component.
+            kwargs: additional keyword arguments.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        return cls._render((id,), kwargs)[0]
+
     @override
     @classmethod
     @abc.abstractmethod
@@ -0,0 +1,211 @@
+"""Module containing the error policy applied when a layout fails to render."""
+
+import logging
+import threading
+import time
+import traceback
+import typing
+
+__all__ = ["ErrorPolicy", "default_error_policy"]
+
+logger: logging.Logger = logging.getLogger("dash_builder")
+"""Logger receiving structured render failure records."""
+
+PRODUCTION_MESSAGE: str = "Something went wrong while rendering this content."
+"""Message shown in place of tracebacks in production mode."""
+
+
+class _Circuit:
+    """Circuit breaker state of a single class."""
+
+    __slots__ = ("failures", "opened_at", "fallback")
+
+    def __init__(self):
+        self.failures: int = 0
+        self.opened_at: float | None = None
+        self.fallback: typing.Any = None
+
+
+class ErrorPolicy:
+    """How `DashObject.layout` reports and contains failed renders.
+
+    * Failures are logged once per distinct error and class, with repeats
+      within `log_interval` counted and reported on the next log record.
+    * After `failure_threshold` consecutive failures the class' circuit opens:
+      `layout` returns the last fallback without calling `valid_layout` until
+      `reset_timeout` passes, then lets one trial render through.
+    * In `production` mode tracebacks are never sent to the browser and the
+      fallback layout is built once per class.
+
+    # Example
+    ```python
+    from dash_builder import DashView
+    from dash_builder.errors import ErrorPolicy
+
+
+    class PricesView(DashView):
+        error_policy = ErrorPolicy(production=True, failure_threshold=3)
+    ```
+    """
+
+    def __init__(
+        self,
+        production: bool = False,
+        log_interval: float = 60.0,
+        failure_threshold: int | None = None,
+        reset_timeout: float = 30.0,
+        timer: typing.Callable[[], float] = time.monotonic,
+    ):
+        """Create an error policy.
+
+        Args:
+            production: hide tracebacks and reuse one fallback layout per class.
+            log_interval: seconds during which repeats of an error are not logged.
+            failure_threshold: consecutive failures that open a class' circuit,
+                `None` to disable the circuit breaker.
+            reset_timeout: seconds a circuit stays open before a trial render.
+            timer: monotonic clock used for rate limiting and the breaker.
+
+        """
+        self.production: bool = production
+        """Whether tracebacks are hidden from the browser."""
+        self.log_interval: float = log_interval
+        """Seconds during which repeats of an error are not logged."""
+        self.failure_threshold: int | None = failure_threshold
+        """Consecutive failures that open a circuit, `None` if disabled."""
+        self.reset_timeout: float = reset_timeout
+        """Seconds a circuit stays open before a trial render."""
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._circuits: dict[type, _Circuit] = {}
+        self._logged: dict[tuple, tuple[float, int]] = {}
+        self._fallbacks: dict[type, typing.Any] = {}
+
+    def allow(self, cls: type) -> bool:
+        """Check whether `valid_layout` may be called for a class.
+
+        Args:
+            cls: the `DashObject` subclass about to render.
+
+        Returns:
+            `False` while the class' circuit is open.
+
+        """
+        if self.failure_threshold is None:
+            return True
+        with self._lock:
+            circuit = self._circuits.get(cls)
+            if circuit is None or circuit.opened_at is None:
+                return True
+            if self._timer() - circuit.opened_at < self.reset_timeout:
+                return False
+            # Half-open: let this render through as a trial and re-arm the timer
+            # so concurrent requests keep receiving the fallback.
+            circuit.opened_at = self._timer()
+            return True
+
+    def fallback(self, cls: type) -> typing.Any:
+        """Return the layout served while a class' circuit is open.
+
+        Args:
+            cls: the `DashObject` subclass that would have rendered.
+
+        Returns:
+            the fallback layout of the most recent failure.
+
+        """
+        with self._lock:
+            circuit = self._circuits.get(cls)
+            fallback = None if circuit is None else circuit.fallback
+        if fallback is None:
+            fallback = self._production_fallback(cls)
+        return fallback
+
+    def record_success(self, cls: type) -> None:
+        """Close a class' circuit after a successful render.
+
+        Args:
+            cls: the `DashObject` subclass that rendered.
+
+        """
+        if self.failure_threshold is None or cls not in self._circuits:
+            return
+        with self._lock:
+            self._circuits.pop(cls, None)
+
+    def handle(self, cls: type, exc: BaseException) -> typing.Any:
+        """Log a failed render, update the breaker and build the fallback layout.
+
+        Args:
+            cls: the `DashObject` subclass that failed.
+            exc: the exception raised by `valid_layout`.
+
+        Returns:
+            the layout to serve in place of the failed render.
+
+        """
+        self._log(cls, exc)
+        if self.production:
+            fallback = self._production_fallback(cls)
+        else:
+            fallback = cls.error_container("".join(traceback.format_exception(exc)))
+        if self.failure_threshold is not None:
+            with self._lock:
+                circuit = self._circuits.setdefault(cls, _Circuit())
+                circuit.failures += 1
+                circuit.fallback = fallback
+                if circuit.failures >= self.failure_threshold:
+                    circuit.opened_at = self._timer()
+        return fallback
+
+    def is_open(self, cls: type) -> bool:
+        """Check whether a class' circuit is currently open.
+
+        Args:
+            cls: the `DashObject` subclass to check.
+
+        Returns:
+            `True` if renders of the class are being short-circuited.
+
+        """
+        circuit = self._circuits.get(cls)
+        return circuit is not None and circuit.opened_at is not None
+
+    def _production_fallback(self, cls: type) -> typing.Any:
+        """Build, once per class, the fallback layout without error details."""
+        fallback = self._fallbacks.get(cls)
+        if fallback is None:
+            fallback = self._fallbacks[cls] = cls.error_container(PRODUCTION_MESSAGE)
+        return fallback
+
+    def _log(self, cls: type, exc: BaseException) -> None:
+        """Log a failure unless an identical one was logged within the interval."""
+        frame = traceback.extract_tb(exc.__traceback__)[-1:] or [None]
+        location = None if frame[0] is None else (frame[0].filename, frame[0].lineno)
+        signature = (cls, type(exc), location)
+        now = self._timer()
+        with self._lock:
+            last, suppressed = self._logged.get(signature, (None, 0))
+            if last is not None and now - last < self.log_interval:
+                self._logged[signature] = (last, suppressed + 1)
+                return
+            self._logged[signature] = (now, 0)
+        name = cls.name()
+        logger.error(
+            "Failed to render %s: %s: %s (%d similar suppressed)",
+            name,
+            type(exc).__name__,
+            exc,
+            suppressed,
+            exc_info=(type(exc), exc, exc.__traceback__),
+            extra={
+                "view": name,
+                "exception": type(exc).__name__,
+                "suppressed": suppressed,
+                "circuit_open": self.is_open(cls),
+            },
+        )
+
+
+default_error_policy: ErrorPolicy = ErrorPolicy()
+"""Policy used by `DashObject.error_policy` unless a class overrides it."""
@@ -0,0 +1,117 @@
+"""Module containing memoization of the layout fragments built by view helpers."""
+
+import collections
+import copy
+import functools
+import threading
+import typing
+import weakref
+
+from .snapshot import LayoutSnapshot
+
+__all__ = ["COPY_MODES", "fragment"]
+
+COPY_MODES: frozenset[str] = frozenset({"copy", "shared", "snapshot"})
+"""How cached fragments are handed out: a deep copy per call, the cached
+instance itself, or an immutable `LayoutSnapshot`."""
+
+
+def _key(args: tuple, kwargs: dict) -> typing.Hashable:
+    """Build the cache key of a call, distinguishing `1`, `1.0` and `True`."""
+    return (
+        tuple((arg.__class__, arg) for arg in args),
+        tuple(sorted((name, value.__class__, value) for name, value in kwargs.items())),
+    )
+
+
+def fragment(
+    function: typing.Callable | None = None,
+    *,
+    mode: str = "shared",
+    maxsize: int = 128,
+) -> typing.Any:
+    """Cache the component subtree built by a classmethod, per class and arguments.
+
+    Apply below `@classmethod`. Results are cached per class in a weak mapping,
+    so a reloaded class starts with an empty cache and the cache of a discarded
+    class is freed with it. Calls with unhashable arguments are not cached.
+
+    By default every call returns the cached instance itself, which must be
+    treated as read-only: modifying it changes the fragment for every later
+    caller. Use `mode="copy"` for fragments the caller modifies; the deep copy
+    usually costs more than building the fragment again.
+
+    # Example
+    ```python
+    class HeaderView(DashView):
+        @classmethod
+        @fragment
+        def logo(cls, size: str = "md"):
+            return dmc.Image(src="/assets/logo.svg", h=SIZES[size])
+    ```
+
+    Args:
+        function: the method, when used without arguments as `@fragment`.
+        mode: `shared` to return the cached instance itself, `snapshot` to
+            return it serialized as a `LayoutSnapshot`, or `copy` to return a
+            deep copy the caller may modify.
+        maxsize: number of argument tuples cached per class.
+
+    Raises:
+        `ValueError`: if `mode` is not one of `COPY_MODES`.
+
+    Returns:
+        the caching method, or a decorator if `function` is `None`.
+
+    """
+    if mode not in COPY_MODES:
+        raise ValueError(f"Unknown fragment mode '{mode}'.")
+
+    def decorator(function: typing.Callable) -> typing.Callable:
+        if isinstance(function, classmethod):
+            return classmethod(decorator(function.__func__))
+
+        caches: weakref.WeakKeyDictionary[type, collections.OrderedDict] = (
+            weakref.WeakKeyDictionary()
+        )
+        lock = threading.Lock()
+
+        @functools.wraps(function)
+        def wrapper(cls, *args, **kwargs):
+            try:
+                key = _key(args, kwargs)
+                hash(key)
+            except TypeError:
+                return function(cls, *args, **kwargs)
+            with lock:
+                cache = caches.get(cls)
+                if cache is None:
+                    cache = caches[cls] = collections.OrderedDict()
+                try:
+                    value = cache[key]
+                    cache.move_to_end(key)
+                    found = True
+                except KeyError:
+                    found = False
+            if not found:
+                value = function(cls, *args, **kwargs)
+                if mode == "snapshot":
+                    value = LayoutSnapshot.from_layout(value)
+                with lock:
+                    cache[key] = value
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return copy.deepcopy(value) if mode == "copy" else value
+
+        def cache_clear(cls: type | None = None) -> None:
+            """Forget the cached fragments of a class, or of every class."""
+            with lock:
+                if cls is None:
+                    caches.clear()
+                else:
+                    caches.pop(cls, None)
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator if function is None else decorator(function)
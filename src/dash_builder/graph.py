@@ -0,0 +1,283 @@
+"""Module containing the callback dependency graph of a Dash app."""
+
+import json
+import typing
+from collections import defaultdict
+
+import dash
+from dash import _callback
+
+from .dash_view import DashView
+
+__all__ = ["CallbackGraph", "CallbackNode", "GraphHotspot"]
+
+
+class CallbackNode(typing.NamedTuple):
+    """Callback and the component properties it reads and writes."""
+
+    name: str
+    """Qualified name of the callback function."""
+    inputs: tuple[tuple[str, str], ...]
+    """`(component, pattern)` pairs of the inputs triggering the callback."""
+    states: tuple[tuple[str, str], ...]
+    """`(component, pattern)` pairs of the states read by the callback."""
+    outputs: tuple[tuple[str, str], ...]
+    """`(component, pattern)` pairs of the outputs written by the callback."""
+
+
+class GraphHotspot(typing.NamedTuple):
+    """Component property involved in many callbacks."""
+
+    kind: str
+    """`fan-out` for an input triggering many callbacks, `fan-in` for an output
+    written by many callbacks."""
+    component: str
+    """`<id type>.<property>` of the component."""
+    callbacks: tuple[str, ...]
+    """Names of the callbacks involved."""
+
+
+def _parse_dependency(component_id: str, prop: str) -> tuple[str, str]:
+    """Reduce a serialized dependency to its component key and index pattern.
+
+    Pattern-matching IDs are keyed by their `type`, which for views is
+    `DashView.name(subname)`, so every instance of a view shares one node.
+    """
+    prop = prop.split("@")[0]  # allow_duplicate suffix
+    if not component_id.startswith("{"):
+        return f"{component_id}.{prop}", ""
+    parsed = json.loads(component_id)
+    index = parsed.get("index", "")
+    pattern = index[0] if isinstance(index, list) else str(index)
+    return f"{parsed.get('type', component_id)}.{prop}", pattern
+
+
+def _parse_outputs(output: str) -> list[tuple[str, str]]:
+    """Split a callback output key into its dependencies."""
+    if output.startswith("..") and output.endswith(".."):
+        parts = output[2:-2].split("...")
+    else:
+        parts = [output]
+    return [_parse_dependency(*part.rsplit(".", 1)) for part in parts if "." in part]
+
+
+def _view_names() -> dict[str, str]:
+    """Map the `name()` of every defined view class to the class name."""
+    names = {}
+    pending = list(DashView.__subclasses__())
+    while pending:
+        view = pending.pop()
+        names[view.name()] = view.__name__
+        pending.extend(view.__subclasses__())
+    return names
+
+
+class CallbackGraph:
+    """Dependency graph between component properties and callbacks.
+
+    Nodes are callbacks and component properties; edges run from inputs and
+    states to callbacks, and from callbacks to outputs. Component properties of
+    `DashView` IDs are attributed to their view class.
+
+    # Example
+    ```python
+    from dash_builder.graph import CallbackGraph
+
+    graph = CallbackGraph.from_app(app)
+    graph.hotspots(threshold=3)
+    ```
+    """
+
+    def __init__(self, callbacks: list[CallbackNode], views: dict[str, str]):
+        """Create a graph from parsed callbacks.
+
+        Args:
+            callbacks: the callbacks.
+            views: view class names keyed by their `name()`.
+
+        """
+        self.callbacks: list[CallbackNode] = callbacks
+        """The callbacks of the app."""
+        self.views: dict[str, str] = views
+        """View class names keyed by their `name()`."""
+
+    @classmethod
+    def from_app(cls, app: dash.Dash | None = None) -> "CallbackGraph":
+        """Build the graph of the callbacks registered with Dash.
+
+        Args:
+            app: app whose `app.callback` callbacks are included as well as the
+                global `dash.callback` ones.
+
+        Returns:
+            the `CallbackGraph`.
+
+        """
+        functions = dict(_callback.GLOBAL_CALLBACK_MAP)
+        entries = list(_callback.GLOBAL_CALLBACK_LIST)
+        if app is not None:
+            functions.update(app.callback_map)
+            entries.extend(app._callback_list)
+
+        callbacks = {}
+        for entry in entries:
+            output = entry["output"]
+            function = functions.get(output, {}).get("callback")
+            function = getattr(function, "__wrapped__", function)
+            name = (
+                f"{function.__module__}.{function.__qualname__}"
+                if function is not None
+                else output
+            )
+            callbacks[output] = CallbackNode(
+                name=name,
+                inputs=tuple(
+                    _parse_dependency(item["id"], item["property"])
+                    for item in entry["inputs"]
+                ),
+                states=tuple(
+                    _parse_dependency(item["id"], item["property"])
+                    for item in entry["state"]
+                ),
+                outputs=tuple(_parse_outputs(output)),
+            )
+        return cls(list(callbacks.values()), _view_names())
+
+    def view_of(self, component: str) -> str | None:
+        """Return the view class whose IDs a component property belongs to.
+
+        Args:
+            component: `<id type>.<property>` of the component.
+
+        Returns:
+            the view class name, or `None`.
+
+        """
+        id_type = component.rsplit(".", 1)[0]
+        while id_type:
+            if id_type in self.views:
+                return self.views[id_type]
+            id_type = id_type.rpartition("-")[0]
+        return None
+
+    def triggers(self) -> dict[str, list[str]]:
+        """Return the callbacks triggered by each input."""
+        triggers = defaultdict(list)
+        for callback in self.callbacks:
+            for component in dict.fromkeys(c for c, _ in callback.inputs):
+                triggers[component].append(callback.name)
+        return dict(triggers)
+
+    def writers(self) -> dict[str, list[str]]:
+        """Return the callbacks writing each output."""
+        writers = defaultdict(list)
+        for callback in self.callbacks:
+            for component in dict.fromkeys(c for c, _ in callback.outputs):
+                writers[component].append(callback.name)
+        return dict(writers)
+
+    def hotspots(self, threshold: int = 3) -> list[GraphHotspot]:
+        """Find inputs triggering and outputs written by many callbacks.
+
+        Args:
+            threshold: minimum number of callbacks of a hotspot.
+
+        Returns:
+            the hotspots, the most connected first.
+
+        """
+        hotspots = [
+            GraphHotspot(kind, component, tuple(names))
+            for kind, edges in (
+                ("fan-out", self.triggers()),
+                ("fan-in", self.writers()),
+            )
+            for component, names in edges.items()
+            if len(names) >= threshold
+        ]
+        return sorted(hotspots, key=lambda hotspot: -len(hotspot.callbacks))
+
+    def to_json(self, threshold: int = 3) -> dict[str, typing.Any]:
+        """Return the graph as JSON data.
+
+        Args:
+            threshold: minimum number of callbacks of a hotspot.
+
+        Returns:
+            dictionary of components, callbacks and hotspots.
+
+        """
+        components = {
+            component
+            for callback in self.callbacks
+            for dependencies in (callback.inputs, callback.states, callback.outputs)
+            for component, _ in dependencies
+        }
+        return {
+            "components": [
+                {"id": component, "view": self.view_of(component)}
+                for component in sorted(components)
+            ],
+            "callbacks": [
+                {
+                    "name": callback.name,
+                    **{
+                        kind: [
+                            {"component": component, "pattern": pattern}
+                            for component, pattern in getattr(callback, kind)
+                        ]
+                        for kind in ("inputs", "states", "outputs")
+                    },
+                }
+                for callback in self.callbacks
+            ],
+            "hotspots": [hotspot._asdict() for hotspot in self.hotspots(threshold)],
+        }
+
+    def to_dot(self, threshold: int = 3) -> str:
+        """Return the graph in Graphviz DOT format, hotspots in red.
+
+        Args:
+            threshold: minimum number of callbacks of a hotspot.
+
+        Returns:
+            the DOT source.
+
+        """
+        hot = {hotspot.component for hotspot in self.hotspots(threshold)}
+        by_view = defaultdict(set)
+        for callback in self.callbacks:
+            for dependencies in (callback.inputs, callback.states, callback.outputs):
+                for component, _ in dependencies:
+                    by_view[self.view_of(component)].add(component)
+
+        lines = ["digraph callbacks {", "  rankdir=LR;"]
+        for view, components in sorted(by_view.items(), key=lambda item: str(item[0])):
+            indent = "  "
+            if view is not None:
+                lines.append(f"  subgraph {json.dumps('cluster_' + view)} {{")
+                lines.append(f"    label={json.dumps(view)};")
+                indent = "    "
+            for component in sorted(components):
+                colour = ', color="red"' if component in hot else ""
+                lines.append(f"{indent}{json.dumps(component)} [shape=box{colour}];")
+            if view is not None:
+                lines.append("  }")
+        for callback in self.callbacks:
+            name = json.dumps(callback.name)
+            lines.append(f"  {name} [shape=ellipse];")
+            for component, pattern in callback.inputs:
+                lines.append(
+                    f"  {json.dumps(component)} -> {name} [label={json.dumps(pattern)}];"
+                )
+            for component, pattern in callback.states:
+                lines.append(
+                    f"  {json.dumps(component)} -> {name} "
+                    f"[style=dashed, label={json.dumps(pattern)}];"
+                )
+            for component, pattern in callback.outputs:
+                lines.append(
+                    f"  {name} -> {json.dumps(component)} [label={json.dumps(pattern)}];"
+                )
+        lines.append("}")
+        return "\n".join(lines) + "\n"
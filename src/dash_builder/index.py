@@ -0,0 +1,252 @@
+"""Module containing the persistent index of a project's pages and views."""
+
+import hashlib
+import json
+import os
+import re
+import typing
+from pathlib import Path
+
+__all__ = ["IGNORED", "ProjectIndex", "scan_directory"]
+
+INDEX_FILE: str = ".dash-builder/index.json"
+"""Location of the index, relative to the project directory."""
+
+IGNORED: frozenset[str] = frozenset(
+    {
+        ".dash-builder",
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".venv",
+        "__pycache__",
+        "build",
+        "dist",
+        "node_modules",
+        "venv",
+    }
+)
+"""Directory names skipped when walking a project."""
+
+PACKAGES: dict[str, str] = {"page": "pages", "view": "views"}
+"""Project package of each indexed module kind."""
+
+CLASS_PATTERN = re.compile(r"^class\s+(\w+)\s*[(:]", re.MULTILINE)
+PAGE_PATTERN = re.compile(
+    r"register_page\(\s*__name__\s*(?:,\s*path\s*=\s*([\"'])(.*?)\1)?"
+)
+
+
+def scan_directory(
+    directory: str | Path, ignore: typing.Container[str] = IGNORED
+) -> list[os.DirEntry]:
+    """List a directory with `os.scandir`, directories first then by name.
+
+    Hidden entries and names in `ignore` are skipped. The file type of each
+    entry comes from the directory listing, without a `stat` call per entry.
+
+    Args:
+        directory: directory to list.
+        ignore: names to skip.
+
+    Returns:
+        the sorted directory entries.
+
+    """
+    with os.scandir(directory) as entries:
+        kept = [
+            entry
+            for entry in entries
+            if not entry.name.startswith(".") and entry.name not in ignore
+        ]
+    return sorted(kept, key=lambda entry: (not entry.is_dir(), entry.name.lower()))
+
+
+def _parse_module(kind: str, source: bytes) -> dict[str, typing.Any]:
+    """Extract the class names and page URL path of a module's source."""
+    text = source.decode("utf-8", errors="replace")
+    page = PAGE_PATTERN.search(text) if kind == "page" else None
+    return {
+        "classes": CLASS_PATTERN.findall(text),
+        "url_path": page.group(2) if page else None,
+    }
+
+
+class ProjectIndex:
+    """Cached index of the page and view modules of a project.
+
+    The index is stored in `.dash-builder/index.json` and records, for every
+    module in `pages/` and `views/`, its class names, page URL path and content
+    hash. `refresh` only re-reads modules whose modification time or size
+    changed since they were last indexed.
+
+    # Example
+    ```python
+    index = ProjectIndex(Path("my-project")).refresh()
+    index.class_names("view")
+    ```
+    """
+
+    VERSION: int = 1
+    """Index format version; indexes of other versions are rebuilt."""
+
+    def __init__(self, project: Path):
+        """Create the index of a project, loading the stored index if any.
+
+        Args:
+            project: project directory.
+
+        """
+        self.project: Path = Path(project)
+        """Project directory."""
+        self.path: Path = self.project / INDEX_FILE
+        """Index file."""
+        self.modules: dict[str, dict[str, typing.Any]] = self._load()
+        """Indexed modules keyed by their path relative to the project."""
+        self._dirty: bool = False
+
+    def _load(self) -> dict[str, dict[str, typing.Any]]:
+        """Read the stored index, ignoring missing or outdated files."""
+        try:
+            stored = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(stored, dict) or stored.get("version") != self.VERSION:
+            return {}
+        return stored.get("modules", {})
+
+    def refresh(self) -> "ProjectIndex":
+        """Re-index changed modules, drop deleted ones and save if needed.
+
+        Returns:
+            the index itself.
+
+        """
+        seen = set()
+        for kind, package in PACKAGES.items():
+            directory = self.project / package
+            if directory.is_dir():
+                for entry in self._walk(directory):
+                    seen.add(self._index_entry(kind, entry))
+        for stale in self.modules.keys() - seen:
+            del self.modules[stale]
+            self._dirty = True
+        self.save()
+        return self
+
+    def _walk(self, directory: Path) -> typing.Iterator[os.DirEntry]:
+        """Yield the Python modules below a package directory."""
+        for entry in scan_directory(directory):
+            if entry.is_dir():
+                yield from self._walk(Path(entry.path))
+            elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                yield entry
+
+    def _index_entry(self, kind: str, entry: os.DirEntry) -> str:
+        """Index a module if it changed and return its relative path."""
+        stat = entry.stat()
+        relative = Path(entry.path).relative_to(self.project).as_posix()
+        cached = self.modules.get(relative)
+        if (
+            cached is not None
+            and cached["mtime_ns"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+        ):
+            return relative
+        self.update(kind, Path(entry.path), stat)
+        return relative
+
+    def update(self, kind: str, path: Path, stat: os.stat_result | None = None) -> None:
+        """Index a single module, e.g. one the CLI has just written.
+
+        Args:
+            kind: `page` or `view`.
+            path: the module file.
+            stat: the file status, read if `None`.
+
+        """
+        stat = path.stat() if stat is None else stat
+        source = path.read_bytes()
+        relative = path.relative_to(self.project).as_posix()
+        self.modules[relative] = {
+            "kind": kind,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(source).hexdigest(),
+            **_parse_module(kind, source),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the index atomically if it changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(exist_ok=True)
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        data = {"version": self.VERSION, "modules": self.modules}
+        temporary.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+        os.replace(temporary, self.path)
+        self._dirty = False
+
+    def entries(self, kind: str | None = None) -> dict[str, dict[str, typing.Any]]:
+        """Return the indexed modules of a kind.
+
+        Args:
+            kind: `page`, `view` or `None` for both.
+
+        Returns:
+            modules keyed by their path relative to the project.
+
+        """
+        return {
+            path: module
+            for path, module in self.modules.items()
+            if kind is None or module["kind"] == kind
+        }
+
+    def class_names(self, kind: str | None = None) -> set[str]:
+        """Return the class names defined in the indexed modules.
+
+        Args:
+            kind: `page`, `view` or `None` for both.
+
+        Returns:
+            set of class names.
+
+        """
+        return {
+            name for module in self.entries(kind).values() for name in module["classes"]
+        }
+
+    def module_names(
+        self, kind: str | None = None, classes_only: bool = False
+    ) -> list[str]:
+        """Return the dotted names of the indexed modules.
+
+        Args:
+            kind: `page`, `view` or `None` for both.
+            classes_only: only return modules defining at least one class.
+
+        Returns:
+            sorted module names, e.g. `views.charts.sales`.
+
+        """
+        return sorted(
+            path.removesuffix(".py").replace("/", ".")
+            for path, module in self.entries(kind).items()
+            if module["classes"] or not classes_only
+        )
+
+    def url_paths(self) -> dict[str, str]:
+        """Return the explicit URL paths of the indexed pages.
+
+        Returns:
+            dictionary of URL path to page module path.
+
+        """
+        return {
+            module["url_path"]: path
+            for path, module in self.entries("page").items()
+            if module["url_path"] is not None
+        }
@@ -0,0 +1,111 @@
+"""Module containing admission control for concurrent layout renders."""
+
+import asyncio
+import threading
+import typing
+
+__all__ = ["ConcurrencyLimiter"]
+
+
+class ConcurrencyLimiter:
+    """Bound the number of concurrent renders of a page or view class.
+
+    Renders beyond `max_concurrent` wait up to `queue_timeout` seconds for a
+    slot and are then shed: `layout` returns the class' cheap `busy_container`
+    instead of calling `valid_layout`.
+
+    # Example
+    ```python
+    from dash_builder import DashPage
+    from dash_builder.limits import ConcurrencyLimiter
+
+
+    class ReportPage(DashPage):
+        admission = ConcurrencyLimiter(4, queue_timeout=0.5)
+        render_timeout = 5
+    ```
+    """
+
+    def __init__(self, max_concurrent: int, queue_timeout: float = 0.0):
+        """Create a concurrency limiter.
+
+        Args:
+            max_concurrent: maximum number of renders in progress at once.
+            queue_timeout: seconds an excess render waits for a slot before it is
+                shed, `0` to shed immediately.
+
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1.")
+        self.max_concurrent: int = max_concurrent
+        """Maximum number of renders in progress at once."""
+        self.queue_timeout: float = queue_timeout
+        """Seconds an excess render waits for a slot before it is shed."""
+        self.shed: int = 0
+        """Number of renders rejected with the busy layout."""
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._busy: dict[type, typing.Any] = {}
+
+    def acquire(self) -> bool:
+        """Reserve a render slot, waiting up to `queue_timeout`.
+
+        Returns:
+            `True` if a slot was reserved and must be released.
+
+        """
+        if self._semaphore.acquire(blocking=False):
+            return True
+        if self.queue_timeout > 0 and self._semaphore.acquire(
+            timeout=self.queue_timeout
+        ):
+            return True
+        self.shed += 1
+        return False
+
+    async def acquire_async(self) -> bool:
+        """Reserve a render slot without blocking the event loop.
+
+        Returns:
+            `True` if a slot was reserved and must be released.
+
+        """
+        if self._semaphore.acquire(blocking=False):
+            return True
+        if self.queue_timeout > 0:
+            waiting = asyncio.ensure_future(
+                asyncio.to_thread(self._semaphore.acquire, timeout=self.queue_timeout)
+            )
+            try:
+                acquired = await asyncio.shield(waiting)
+            except asyncio.CancelledError:
+                # The thread may still obtain the slot; hand it back when it does.
+                waiting.add_done_callback(self._release_abandoned)
+                raise
+            if acquired:
+                return True
+        self.shed += 1
+        return False
+
+    def _release_abandoned(self, waiting: asyncio.Future) -> None:
+        """Free a slot obtained for a caller that was cancelled while waiting."""
+        if not waiting.cancelled() and waiting.exception() is None and waiting.result():
+            self.release()
+
+    def release(self) -> None:
+        """Free a render slot reserved by `acquire`."""
+        self._semaphore.release()
+
+    def busy(self, cls: type) -> typing.Any:
+        """Return the busy layout of a class, built once and then reused.
+
+        Args:
+            cls: the `DashObject` subclass whose render was shed.
+
+        Returns:
+            the class' `busy_container`.
+
+        """
+        layout = self._busy.get(cls)
+        if layout is None:
+            layout = self._busy[cls] = cls.busy_container()
+        return layout
@@ -0,0 +1,313 @@
+"""Module containing request-scoped data loaders shared by the views of a page."""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import inspect
+import threading
+import typing
+
+__all__ = ["DataLoader", "RenderScope", "current_scope", "render_scope"]
+
+BatchFunction = typing.Callable[
+    [list[typing.Hashable]],
+    typing.Mapping
+    | typing.Sequence
+    | typing.Awaitable[typing.Mapping | typing.Sequence],
+]
+"""Function loading a list of keys, returning their values as a mapping keyed by
+key or as a sequence in the order of the keys. May be `async`."""
+
+
+class _LoaderState:
+    """Results and queued keys of one loader within one render."""
+
+    __slots__ = ("futures", "queued", "scheduled", "lock")
+
+    def __init__(self):
+        self.futures: dict[typing.Hashable, concurrent.futures.Future] = {}
+        self.queued: dict[typing.Hashable, None] = {}
+        self.scheduled: bool = False
+        self.lock: threading.Lock = threading.Lock()
+
+
+class RenderScope:
+    """Loader results kept for the lifetime of a single page render."""
+
+    def __init__(self):
+        """Create an empty scope."""
+        self._states: dict[DataLoader, _LoaderState] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def state(self, loader: "DataLoader") -> _LoaderState:
+        """Return the state of a loader in this scope, creating it if needed.
+
+        Args:
+            loader: the loader.
+
+        Returns:
+            the loader's state.
+
+        """
+        with self._lock:
+            try:
+                return self._states[loader]
+            except KeyError:
+                state = self._states[loader] = _LoaderState()
+                return state
+
+
+_current: contextvars.ContextVar[RenderScope | None] = contextvars.ContextVar(
+    "dash_builder_render_scope", default=None
+)
+
+
+def current_scope() -> RenderScope | None:
+    """Return the scope of the render in progress, if any."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def render_scope() -> typing.Iterator[RenderScope]:
+    """Bind data loaders to a render, e.g. a page layout or a callback.
+
+    `DashPage.layout` and `DashPage.alayout` enter a scope automatically. Nested
+    scopes reuse the outer one. Child renders on the render pool or in asyncio
+    tasks share the scope, as they run in a copy of the caller's context.
+
+    Yields:
+        the `RenderScope`.
+
+    """
+    scope = _current.get()
+    if scope is not None:
+        yield scope
+        return
+    scope = RenderScope()
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+
+
+def _resolve(values: typing.Any) -> typing.Any:
+    """Run an awaitable batch result to completion from synchronous code."""
+    if not inspect.isawaitable(values):
+        return values
+
+    async def wait():
+        return await values
+
+    return asyncio.run(wait())
+
+
+class DataLoader:
+    """Deduplicating, batching loader whose results live for one page render.
+
+    Identical keys requested by the views of a page are loaded once, and keys
+    requested together are loaded with a single call to the batch function.
+    Keys passed to `prime` join the next batch, so a page can
+    announce what its views will need. Outside a render scope every call loads
+    its keys directly without caching.
+
+    # Example
+    ```python
+    from dash_builder.loaders import DataLoader
+
+    customers = DataLoader(lambda ids: db.customers_by_id(ids))
+
+
+    class CustomerCardView(DashView):
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            customer = customers.load(id)
+            return dmc.Card(customer["name"], id=cls.id(id))
+    ```
+    """
+
+    def __init__(
+        self, batch_function: BatchFunction, max_batch_size: int | None = None
+    ):
+        """Create a loader.
+
+        Args:
+            batch_function: function loading a list of keys, returning a mapping
+                keyed by key (missing keys load as `None`) or a sequence in the
+                order of the keys. May be `async`.
+            max_batch_size: maximum number of keys per call, `None` for no limit.
+
+        """
+        self.batch_function: BatchFunction = batch_function
+        """Function loading a list of keys."""
+        self.max_batch_size: int | None = max_batch_size
+        """Maximum number of keys per call to `batch_function`."""
+
+    def __repr__(self) -> str:
+        """Represent the loader by its batch function."""
+        name = getattr(self.batch_function, "__qualname__", self.batch_function)
+        return f"DataLoader({name})"
+
+    def _state(self) -> _LoaderState:
+        """Return the state of the loader in the current scope, or a throwaway one."""
+        scope = _current.get()
+        return _LoaderState() if scope is None else scope.state(self)
+
+    def _enqueue(
+        self, state: _LoaderState, keys: typing.Iterable[typing.Hashable]
+    ) -> list[concurrent.futures.Future]:
+        """Create futures for unseen keys and queue them; call with the lock held."""
+        futures = []
+        for key in keys:
+            future = state.futures.get(key)
+            if future is None:
+                future = state.futures[key] = concurrent.futures.Future()
+                state.queued[key] = None
+            futures.append(future)
+        return futures
+
+    def _take_queue(self, state: _LoaderState) -> list[list[typing.Hashable]]:
+        """Empty the queue into batches; call with the lock held."""
+        keys = list(state.queued)
+        state.queued.clear()
+        state.scheduled = False
+        size = self.max_batch_size or len(keys) or 1
+        return [keys[start : start + size] for start in range(0, len(keys), size)]
+
+    def _settle(
+        self,
+        state: _LoaderState,
+        keys: list[typing.Hashable],
+        values: typing.Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Resolve the futures of a batch; failed keys are forgotten for retries."""
+        if error is None:
+            try:
+                if isinstance(values, typing.Mapping):
+                    values = [values.get(key) for key in keys]
+                elif len(values) != len(keys):
+                    raise ValueError(
+                        f"{self!r} returned {len(values)} values for {len(keys)} keys."
+                    )
+            except Exception as exc:
+                error = exc
+        with state.lock:
+            futures = [state.futures[key] for key in keys]
+            if error is not None:
+                for key in keys:
+                    del state.futures[key]
+        for index, future in enumerate(futures):
+            if error is None:
+                future.set_result(values[index])
+            else:
+                future.set_exception(error)
+
+    def _dispatch(self, state: _LoaderState, batch: list[typing.Hashable]) -> None:
+        """Load a batch synchronously and resolve its futures."""
+        try:
+            values = _resolve(self.batch_function(batch))
+        except Exception as exc:
+            self._settle(state, batch, error=exc)
+        else:
+            self._settle(state, batch, values)
+
+    async def _adispatch(self, state: _LoaderState, batch: list) -> None:
+        """Load a batch without blocking the event loop and resolve its futures."""
+        try:
+            if inspect.iscoroutinefunction(self.batch_function):
+                values = await self.batch_function(batch)
+            else:
+                values = await asyncio.to_thread(self.batch_function, batch)
+                if inspect.isawaitable(values):
+                    values = await values
+        except Exception as exc:
+            self._settle(state, batch, error=exc)
+        else:
+            self._settle(state, batch, values)
+
+    def prime(self, *keys: typing.Hashable) -> None:
+        """Queue keys to be loaded with the next batch.
+
+        Args:
+            *keys: keys the views of the render are going to load.
+
+        """
+        state = self._state()
+        with state.lock:
+            self._enqueue(state, keys)
+
+    def load_many(self, keys: typing.Iterable[typing.Hashable]) -> list[typing.Any]:
+        """Load several keys, with one call for all those not loaded yet.
+
+        Args:
+            keys: keys to load.
+
+        Returns:
+            the values, in the order of `keys`.
+
+        """
+        state = self._state()
+        with state.lock:
+            futures = self._enqueue(state, keys)
+            batches = self._take_queue(state)
+        for batch in batches:
+            self._dispatch(state, batch)
+        return [future.result() for future in futures]
+
+    def load(self, key: typing.Hashable) -> typing.Any:
+        """Load a key, reusing the value already loaded during this render.
+
+        Args:
+            key: key to load.
+
+        Returns:
+            the value.
+
+        """
+        return self.load_many([key])[0]
+
+    async def aload_many(
+        self, keys: typing.Iterable[typing.Hashable]
+    ) -> list[typing.Any]:
+        """Load several keys from inside an event loop.
+
+        Keys requested by every task before the loop next runs its callbacks,
+        e.g. by the children of `gather_layouts`, are loaded in one batch.
+
+        Args:
+            keys: keys to load.
+
+        Returns:
+            the values, in the order of `keys`.
+
+        """
+        state = self._state()
+        loop = asyncio.get_running_loop()
+        with state.lock:
+            futures = self._enqueue(state, keys)
+            schedule = bool(state.queued) and not state.scheduled
+            state.scheduled = state.scheduled or schedule
+        if schedule:
+            loop.call_soon(self._flush, state, loop)
+        return list(await asyncio.gather(*(asyncio.wrap_future(f) for f in futures)))
+
+    async def aload(self, key: typing.Hashable) -> typing.Any:
+        """Load a key from inside an event loop, batched with concurrent loads.
+
+        Args:
+            key: key to load.
+
+        Returns:
+            the value.
+
+        """
+        return (await self.aload_many([key]))[0]
+
+    def _flush(self, state: _LoaderState, loop: asyncio.AbstractEventLoop) -> None:
+        """Dispatch the keys queued during the current loop iteration."""
+        with state.lock:
+            batches = self._take_queue(state)
+        for batch in batches:
+            loop.create_task(self._adispatch(state, batch))
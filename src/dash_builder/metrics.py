@@ -0,0 +1,226 @@
+"""Module containing per-class render instrumentation for `DashObject` layouts."""
+
+import bisect
+import threading
+import typing
+
+from dash.development.base_component import Component
+
+__all__ = ["RenderMetrics", "count_components", "render_metrics"]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Default upper bounds, in seconds, of the render latency histogram."""
+
+
+def count_components(layout: typing.Any) -> int:
+    """Count the Dash components in a layout.
+
+    Args:
+        layout: component, list of components or other layout value.
+
+    Returns:
+        number of components in the tree.
+
+    """
+    if isinstance(layout, Component):
+        return 1 + sum(1 for _ in layout._traverse())
+    if isinstance(layout, (list, tuple)):
+        return sum(count_components(item) for item in layout)
+    return 0
+
+
+class _Series:
+    """Counters and histograms for a single view or page name."""
+
+    __slots__ = ("renders", "errors", "buckets", "seconds", "components", "measured")
+
+    def __init__(self, size: int):
+        self.renders: int = 0
+        self.errors: int = 0
+        self.buckets: list[int] = [0] * size
+        self.seconds: float = 0.0
+        self.components: int = 0
+        self.measured: int = 0
+
+
+class RenderMetrics:
+    """Registry of render counts, error counts, latencies and tree sizes.
+
+    Instrumentation is disabled by default and costs a single attribute check
+    per `layout` call until `enable` is called. Tree sizes are only measured on
+    renders, not on layouts served from the layout cache.
+
+    # Example
+    ```python
+    from dash_builder.metrics import render_metrics
+
+    render_metrics.enable()
+    render_metrics.register_endpoint(app)
+    ```
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS):
+        """Create a metrics registry.
+
+        Args:
+            buckets: upper bounds, in seconds, of the latency histogram.
+
+        """
+        self.enabled: bool = False
+        """Whether `DashObject.layout` calls are being measured."""
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        """Upper bounds, in seconds, of the latency histogram."""
+        self._series: dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start measuring `layout` calls."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop measuring `layout` calls."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discard all recorded measurements."""
+        with self._lock:
+            self._series.clear()
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        ok: bool,
+        layout: typing.Any,
+        cached: bool = False,
+    ) -> None:
+        """Record a single `layout` call.
+
+        Args:
+            name: `name()` of the rendered class.
+            seconds: wall-clock duration of the call.
+            ok: `False` if the render fell back to `error_container`.
+            layout: the rendered layout, used to measure the tree size.
+            cached: whether the layout was served from the layout cache, in which
+                case its size, measured when it was rendered, is not counted.
+
+        """
+        size = 0 if cached else count_components(layout)
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series(len(self.buckets) + 1)
+            series.renders += 1
+            series.errors += not ok
+            series.buckets[index] += 1
+            series.seconds += seconds
+            if not cached:
+                series.components += size
+                series.measured += 1
+
+    def snapshot(self) -> dict[str, dict[str, typing.Any]]:
+        """Return a copy of the recorded measurements, keyed by class `name()`."""
+        with self._lock:
+            return {
+                name: {
+                    "renders": series.renders,
+                    "errors": series.errors,
+                    "seconds": series.seconds,
+                    "components": series.components,
+                    "measured": series.measured,
+                    "buckets": dict(zip((*self.buckets, float("inf")), series.buckets)),
+                }
+                for name, series in self._series.items()
+            }
+
+    def to_prometheus(self) -> str:
+        """Render the measurements in the Prometheus text exposition format.
+
+        The samples of each metric family are grouped under its `HELP` and `TYPE`
+        lines, as the format requires.
+        """
+        renders, errors, seconds, components = [], [], [], []
+        for name, series in self.snapshot().items():
+            label = f'view="{name}"'
+            renders.append(f"dash_builder_renders_total{{{label}}} {series['renders']}")
+            errors.append(
+                f"dash_builder_render_errors_total{{{label}}} {series['errors']}"
+            )
+            cumulative = 0
+            for bound, count in series["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                seconds.append(
+                    f'dash_builder_render_seconds_bucket{{{label},le="{le}"}} '
+                    f"{cumulative}"
+                )
+            seconds.append(
+                f"dash_builder_render_seconds_sum{{{label}}} {series['seconds']}"
+            )
+            seconds.append(
+                f"dash_builder_render_seconds_count{{{label}}} {series['renders']}"
+            )
+            components.append(
+                f"dash_builder_render_components_sum{{{label}}} {series['components']}"
+            )
+            components.append(
+                f"dash_builder_render_components_count{{{label}}} {series['measured']}"
+            )
+        families = [
+            ("renders_total", "counter", "Number of layout renders.", renders),
+            (
+                "render_errors_total",
+                "counter",
+                "Number of failed layout renders.",
+                errors,
+            ),
+            ("render_seconds", "histogram", "Layout render latency.", seconds),
+            (
+                "render_components",
+                "summary",
+                "Components per rendered layout.",
+                components,
+            ),
+        ]
+        lines = []
+        for family, kind, description, samples in families:
+            lines.append(f"# HELP dash_builder_{family} {description}")
+            lines.append(f"# TYPE dash_builder_{family} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def register_endpoint(self, app, path: str = "/metrics") -> None:
+        """Serve the Prometheus text format from the Dash server.
+
+        Args:
+            app: the `dash.Dash` application.
+            path: URL path of the endpoint.
+
+        """
+        app.server.add_url_rule(
+            path,
+            endpoint=f"dash_builder_metrics_{id(self)}",
+            view_func=lambda: (
+                self.to_prometheus(),
+                200,
+                {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+            ),
+        )
+
+
+render_metrics: RenderMetrics = RenderMetrics()
+"""Default registry used by `DashObject.render_metrics`."""
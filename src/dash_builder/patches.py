@@ -0,0 +1,125 @@
+"""Module containing minimal `dash.Patch` updates of component properties."""
+
+import json
+import typing
+
+import dash
+
+__all__ = ["batch_updates", "diff_patch", "to_json"]
+
+MAX_OPERATIONS: int = 64
+"""Number of patch operations above which the full value is sent instead."""
+
+
+def to_json(value: typing.Any) -> typing.Any:
+    """Convert a property value, e.g. components, to its JSON representation.
+
+    Args:
+        value: property value.
+
+    Returns:
+        the value as Dash sends it to the browser.
+
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    from plotly.io.json import to_json_plotly
+
+    return json.loads(to_json_plotly(value))
+
+
+def _is_container_pair(old: typing.Any, new: typing.Any) -> bool:
+    """Whether two values can be patched key by key or item by item."""
+    return (isinstance(old, dict) and isinstance(new, dict)) or (
+        isinstance(old, list) and isinstance(new, list)
+    )
+
+
+def _diff(patch: dash.Patch, old: typing.Any, new: typing.Any) -> None:
+    """Record in `patch` the operations turning container `old` into `new`."""
+    if isinstance(old, dict):
+        for key in [key for key in old if key not in new]:
+            del patch[key]
+        for key, value in new.items():
+            if key not in old:
+                patch[key] = value
+            elif old[key] != value:
+                if _is_container_pair(old[key], value):
+                    _diff(patch[key], old[key], value)
+                else:
+                    patch[key] = value
+        return
+
+    for index in range(len(old) - 1, len(new) - 1, -1):
+        del patch[index]
+    for index, (before, after) in enumerate(zip(old, new)):
+        if before != after:
+            if _is_container_pair(before, after):
+                _diff(patch[index], before, after)
+            else:
+                patch[index] = after
+    if len(new) > len(old):
+        patch.extend(new[len(old) :])
+
+
+def diff_patch(
+    old: typing.Any, new: typing.Any, max_operations: int = MAX_OPERATIONS
+) -> typing.Any:
+    """Return the smallest update turning a property value into another.
+
+    Args:
+        old: current value of the property, as received from a `State`.
+        new: desired value of the property; components are serialized first.
+        max_operations: number of operations above which `new` is returned.
+
+    Returns:
+        `dash.no_update` if the values are equal, a `dash.Patch` of the changed
+        keys and items if both are dictionaries or lists, otherwise `new`.
+
+    """
+    new = to_json(new)
+    if old == new:
+        return dash.no_update
+    if not _is_container_pair(old, new):
+        return new
+    patch = dash.Patch()
+    _diff(patch, old, new)
+    if len(patch._operations) > max_operations:
+        return new
+    return patch
+
+
+def batch_updates(
+    ids: list[dict],
+    current: list[typing.Any],
+    compute: typing.Callable[[list], list | dict],
+    max_operations: int = MAX_OPERATIONS,
+) -> list[typing.Any]:
+    """Compute the outputs of an `ALL` pattern-matching callback in one call.
+
+    Args:
+        ids: component IDs matched by the `ALL` output, e.g. from a
+            `State(..., "id")` on the same pattern.
+        current: current values of the output property, in the same order.
+        compute: function receiving the list of indices and returning the new
+            values, either as a list in the same order or as a dictionary keyed
+            by index; indices missing from a dictionary are left unchanged.
+        max_operations: number of operations above which the full value is sent.
+
+    Returns:
+        one `dash.no_update`, `dash.Patch` or full value per index.
+
+    """
+    indices = [component_id["index"] for component_id in ids]
+    values = compute(indices)
+    if isinstance(values, dict):
+        values = [values.get(index, dash.no_update) for index in indices]
+    elif len(values) != len(indices):
+        raise ValueError(
+            f"Expected {len(indices)} values for the matched indices, "
+            f"got {len(values)}."
+        )
+    return [
+        value if value is dash.no_update else diff_patch(before, value, max_operations)
+        for before, value in zip(current, values)
+    ]
@@ -0,0 +1,184 @@
+"""Module containing static prerendering of parameterless pages."""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import typing
+from pathlib import Path
+
+from .cache import qualified_name
+from .snapshot import LayoutSnapshot
+
+if typing.TYPE_CHECKING:
+    from .dash_page import DashPage
+    from .index import ProjectIndex
+
+__all__ = [
+    "PrerenderedLayouts",
+    "build_project",
+    "is_parameterless",
+    "prerendered_layouts",
+]
+
+MANIFEST: str = "manifest.json"
+"""File name of the build manifest."""
+
+
+def _file_name(cls: type) -> str:
+    """Return the snapshot file of a page, unique per module-qualified class."""
+    digest = hashlib.sha256(qualified_name(cls).encode("utf-8")).hexdigest()[:12]
+    return f"{cls.name()}-{digest}.json"
+
+
+def is_parameterless(cls: type["DashPage"]) -> bool:
+    """Check whether a page's `valid_layout` takes no named arguments.
+
+    Args:
+        cls: the page class.
+
+    Returns:
+        `True` if `valid_layout` only accepts `*args`/`**kwargs`.
+
+    """
+    parameters = inspect.signature(cls.valid_layout).parameters.values()
+    variadic = {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}
+    return all(parameter.kind in variadic for parameter in parameters)
+
+
+def _page_classes(module_name: str) -> list[type["DashPage"]]:
+    """Find the concrete `DashPage` subclasses defined in a page module."""
+    from .dash_page import DashPage
+
+    module = sys.modules[module_name]
+    return [
+        obj
+        for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, DashPage)
+        and obj.__module__ == module_name
+        and not inspect.isabstract(obj)
+    ]
+
+
+def build_project(
+    project: Path, output: Path, index: "ProjectIndex | None" = None
+) -> dict[str, typing.Any]:
+    """Prerender every parameterless page of a project.
+
+    Each page is rendered once with no arguments and written to `output` as a
+    serialized snapshot. Pages that fail to render are skipped. The manifest is
+    written last, so a partially written build is never picked up.
+
+    Args:
+        project: project directory containing `app.py`, `pages/` and `views/`.
+        output: build directory.
+        index: refreshed project index; registered page modules it lists as
+            defining no classes are skipped without being inspected.
+
+    Returns:
+        the build manifest.
+
+    """
+    import dash
+
+    from .profiling import load_project
+
+    load_project(project)
+    output.mkdir(parents=True, exist_ok=True)
+    pages: dict[str, dict[str, typing.Any]] = {}
+    classless = set()
+    if index is not None:
+        classless = set(index.module_names("page")) - set(
+            index.module_names("page", classes_only=True)
+        )
+    for module_name, page in dash.page_registry.items():
+        if module_name in classless:
+            continue
+        for cls in _page_classes(module_name):
+            if not is_parameterless(cls):
+                continue
+            rendered, ok = cls._render((), {})
+            if not ok:
+                continue
+            snapshot = LayoutSnapshot.from_layout(rendered)
+            file_name = _file_name(cls)
+            (output / file_name).write_bytes(snapshot.data)
+            pages[qualified_name(cls)] = {
+                "name": cls.name(),
+                "path": page.get("path"),
+                "file": file_name,
+                "etag": snapshot.etag,
+                "size": len(snapshot.data),
+            }
+    manifest = {"version": 1, "pages": pages}
+    temporary = output / f".{MANIFEST}.tmp"
+    temporary.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    os.replace(temporary, output / MANIFEST)
+    return manifest
+
+
+class PrerenderedLayouts:
+    """Registry of prerendered page snapshots served by `DashPage.layout`.
+
+    # Example
+    ```python
+    from dash_builder.prerender import prerendered_layouts
+
+    prerendered_layouts.load("build")
+    ```
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._snapshots: dict[str, LayoutSnapshot] = {}
+
+    def __len__(self) -> int:
+        """Return the number of prerendered pages."""
+        return len(self._snapshots)
+
+    def load(self, directory: str | Path) -> int:
+        """Load the snapshots of a `dash build` output directory.
+
+        Args:
+            directory: build directory containing `manifest.json`.
+
+        Raises:
+            `ValueError`: if a snapshot does not match its manifest hash.
+
+        Returns:
+            number of pages loaded.
+
+        """
+        directory = Path(directory)
+        manifest = json.loads((directory / MANIFEST).read_text())
+        snapshots = {}
+        for key, entry in manifest["pages"].items():
+            snapshot = LayoutSnapshot((directory / entry["file"]).read_bytes())
+            if snapshot.etag != entry["etag"]:
+                raise ValueError(f"Prerendered layout {entry['file']} is corrupted.")
+            snapshots[key] = snapshot
+        self._snapshots = snapshots
+        return len(snapshots)
+
+    def get(self, cls: type) -> LayoutSnapshot | None:
+        """Return the prerendered snapshot of a page class, if any.
+
+        Args:
+            cls: the page class.
+
+        Returns:
+            the `LayoutSnapshot`, or `None`.
+
+        """
+        if not self._snapshots:
+            return None
+        return self._snapshots.get(qualified_name(cls))
+
+    def clear(self) -> None:
+        """Forget all prerendered snapshots."""
+        self._snapshots = {}
+
+
+prerendered_layouts: PrerenderedLayouts = PrerenderedLayouts()
+"""Registry consulted by `DashPage.layout`."""
@@ -0,0 +1,243 @@
+"""Module containing render profiling for pages and views of a dash project."""
+
+import cProfile
+import importlib
+import inspect
+import math
+import pkgutil
+import pstats
+import sys
+import time
+import tracemalloc
+import types
+import typing
+from pathlib import Path
+
+import dash
+
+from .dash_view import DashView
+
+if typing.TYPE_CHECKING:
+    from .index import ProjectIndex
+
+__all__ = [
+    "Hotspot",
+    "ProfileResult",
+    "discover_views",
+    "load_project",
+    "profile_project",
+    "profile_target",
+]
+
+PROJECT_PACKAGES: tuple[str, ...] = ("app", "pages", "views")
+"""Top-level modules of a project, reloaded by `load_project`."""
+
+
+class ProfileResult(typing.NamedTuple):
+    """Render statistics of a single page or view."""
+
+    target: str
+    """Page module or view class name."""
+    kind: str
+    """`page` or `view`."""
+    calls: int
+    """Number of timed `layout` calls."""
+    mean: float
+    """Mean latency in seconds."""
+    p95: float
+    """95th percentile latency in seconds."""
+    allocated: int
+    """Peak bytes allocated by a single call."""
+
+
+class Hotspot(typing.NamedTuple):
+    """Function-level cProfile summary across all profiled renders."""
+
+    function: str
+    """`file:line(function)` label."""
+    calls: int
+    """Number of calls."""
+    own: float
+    """Seconds spent in the function itself."""
+    cumulative: float
+    """Seconds spent in the function and its callees."""
+
+
+def load_project(project: Path, module: str = "app") -> types.ModuleType:
+    """Import a project's app module, registering its pages with Dash.
+
+    Args:
+        project: project directory containing `app.py`, `pages/` and `views/`.
+        module: name of the app module.
+
+    Returns:
+        the imported app module.
+
+    """
+    for name in list(sys.modules):
+        if name.split(".")[0] in {module, *PROJECT_PACKAGES}:
+            del sys.modules[name]
+    root = str(project.resolve())
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    return importlib.import_module(module)
+
+
+def discover_views(
+    package: str = "views", module_names: typing.Iterable[str] | None = None
+) -> list[type[DashView]]:
+    """Find the concrete `DashView` subclasses defined in a project package.
+
+    Args:
+        package: name of the importable views package.
+        module_names: modules to import, e.g. from a `ProjectIndex`, instead of
+            walking every module of the package.
+
+    Returns:
+        list of view classes, sorted by name.
+
+    """
+    if module_names is not None:
+        modules = [importlib.import_module(name) for name in module_names]
+    else:
+        root = importlib.import_module(package)
+        modules = [root]
+        for info in pkgutil.walk_packages(root.__path__, f"{package}."):
+            modules.append(importlib.import_module(info.name))
+    views = {
+        obj
+        for module in modules
+        for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, DashView)
+        and obj.__module__.split(".")[0] == package
+        and not inspect.isabstract(obj)
+    }
+    return sorted(views, key=lambda view: view.__name__)
+
+
+def profile_target(
+    name: str,
+    kind: str,
+    render: typing.Callable[[], typing.Any],
+    iterations: int,
+    profiler: cProfile.Profile | None = None,
+) -> ProfileResult:
+    """Time repeated calls of a render function.
+
+    Args:
+        name: page module or view class name.
+        kind: `page` or `view`.
+        render: zero-argument callable rendering the layout.
+        iterations: number of timed calls, at least 1.
+        profiler: optional profiler enabled around the timed calls.
+
+    Raises:
+        `ValueError`: if `iterations` is less than 1.
+
+    Returns:
+        `ProfileResult` of the target.
+
+    """
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1.")
+    render()  # warm up imports and caches outside the measurements
+    durations = []
+    for _ in range(iterations):
+        if profiler is not None:
+            profiler.enable()
+        start = time.perf_counter()
+        render()
+        durations.append(time.perf_counter() - start)
+        if profiler is not None:
+            profiler.disable()
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+
+    durations.sort()
+    p95 = durations[max(0, math.ceil(0.95 * len(durations)) - 1)]
+    return ProfileResult(
+        target=name,
+        kind=kind,
+        calls=len(durations),
+        mean=sum(durations) / len(durations),
+        p95=p95,
+        allocated=max(0, peak - baseline),
+    )
+
+
+def _hotspots(profiler: cProfile.Profile, top: int) -> list[Hotspot]:
+    """Summarise the most expensive functions recorded by a profiler.
+
+    Args:
+        profiler: profiler holding the recorded renders.
+        top: number of functions to return.
+
+    Returns:
+        list of `Hotspot` sorted by own time.
+
+    """
+    stats = pstats.Stats(profiler).stats
+    rows = [
+        Hotspot(
+            function=f"{Path(file).name}:{line}({function})",
+            calls=calls,
+            own=own,
+            cumulative=cumulative,
+        )
+        for (file, line, function), (_, calls, own, cumulative, _) in stats.items()
+    ]
+    rows.sort(key=lambda row: row.own, reverse=True)
+    return rows[:top]
+
+
+def profile_project(
+    project: Path,
+    iterations: int = 20,
+    top: int = 10,
+    index: "ProjectIndex | None" = None,
+) -> tuple[list[ProfileResult], list[Hotspot]]:
+    """Profile every registered page and every view of a project.
+
+    Pages are rendered through their module's `layout()` function with no
+    arguments; views through `layout("profile")`.
+
+    Args:
+        project: project directory containing `app.py`, `pages/` and `views/`.
+        iterations: number of timed renders per page and view.
+        top: number of cProfile hotspots to return.
+        index: refreshed project index; only the view modules it lists as
+            defining classes are imported. Every view module if `None`.
+
+    Returns:
+        tuple of per-target results and the overall hotspots.
+
+    """
+    load_project(project)
+    profiler = cProfile.Profile()
+    results = []
+    for module, page in dash.page_registry.items():
+        layout = page["layout"]
+        render = layout if callable(layout) else lambda layout=layout: layout
+        results.append(profile_target(module, "page", render, iterations, profiler))
+    module_names = (
+        None if index is None else index.module_names("view", classes_only=True)
+    )
+    for view in discover_views(module_names=module_names):
+        results.append(
+            profile_target(
+                view.__name__,
+                "view",
+                lambda view=view: view.layout("profile"),
+                iterations,
+                profiler,
+            )
+        )
+    return results, _hotspots(profiler, top)
@@ -0,0 +1,381 @@
+"""Module containing a layout store shared by the processes of a host."""
+
+import contextlib
+import itertools
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import typing
+from pathlib import Path
+
+from .cache import MISSING, content_key, qualified_name
+from .snapshot import LayoutSnapshot
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+__all__ = ["SharedLayoutStore"]
+
+MAGIC: bytes = b"DBLS"
+"""Leading bytes of a shared layout store file."""
+
+VERSION: int = 2
+"""File format version."""
+
+COMPACT_RATIO: float = 2.0
+"""Ratio of appended to live bytes above which a write compacts the store."""
+
+COMPACT_MIN_BYTES: int = 1 << 20
+"""Size of the appended records below which the store is never compacted."""
+
+_HEADER = struct.Struct("<4sIQ")
+"""Magic, format version and end offset of the committed records."""
+
+_RECORD = struct.Struct("<BIIQ")
+"""Kind, key length, content hash length and data length of a record."""
+
+_SET, _DELETE = 0, 1
+"""Kinds of records: an entry stored under a key, or the removal of a key."""
+
+
+class _Mapping:
+    """Read-only memory map of one version of the store file and its index."""
+
+    __slots__ = ("identity", "index", "view", "end", "live", "_mmap")
+
+    def __init__(self, identity: int, file: typing.BinaryIO):
+        self.identity = identity
+        self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self._mmap)
+        try:
+            magic, version, _ = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic, version = None, None
+        if magic != MAGIC or version != VERSION:
+            self.view.release()
+            self._mmap.close()
+            raise ValueError(f"{file.name} is not a version {VERSION} layout store.")
+        self.index: dict[str, tuple[int, int, str]] = {}
+        self.end: int = _HEADER.size
+        self.live: int = 0
+
+    def committed(self) -> int:
+        """Return the end offset of the records committed by writers."""
+        return _HEADER.unpack_from(self._mmap)[2]
+
+    def refresh(self, file: typing.BinaryIO) -> None:
+        """Index the records committed since the last refresh."""
+        end = self.committed()
+        if end > len(self._mmap):
+            # Snapshots served from the previous map keep it alive until they
+            # are released.
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self._mmap)
+            end = self.committed()
+        offset = self.end
+        while offset < end:
+            start = offset
+            kind, key_size, etag_size, size = _RECORD.unpack_from(self._mmap, offset)
+            offset += _RECORD.size
+            key = self._mmap[offset : offset + key_size].decode("utf-8")
+            offset += key_size
+            etag = self._mmap[offset : offset + etag_size].decode("ascii")
+            offset += etag_size
+            previous = self.index.pop(key, None)
+            if previous is not None:
+                self.live -= _RECORD.size + key_size + len(previous[2]) + previous[1]
+            if kind == _SET:
+                self.index[key] = (offset, size, etag)
+                self.live += offset + size - start
+            offset += size
+        self.end = end
+
+    def blob(self, key: str) -> tuple[memoryview, str] | None:
+        """Return a zero-copy view of an entry's bytes and its content hash."""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, length, etag = entry
+        return self.view[offset : offset + length], etag
+
+
+class SharedLayoutStore:
+    """Layout cache stored in a memory-mapped file shared by every worker.
+
+    The store file is an append-only log of serialized layouts and removals.
+    Readers map the file and index the records as they are committed, serving
+    `LayoutSnapshot`s from the OS page cache, so one copy of every layout is
+    kept per host rather than per worker. A write appends its records under a
+    lock and then advances the committed end offset in the header, so readers
+    never observe a partially written entry and the cost of a write scales with
+    the size of the entry. Once superseded records dominate the file, the live
+    entries are rewritten to a new file published with an atomic rename.
+
+    The store implements the `LayoutCache` interface and can be assigned to
+    `layout_cache` or `snapshot_cache`; layouts are returned as `LayoutSnapshot`s
+    both when rendered and when found. Found snapshots are not copied: their
+    `data` is a `memoryview` of the mapped file. Committed records are never
+    modified and a view keeps its mapping open, so it stays valid after the
+    store is compacted or republished, keeping the replaced file in memory for
+    as long as it is referenced. Entries are keyed by the module-qualified
+    class name and a content hash of the JSON-serializable `layout` arguments.
+    Appends are not synced to disk, so the file belongs on a memory-backed
+    filesystem.
+
+    # Example
+    ```python
+    from dash_builder import DashPage
+    from dash_builder.shared import SharedLayoutStore
+
+
+    class ReportPage(DashPage):
+        snapshot_cache = SharedLayoutStore("/dev/shm/reports.layouts")
+    ```
+    """
+
+    def __init__(self, path: str | Path, maxsize: int | None = None):
+        """Create a store backed by a file, which is created when first written.
+
+        Args:
+            path: store file, ideally on a memory-backed filesystem such as
+                `/dev/shm`.
+            maxsize: maximum number of entries kept when writing, `None` for
+                unbounded.
+
+        """
+        self.path: Path = Path(path)
+        """Store file shared by the workers."""
+        self.maxsize: int | None = maxsize
+        """Maximum number of entries kept when writing."""
+        self.hits: int = 0
+        """Number of lookups served from the store by this process."""
+        self.misses: int = 0
+        """Number of lookups by this process that required a render."""
+        self._lock = threading.RLock()
+        self._mapping: _Mapping | None = None
+
+    def __len__(self) -> int:
+        """Return the number of layouts in the published store."""
+        mapping = self._current()
+        return 0 if mapping is None else len(mapping.index)
+
+    def _current(self) -> _Mapping | None:
+        """Return the mapping of the store file, indexing newly committed records."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        mapping = self._mapping
+        if (
+            mapping is not None
+            and mapping.identity == stat.st_ino
+            and mapping.end == mapping.committed()
+        ):
+            return mapping
+        with self._lock:
+            try:
+                with open(self.path, "rb") as file:
+                    identity = os.fstat(file.fileno()).st_ino
+                    mapping = self._mapping
+                    if mapping is None or mapping.identity != identity:
+                        mapping = _Mapping(identity, file)
+                    mapping.refresh(file)
+                    self._mapping = mapping
+            except FileNotFoundError:
+                return None
+            return mapping
+
+    def make_key(self, cls: type, args: tuple, kwargs: dict) -> str | None:
+        """Build the store key for a `layout` call.
+
+        Args:
+            cls: the `DashObject` subclass being rendered.
+            args: positional arguments passed to `layout`.
+            kwargs: keyword arguments passed to `layout`.
+
+        Returns:
+            `<module>.<qualname>/<hash>` key, or `None` if the arguments are
+            not JSON data.
+
+        """
+        return content_key(cls, args, kwargs)
+
+    def get(self, key: str) -> LayoutSnapshot | typing.Any:
+        """Look up a layout and record a hit or miss.
+
+        Args:
+            key: key produced by `make_key`.
+
+        Returns:
+            the stored `LayoutSnapshot`, whose `data` is a zero-copy view of the
+            mapped file, or `MISSING`.
+
+        """
+        mapping = self._current()
+        blob = None if mapping is None else mapping.blob(key)
+        with self._lock:
+            if blob is None:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+        view, etag = blob
+        return LayoutSnapshot(view, etag=etag)
+
+    def set(self, key: str, value: typing.Any) -> LayoutSnapshot:
+        """Append a layout to the store, evicting the oldest entries beyond `maxsize`.
+
+        Args:
+            key: key produced by `make_key`.
+            value: `LayoutSnapshot` or rendered layout, serialized if needed.
+
+        Returns:
+            the stored `LayoutSnapshot`, to be served in place of the layout.
+
+        """
+        if not isinstance(value, LayoutSnapshot):
+            value = LayoutSnapshot.from_layout(value)
+        with self._write_lock():
+            mapping = self._current()
+            index = {} if mapping is None else mapping.index
+            records = []
+            if self.maxsize is not None:
+                excess = len(index) + (key not in index) - self.maxsize
+                stale = (name for name in index if name != key)
+                records = [
+                    (_DELETE, name, "", b"")
+                    for name in itertools.islice(stale, max(0, excess))
+                ]
+            records.append((_SET, key, value.etag, value.data))
+            self._append(records)
+        return value
+
+    def publish(self, snapshots: typing.Mapping[str, LayoutSnapshot]) -> None:
+        """Atomically replace the whole store, e.g. after a rebuild.
+
+        Args:
+            snapshots: the new entries, keyed as by `make_key`.
+
+        """
+        with self._write_lock():
+            self._write(
+                {
+                    key: (memoryview(snapshot.data), snapshot.etag)
+                    for key, snapshot in snapshots.items()
+                }
+            )
+
+    def invalidate(self, cls: type | None = None) -> int:
+        """Remove stored layouts.
+
+        Args:
+            cls: only remove layouts rendered by this class, or all if `None`.
+
+        Returns:
+            number of entries removed.
+
+        """
+        with self._write_lock():
+            mapping = self._current()
+            if mapping is None:
+                return 0
+            prefix = None if cls is None else f"{qualified_name(cls)}/"
+            removed = [
+                key for key in mapping.index if prefix is None or key.startswith(prefix)
+            ]
+            if cls is None:
+                self._write({})
+            elif removed:
+                self._append([(_DELETE, key, "", b"") for key in removed])
+            return len(removed)
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters of this process and current size of the store."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {"hits": hits, "misses": misses, "size": len(self)}
+
+    def _entries(self) -> dict[str, tuple[memoryview, str]]:
+        """Return zero-copy views of the entries of the published store."""
+        mapping = self._current()
+        if mapping is None:
+            return {}
+        return {key: mapping.blob(key) for key in mapping.index}
+
+    @contextlib.contextmanager
+    def _write_lock(self) -> typing.Iterator[None]:
+        """Serialize writers across threads and, where supported, processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(f"{self.path}.lock", "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _append(self, records: list[tuple[int, str, str, bytes]]) -> None:
+        """Append records and commit them; call with the write lock held."""
+        if self._current() is None:
+            self._write({})
+        with open(self.path, "r+b") as file:
+            end = _HEADER.unpack(file.read(_HEADER.size))[2]
+            file.seek(end)
+            end += _write_records(file, records)
+            # Records are in the page cache before the header points past them.
+            file.flush()
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, VERSION, end))
+        mapping = self._current()
+        appended = mapping.end - _HEADER.size
+        if appended > COMPACT_MIN_BYTES and appended > COMPACT_RATIO * mapping.live:
+            self._write(self._entries())
+
+    def _write(self, entries: dict[str, tuple[memoryview, str]]) -> None:
+        """Write the entries to a new store file and atomically rename it into place."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                records = [
+                    (_SET, key, etag, view) for key, (view, etag) in entries.items()
+                ]
+                end = _HEADER.size + _write_records(file, records, _HEADER.size)
+                file.seek(0)
+                file.write(_HEADER.pack(MAGIC, VERSION, end))
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, self.path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temporary)
+            raise
+
+
+def _write_records(
+    file: typing.BinaryIO,
+    records: typing.Iterable[tuple[int, str, str, typing.Any]],
+    start: int | None = None,
+) -> int:
+    """Write records at the current position, or at `start`; return their size."""
+    if start is not None:
+        file.seek(start)
+    written = 0
+    for kind, key, etag, data in records:
+        key_bytes, etag_bytes = key.encode("utf-8"), etag.encode("ascii")
+        written += file.write(
+            _RECORD.pack(kind, len(key_bytes), len(etag_bytes), len(data))
+        )
+        written += file.write(key_bytes)
+        written += file.write(etag_bytes)
+        written += file.write(data)
+    return written
@@ -0,0 +1,206 @@
+"""Module containing precompiled layout templates with per-request holes."""
+
+import copy
+import re
+import typing
+
+from dash.development.base_component import Component
+
+from .cache import MISSING
+from .snapshot import LayoutSnapshot
+
+__all__ = ["Hole", "LayoutTemplate"]
+
+HOLE_NAME_REGEX = re.compile(r"^[\w.-]+$")
+"""Allowed hole names; they are embedded in the serialized skeleton."""
+
+HOLE_MARKER_REGEX = re.compile(r'"\\u0000dash-builder-hole:([\w.-]+)\\u0000"')
+"""Serialized form of a `Hole` in the JSON of a skeleton."""
+
+
+class Hole:
+    """Marker for a prop or child of a skeleton filled on every request.
+
+    # Example
+    ```python
+    dmc.Title(Hole("title"), order=2)
+    html.Div(Hole("body"), style={"color": Hole("colour", default="black")})
+    ```
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default: typing.Any = MISSING):
+        """Create a hole.
+
+        Args:
+            name: name of the value filling the hole.
+            default: value used when none is given, required if `MISSING`.
+
+        Raises:
+            `ValueError`: if the name contains characters other than letters,
+                digits, `_`, `.` and `-`.
+
+        """
+        if not HOLE_NAME_REGEX.match(name):
+            raise ValueError(f"Invalid hole name '{name}'.")
+        self.name: str = name
+        """Name of the value filling the hole."""
+        self.default: typing.Any = default
+        """Value used when none is given, `MISSING` if required."""
+
+    def __repr__(self) -> str:
+        """Represent the hole by its name."""
+        return f"Hole({self.name!r})"
+
+    def to_plotly_json(self) -> str:
+        """Serialize the hole as the marker string located by `LayoutTemplate`."""
+        return f"\x00dash-builder-hole:{self.name}\x00"
+
+
+class _Node(typing.NamedTuple):
+    """Part of a skeleton on the path from the root to one or more holes."""
+
+    value: typing.Any
+    """The component, list or dictionary of the skeleton."""
+    children: tuple[tuple[typing.Any, typing.Any], ...]
+    """`(key, compiled)` pairs of the props, keys or indices holding holes."""
+
+
+def _compile(value: typing.Any, holes: dict[str, Hole]) -> typing.Any:
+    """Return the hole, a `_Node` or `None` if `value` contains no holes."""
+    if isinstance(value, Hole):
+        holes.setdefault(value.name, value)
+        return value
+    if isinstance(value, Component):
+        items = value.to_plotly_json()["props"].items()
+    elif isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple)):
+        items = enumerate(value)
+    else:
+        return None
+    children = tuple(
+        (key, compiled)
+        for key, child in items
+        if (compiled := _compile(child, holes)) is not None
+    )
+    return _Node(value, children) if children else None
+
+
+def _fill(compiled: typing.Any, values: dict[str, typing.Any]) -> typing.Any:
+    """Copy the path from `compiled` to its holes, filling them from `values`."""
+    if isinstance(compiled, Hole):
+        return values[compiled.name]
+    value = compiled.value
+    if isinstance(value, Component):
+        filled = copy.copy(value)
+        for prop, child in compiled.children:
+            setattr(filled, prop, _fill(child, values))
+        return filled
+    filled = dict(value) if isinstance(value, dict) else list(value)
+    for key, child in compiled.children:
+        filled[key] = _fill(child, values)
+    return filled if not isinstance(value, tuple) else tuple(filled)
+
+
+class LayoutTemplate:
+    """Layout whose static structure is compiled once and whose holes are filled.
+
+    `fill` copies only the components, lists and dictionaries between the root
+    and the holes, sharing every static subtree. `snapshot` splices the
+    serialized values into the skeleton's JSON, serialized once, so its cost
+    scales with the size of the values rather than of the whole layout.
+
+    # Example
+    ```python
+    template = LayoutTemplate(
+        dmc.AppShell([HeaderView.layout("header"), dmc.AppShellMain(Hole("main"))])
+    )
+    template.fill(main=ReportView.layout("report"))
+    template.snapshot(main=ReportView.layout("report"))
+    ```
+    """
+
+    def __init__(self, skeleton: typing.Any):
+        """Compile a skeleton.
+
+        Args:
+            skeleton: component tree containing `Hole` markers.
+
+        """
+        from plotly.io.json import to_json_plotly
+
+        self.holes: dict[str, Hole] = {}
+        """Holes of the skeleton keyed by name."""
+        self._compiled: typing.Any = _compile(skeleton, self.holes)
+        self._skeleton: typing.Any = skeleton
+
+        text = to_json_plotly(skeleton)
+        self._chunks: list[bytes] = []
+        self._order: list[str] = []
+        position = 0
+        for match in HOLE_MARKER_REGEX.finditer(text):
+            self._chunks.append(text[position : match.start()].encode("utf-8"))
+            self._order.append(match.group(1))
+            position = match.end()
+        self._chunks.append(text[position:].encode("utf-8"))
+
+    def _values(self, values: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        """Complete `values` with the defaults, checking every hole is filled."""
+        unknown = values.keys() - self.holes.keys()
+        if unknown:
+            raise ValueError(f"Unknown holes: {', '.join(sorted(unknown))}.")
+        filled = dict(values)
+        for name, hole in self.holes.items():
+            if name not in filled:
+                if hole.default is MISSING:
+                    raise ValueError(f"Missing value for hole '{name}'.")
+                filled[name] = hole.default
+        return filled
+
+    def fill(self, **values: typing.Any) -> typing.Any:
+        """Return the component tree with its holes filled.
+
+        Args:
+            **values: values of the holes, keyed by name.
+
+        Raises:
+            `ValueError`: if a required hole has no value or a name is unknown.
+
+        Returns:
+            the layout, sharing its static subtrees with the skeleton.
+
+        """
+        values = self._values(values)
+        if self._compiled is None:
+            return self._skeleton
+        return _fill(self._compiled, values)
+
+    def snapshot(self, **values: typing.Any) -> LayoutSnapshot:
+        """Return the serialized layout with its holes filled.
+
+        Args:
+            **values: values of the holes, keyed by name.
+
+        Raises:
+            `ValueError`: if a required hole has no value or a name is unknown.
+
+        Returns:
+            `LayoutSnapshot` of the layout.
+
+        """
+        from plotly.io.json import to_json_plotly
+
+        values = self._values(values)
+        encoded = {
+            name: value.data
+            if isinstance(value, LayoutSnapshot)
+            else to_json_plotly(value).encode("utf-8")
+            for name, value in values.items()
+        }
+        parts = [self._chunks[0]]
+        for name, chunk in zip(self._order, self._chunks[1:]):
+            parts.append(encoded[name])
+            parts.append(chunk)
+        return LayoutSnapshot(b"".join(parts))
@@ -0,0 +1,116 @@
+"""Module containing pre-serialized layout snapshots."""
+
+import hashlib
+import json
+import typing
+
+if typing.TYPE_CHECKING:
+    import dash
+
+__all__ = ["LayoutSnapshot", "serve_snapshots"]
+
+
+class LayoutSnapshot:
+    """Layout serialized once with Plotly's JSON encoder.
+
+    Snapshots can be returned anywhere Dash expects a layout. Apps set up with
+    `serve_snapshots` send the app layout straight from `data`; elsewhere, e.g.
+    in callback outputs, Dash encodes them through `to_plotly_json`, which hands
+    back plain, pre-decoded JSON data instead of walking a component tree.
+
+    # Example
+    ```python
+    def layout(**kwargs):
+        return HomePage.snapshot(**kwargs)
+    ```
+    """
+
+    __slots__ = ("data", "etag", "_payload")
+
+    def __init__(self, data: bytes | memoryview, etag: str | None = None):
+        """Create a snapshot from serialized layout bytes.
+
+        Args:
+            data: UTF-8 encoded JSON of the layout, as bytes or a read-only view,
+                e.g. of a `SharedLayoutStore` file.
+            etag: precomputed content hash of `data`, hashed if `None`.
+
+        """
+        self.data: bytes | memoryview = data
+        """UTF-8 encoded JSON of the layout."""
+        self.etag: str = hashlib.sha256(data).hexdigest() if etag is None else etag
+        """SHA-256 content hash of `data`."""
+        self._payload: typing.Any = None
+
+    @classmethod
+    def from_layout(cls, layout: typing.Any) -> "LayoutSnapshot":
+        """Serialize a layout into a snapshot.
+
+        Args:
+            layout: Dash component tree, or list of components.
+
+        Returns:
+            `LayoutSnapshot` of the layout.
+
+        """
+        from plotly.io.json import to_json_plotly
+
+        return cls(to_json_plotly(layout).encode("utf-8"))
+
+    def to_plotly_json(self) -> typing.Any:
+        """Return the decoded JSON data of the layout for Plotly's JSON encoder."""
+        if self._payload is None:
+            self._payload = json.loads(bytes(self.data))
+        return self._payload
+
+    def _traverse(self) -> typing.Iterator[typing.Any]:
+        """Yield no components to Dash's layout validation, which would decode."""
+        return iter(())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare snapshots by content hash."""
+        if not isinstance(other, LayoutSnapshot):
+            return NotImplemented
+        return self.etag == other.etag
+
+    def __hash__(self) -> int:
+        """Hash of the content hash."""
+        return hash(self.etag)
+
+    def __repr__(self) -> str:
+        """Represent the snapshot by its size and content hash."""
+        return f"LayoutSnapshot(size={len(self.data)}, etag={self.etag[:12]!r})"
+
+
+def serve_snapshots(app: "dash.Dash") -> None:
+    """Serve an app layout returned as a `LayoutSnapshot` from its stored bytes.
+
+    Replaces the Flask view of Dash's `_dash-layout` route, so a snapshot layout
+    is sent without being decoded and encoded again, with its `etag` as the
+    `ETag` header and `304 Not Modified` for clients holding that version.
+    Other layouts are encoded as Dash does.
+
+    # Example
+    ```python
+    app = Dash(__name__)
+    app.layout = lambda: App.snapshot()
+    serve_snapshots(app)
+    ```
+
+    Args:
+        app: the Dash app, served by Flask.
+
+    """
+    import flask
+    from plotly.io.json import to_json_plotly
+
+    def serve_layout():
+        layout = app.get_layout()
+        if not isinstance(layout, LayoutSnapshot):
+            return flask.Response(to_json_plotly(layout), mimetype="application/json")
+        response = flask.Response(bytes(layout.data), mimetype="application/json")
+        response.set_etag(layout.etag)
+        return response.make_conditional(flask.request)
+
+    endpoint = f"{app.config.routes_pathname_prefix}_dash-layout"
+    app.server.view_functions[endpoint] = serve_layout
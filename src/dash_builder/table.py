@@ -0,0 +1,801 @@
+"""Module containing a server-side paginated table view for large datasets."""
+
+import abc
+import math
+import operator
+import re
+import threading
+import typing
+
+from dash import MATCH, Input, Output, State, dash_table, html
+from typing_extensions import override
+
+from .dash_view import DashView
+
+__all__ = [
+    "ArrowRowSource",
+    "ColumnStatistics",
+    "DataFrameRowSource",
+    "DataTableView",
+    "ListRowSource",
+    "RowSource",
+    "TableFilter",
+    "TableQuery",
+    "parse_filter_query",
+    "row_source",
+]
+
+FILTER_PATTERN = re.compile(
+    r"^\{(?P<column>[^}]+)\}\s+(?P<operator>\S+)\s+(?P<value>.+)$"
+)
+
+UNARY_FILTER_PATTERN = re.compile(
+    r"^\{(?P<column>[^}]+)\}\s+is\s+(?P<negated>not\s+)?(?P<operator>blank|nil)$",
+    re.IGNORECASE,
+)
+
+QUOTED_PATTERN = re.compile(r"\"[^\"]*\"|'[^']*'|`[^`]*`")
+"""Quoted filter values, ignored when looking for unsupported `||` operators."""
+
+OPERATORS: dict[str, str] = {
+    "=": "eq",
+    "eq": "eq",
+    "!=": "ne",
+    "ne": "ne",
+    "<": "lt",
+    "lt": "lt",
+    "<=": "le",
+    "le": "le",
+    ">": "gt",
+    "gt": "gt",
+    ">=": "ge",
+    "ge": "ge",
+    "contains": "contains",
+    "datestartswith": "datestartswith",
+}
+"""`DataTable` filter operators mapped to their canonical name."""
+
+
+class TableFilter(typing.NamedTuple):
+    """Single condition of a `DataTable` filter query."""
+
+    column: str
+    """Column ID."""
+    operator: str
+    """`eq`, `ne`, `lt`, `le`, `gt`, `ge`, `contains`, `datestartswith`, or the
+    unary `blank`, `not_blank`, `nil` and `not_nil`."""
+    value: typing.Any
+    """Value compared against, a number if it parses as one, `None` if unary."""
+    case_insensitive: bool = False
+    """Whether string comparisons ignore case (`i` operator prefix)."""
+
+
+class TableQuery(typing.NamedTuple):
+    """Page, sort order and filters requested by a `DataTable`."""
+
+    page_current: int = 0
+    """Zero-based page number."""
+    page_size: int = 50
+    """Number of rows per page."""
+    sort_by: tuple[tuple[str, str], ...] = ()
+    """`(column, "asc" | "desc")` pairs, most significant first."""
+    filters: tuple[TableFilter, ...] = ()
+    """Conditions rows must all satisfy."""
+
+    @property
+    def start(self) -> int:
+        """Index of the first row of the page."""
+        return self.page_current * self.page_size
+
+    @property
+    def stop(self) -> int:
+        """Index after the last row of the page."""
+        return self.start + self.page_size
+
+
+class ColumnStatistics(typing.NamedTuple):
+    """Summary of a column, computed once per dataset version."""
+
+    count: int
+    """Number of non-empty values."""
+    nulls: int
+    """Number of empty values."""
+    minimum: typing.Any = None
+    """Smallest value, `None` if the values are not comparable."""
+    maximum: typing.Any = None
+    """Largest value, `None` if the values are not comparable."""
+
+
+def _parse_value(text: str) -> typing.Any:
+    """Unquote a filter value, or convert it to a number if it is one."""
+    text = text.strip()
+    if len(text) > 1 and text[0] == text[-1] and text[0] in "\"'`":
+        return text[1:-1]
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_filter_query(query: str | None) -> tuple[TableFilter, ...]:
+    """Parse the `filter_query` of a `DataTable` with `filter_action="custom"`.
+
+    Supports conditions such as `{price} >= 10` or `{name} is blank` joined by
+    `&&`. Conditions joined by `||` are rejected.
+
+    Args:
+        query: the filter query.
+
+    Returns:
+        the conditions of the query.
+
+    Raises:
+        `ValueError`: if a condition is not supported.
+
+    """
+    if "||" in QUOTED_PATTERN.sub("", query or ""):
+        raise ValueError("Filter conditions joined by '||' are not supported.")
+    filters = []
+    for part in (query or "").split(" && "):
+        part = part.strip()
+        if not part:
+            continue
+        match = UNARY_FILTER_PATTERN.match(part)
+        if match is not None:
+            negated = "not_" if match["negated"] else ""
+            filters.append(
+                TableFilter(match["column"], negated + match["operator"].lower(), None)
+            )
+            continue
+        match = FILTER_PATTERN.match(part)
+        if match is None:
+            raise ValueError(f"Unsupported filter condition '{part}'.")
+        name = match["operator"].lower()
+        insensitive = name[0] == "i" and name[1:] in OPERATORS
+        if name not in OPERATORS and name[0] in "is" and name[1:] in OPERATORS:
+            name = name[1:]
+        if name not in OPERATORS:
+            raise ValueError(f"Unsupported filter operator '{match['operator']}'.")
+        filters.append(
+            TableFilter(
+                match["column"],
+                OPERATORS[name],
+                _parse_value(match["value"]),
+                insensitive,
+            )
+        )
+    return tuple(filters)
+
+
+@typing.runtime_checkable
+class RowSource(typing.Protocol):
+    """Dataset that sorts, filters and pages its rows for a `DataTableView`."""
+
+    def columns(self) -> list[str]:
+        """Return the column IDs."""
+        ...
+
+    def version(self) -> typing.Hashable | None:
+        """Return a value that changes whenever the rows change, `None` if unknown."""
+        ...
+
+    def fetch(self, query: TableQuery) -> tuple[list[dict], int]:
+        """Return the rows of the requested page and the number of matching rows."""
+        ...
+
+    def statistics(self) -> dict[str, ColumnStatistics]:
+        """Return the statistics of every column."""
+        ...
+
+
+def _statistics(values: typing.Iterable) -> ColumnStatistics:
+    """Compute the statistics of a column in a single pass."""
+    count = nulls = 0
+    minimum = maximum = None
+    comparable = True
+    for value in values:
+        if value is None or value != value:  # NaN
+            nulls += 1
+            continue
+        count += 1
+        if not comparable:
+            continue
+        try:
+            if minimum is None or value < minimum:
+                minimum = value
+            if maximum is None or value > maximum:
+                maximum = value
+        except TypeError:
+            comparable = False
+            minimum = maximum = None
+    return ColumnStatistics(count, nulls, minimum, maximum)
+
+
+_COMPARISONS: dict[str, typing.Callable[[typing.Any, typing.Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+
+
+def _is_nil(value: typing.Any) -> bool:
+    """Whether a cell value is empty: `None` or NaN."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+_UNARY: dict[str, typing.Callable[[typing.Any], bool]] = {
+    "nil": _is_nil,
+    "not_nil": lambda value: not _is_nil(value),
+    "blank": lambda value: _is_nil(value) or value == "",
+    "not_blank": lambda value: not (_is_nil(value) or value == ""),
+}
+
+
+def _sort_key(value: typing.Any) -> tuple:
+    """Sort key ordering numbers before strings before other types."""
+    if isinstance(value, (int, float)):
+        return (0, "", value)
+    if isinstance(value, str):
+        return (1, "", value)
+    return (2, type(value).__name__, value)
+
+
+def _matches(value: typing.Any, condition: TableFilter) -> bool:
+    """Whether a cell value satisfies a filter condition."""
+    if condition.operator in _UNARY:
+        return _UNARY[condition.operator](value)
+    expected = condition.value
+    if condition.operator in ("contains", "datestartswith"):
+        if value is None:
+            return False
+        text, expected = str(value), str(expected)
+        if condition.case_insensitive:
+            text, expected = text.lower(), expected.lower()
+        if condition.operator == "contains":
+            return expected in text
+        return text.startswith(expected)
+    if condition.case_insensitive and isinstance(value, str):
+        value, expected = value.lower(), str(expected).lower()
+    try:
+        return _COMPARISONS[condition.operator](value, expected)
+    except TypeError:
+        return False
+
+
+class ListRowSource:
+    """`RowSource` over a sequence of dictionaries, sorted and filtered in Python."""
+
+    def __init__(
+        self,
+        rows: typing.Sequence[dict],
+        columns: list[str] | None = None,
+        version: typing.Hashable | None = None,
+    ):
+        """Create a row source.
+
+        Args:
+            rows: the rows.
+            columns: column IDs, the keys of the first row by default.
+            version: dataset version, `None` if unknown.
+
+        """
+        self.rows: typing.Sequence[dict] = rows
+        """The rows."""
+        self._columns: list[str] = (
+            list(columns) if columns is not None else list(rows[0] if rows else ())
+        )
+        self._version: typing.Hashable | None = version
+
+    def columns(self) -> list[str]:
+        """Return the column IDs."""
+        return self._columns
+
+    def version(self) -> typing.Hashable | None:
+        """Return the dataset version."""
+        return self._version
+
+    def fetch(self, query: TableQuery) -> tuple[list[dict], int]:
+        """Return the rows of the requested page and the number of matching rows.
+
+        Args:
+            query: page, sort order and filters.
+
+        Returns:
+            tuple of the page rows and the number of matching rows.
+
+        """
+        rows = self.rows
+        if query.filters:
+            rows = [
+                row
+                for row in rows
+                if all(_matches(row.get(f.column), f) for f in query.filters)
+            ]
+        if query.sort_by:
+            rows = list(rows)
+            for column, direction in reversed(query.sort_by):
+                # Stable sorts from the least significant column, empty values last.
+                present = [row for row in rows if not _is_nil(row.get(column))]
+                missing = [row for row in rows if _is_nil(row.get(column))]
+                present.sort(
+                    key=lambda row: _sort_key(row[column]),
+                    reverse=direction == "desc",
+                )
+                rows = present + missing
+        return list(rows[query.start : query.stop]), len(rows)
+
+    def statistics(self) -> dict[str, ColumnStatistics]:
+        """Return the statistics of every column."""
+        return {
+            column: _statistics(row.get(column) for row in self.rows)
+            for column in self._columns
+        }
+
+
+def _scalar(value: typing.Any) -> typing.Any:
+    """Convert a NumPy or Arrow scalar to a Python value, NaN to `None`."""
+    if hasattr(value, "as_py"):
+        value = value.as_py()
+    elif hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class DataFrameRowSource:
+    """`RowSource` over a pandas `DataFrame`, using vectorised pandas operations."""
+
+    def __init__(self, frame: typing.Any, version: typing.Hashable | None = None):
+        """Create a row source.
+
+        Args:
+            frame: the `pandas.DataFrame`.
+            version: dataset version, `None` if unknown.
+
+        """
+        self.frame: typing.Any = frame
+        """The data frame."""
+        self._version: typing.Hashable | None = version
+
+    def columns(self) -> list[str]:
+        """Return the column IDs."""
+        return [str(column) for column in self.frame.columns]
+
+    def version(self) -> typing.Hashable | None:
+        """Return the dataset version."""
+        return self._version
+
+    @staticmethod
+    def _mask(frame: typing.Any, condition: TableFilter) -> typing.Any:
+        """Return the boolean mask of the rows satisfying a condition.
+
+        Comparisons pandas rejects, e.g. of a numeric column with a string, are
+        evaluated value by value like `ListRowSource` does.
+        """
+        series = frame[condition.column]
+        if condition.operator in ("nil", "not_nil", "blank", "not_blank"):
+            mask = series.isna()
+            if condition.operator.endswith("blank"):
+                mask |= series.astype(str) == ""
+            return ~mask if condition.operator.startswith("not_") else mask
+        if condition.operator in ("contains", "datestartswith"):
+            text = series.astype(str)
+            expected = str(condition.value)
+            if condition.case_insensitive:
+                text, expected = text.str.lower(), expected.lower()
+            if condition.operator == "contains":
+                return series.notna() & text.str.contains(expected, regex=False)
+            return series.notna() & text.str.startswith(expected)
+        try:
+            if condition.case_insensitive and series.dtype == object:
+                return getattr(series.str.lower(), condition.operator)(
+                    str(condition.value).lower()
+                )
+            return getattr(series, condition.operator)(condition.value)
+        except TypeError:
+            return series.map(lambda value: _matches(_scalar(value), condition))
+
+    def fetch(self, query: TableQuery) -> tuple[list[dict], int]:
+        """Return the rows of the requested page and the number of matching rows.
+
+        Args:
+            query: page, sort order and filters.
+
+        Returns:
+            tuple of the page rows and the number of matching rows.
+
+        """
+        frame = self.frame
+        for condition in query.filters:
+            frame = frame[self._mask(frame, condition)]
+        if query.sort_by:
+            try:
+                frame = frame.sort_values(
+                    [column for column, _ in query.sort_by],
+                    ascending=[direction == "asc" for _, direction in query.sort_by],
+                    kind="stable",
+                    na_position="last",
+                )
+            except TypeError:
+                # Columns mixing types pandas cannot order, e.g. numbers and text.
+                records = frame.to_dict("records")
+                return ListRowSource(records).fetch(query._replace(filters=()))
+        page = frame.iloc[query.start : query.stop]
+        return page.to_dict("records"), len(frame)
+
+    def statistics(self) -> dict[str, ColumnStatistics]:
+        """Return the statistics of every column."""
+        statistics = {}
+        for column in self.frame.columns:
+            series = self.frame[column]
+            nulls = int(series.isna().sum())
+            try:
+                minimum, maximum = _scalar(series.min()), _scalar(series.max())
+            except TypeError:
+                minimum = maximum = None
+            statistics[str(column)] = ColumnStatistics(
+                len(series) - nulls, nulls, minimum, maximum
+            )
+        return statistics
+
+
+class ArrowRowSource:
+    """`RowSource` over a `pyarrow.Table`, using Arrow compute kernels."""
+
+    def __init__(self, table: typing.Any, version: typing.Hashable | None = None):
+        """Create a row source.
+
+        Args:
+            table: the `pyarrow.Table`.
+            version: dataset version, `None` if unknown.
+
+        """
+        self.table: typing.Any = table
+        """The Arrow table."""
+        self._version: typing.Hashable | None = version
+
+    def columns(self) -> list[str]:
+        """Return the column IDs."""
+        return list(self.table.column_names)
+
+    def version(self) -> typing.Hashable | None:
+        """Return the dataset version."""
+        return self._version
+
+    @staticmethod
+    def _mask(table: typing.Any, condition: TableFilter) -> typing.Any:
+        """Return the boolean mask of the rows satisfying a condition.
+
+        Comparisons Arrow has no kernel for, e.g. of a numeric column with a
+        string, are evaluated value by value like `ListRowSource` does.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        column = table[condition.column]
+        if condition.operator in ("nil", "not_nil", "blank", "not_blank"):
+            mask = pc.is_null(column, nan_is_null=True)
+            if condition.operator.endswith("blank") and pa.types.is_string(column.type):
+                mask = pc.or_kleene(mask, pc.equal(column, ""))
+            return pc.invert(mask) if condition.operator.startswith("not_") else mask
+        if condition.operator in ("contains", "datestartswith"):
+            text = pc.cast(column, pa.string())
+            if condition.operator == "contains":
+                return pc.match_substring(
+                    text, str(condition.value), ignore_case=condition.case_insensitive
+                )
+            if condition.case_insensitive:
+                return pc.starts_with(pc.utf8_lower(text), str(condition.value).lower())
+            return pc.starts_with(text, str(condition.value))
+        compare = {
+            "eq": pc.equal,
+            "ne": pc.not_equal,
+            "lt": pc.less,
+            "le": pc.less_equal,
+            "gt": pc.greater,
+            "ge": pc.greater_equal,
+        }[condition.operator]
+        try:
+            if condition.case_insensitive and pa.types.is_string(column.type):
+                return compare(pc.utf8_lower(column), str(condition.value).lower())
+            return compare(column, condition.value)
+        except pa.ArrowException:
+            return pa.array(
+                [_matches(value, condition) for value in column.to_pylist()],
+                pa.bool_(),
+            )
+
+    def fetch(self, query: TableQuery) -> tuple[list[dict], int]:
+        """Return the rows of the requested page and the number of matching rows.
+
+        Args:
+            query: page, sort order and filters.
+
+        Returns:
+            tuple of the page rows and the number of matching rows.
+
+        """
+        table = self.table
+        for condition in query.filters:
+            table = table.filter(self._mask(table, condition))
+        if query.sort_by:
+            table = table.sort_by(
+                [
+                    (column, "ascending" if direction == "asc" else "descending")
+                    for column, direction in query.sort_by
+                ]
+            )
+        page = table.slice(query.start, query.page_size)
+        return page.to_pylist(), table.num_rows
+
+    def statistics(self) -> dict[str, ColumnStatistics]:
+        """Return the statistics of every column."""
+        import pyarrow.compute as pc
+
+        statistics = {}
+        for name in self.table.column_names:
+            column = self.table[name]
+            nulls = column.null_count
+            try:
+                bounds = pc.min_max(column)
+                minimum, maximum = _scalar(bounds["min"]), _scalar(bounds["max"])
+            except (NotImplementedError, TypeError):
+                minimum = maximum = None
+            statistics[name] = ColumnStatistics(
+                len(column) - nulls, nulls, minimum, maximum
+            )
+        return statistics
+
+
+def row_source(data: typing.Any, version: typing.Hashable | None = None) -> RowSource:
+    """Wrap a dataset in the matching `RowSource`.
+
+    pandas and pyarrow are never imported here; data frames and tables are
+    recognised by the module of their type.
+
+    Args:
+        data: a `RowSource`, `pandas.DataFrame`, `pyarrow.Table` or sequence of
+            dictionaries.
+        version: dataset version, `None` if unknown.
+
+    Returns:
+        the `RowSource`.
+
+    """
+    if isinstance(data, RowSource):
+        return data
+    module = type(data).__module__.split(".")[0]
+    if module == "pandas":
+        return DataFrameRowSource(data, version)
+    if module == "pyarrow":
+        return ArrowRowSource(data, version)
+    return ListRowSource(data, version=version)
+
+
+class DataTableView(DashView):
+    """Abstract view of a `DataTable` paged, sorted and filtered on the server.
+
+    Only the visible page is serialized into the layout; page, sort and filter
+    changes are served by a callback registered on the view's `ComponentId`.
+    Subclasses implement `data`, returning the dataset of an `id`. Column
+    statistics, shown as header tooltips, are computed once per dataset version,
+    given by `version` or by a `RowSource` returned from `data`; without one they
+    are recomputed on every render. Unsupported filter conditions and unknown
+    columns show an empty page; errors raised by `data` propagate.
+
+    # Example
+    ```python
+    from dash_builder.table import DataTableView
+
+
+    class OrdersTableView(DataTableView):
+        page_size = 100
+
+        @classmethod
+        def data(cls, id: str):
+            return load_orders(id)  # DataFrame, Arrow table or list of dicts
+
+        @classmethod
+        def version(cls, id: str):
+            return orders_updated_at(id)
+    ```
+    """
+
+    page_size: int = 50
+    """Number of rows per page."""
+    statistics_cache_maxsize: int = 32
+    """Number of datasets whose column statistics are kept per class."""
+
+    _statistics_cache: dict[tuple, dict[str, ColumnStatistics]]
+    """Column statistics keyed by `id` and dataset version."""
+    _statistics_lock: threading.Lock
+    """Lock guarding `_statistics_cache`."""
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the callback serving the pages of the table."""
+        super().__init_subclass__(**kwargs)
+        cls._statistics_cache = {}
+        cls._statistics_lock = threading.Lock()
+        cls._register_table_callback()
+
+    @classmethod
+    def _register_table_callback(cls) -> None:
+        """Register the callback answering page, sort and filter changes."""
+        table = cls.id(MATCH, "table")
+
+        @cls._callback(
+            Output(table, "data"),
+            Output(table, "page_count"),
+            Input(table, "page_current"),
+            Input(table, "page_size"),
+            Input(table, "sort_by"),
+            Input(table, "filter_query"),
+            State(table, "id"),
+            prevent_initial_call=True,
+        )
+        def load_table_page(page_current, page_size, sort_by, filter_query, table_id):
+            try:
+                query = TableQuery(
+                    page_current=page_current or 0,
+                    page_size=page_size or cls.page_size,
+                    sort_by=tuple(
+                        (item["column_id"], item["direction"]) for item in sort_by or ()
+                    ),
+                    filters=parse_filter_query(filter_query),
+                )
+            except (KeyError, TypeError, ValueError):
+                return [], 1
+            source = cls.source(table_id["index"])
+            columns = set(source.columns())
+            queried = {column for column, _ in query.sort_by}
+            queried.update(condition.column for condition in query.filters)
+            if not queried <= columns:
+                return [], 1
+            return cls.page(table_id["index"], query, source)
+
+    @classmethod
+    @abc.abstractmethod
+    def data(cls, id: str) -> typing.Any:
+        """Return the dataset of a table.
+
+        Called on every page request, so expensive loads should be cached.
+
+        Args:
+            id: logical identifier for the component.
+
+        Returns:
+            a `RowSource`, `pandas.DataFrame`, `pyarrow.Table` or sequence of
+            dictionaries.
+
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def version(cls, id: str) -> typing.Hashable | None:
+        """Return the version of a table's dataset, keying its cached statistics.
+
+        Args:
+            id: logical identifier for the component.
+
+        Returns:
+            a value that changes whenever the data changes, `None` if unknown.
+
+        """
+        return None
+
+    @classmethod
+    def source(cls, id: str) -> RowSource:
+        """Return the `RowSource` of a table.
+
+        Args:
+            id: logical identifier for the component.
+
+        Returns:
+            the `RowSource`.
+
+        """
+        return row_source(cls.data(id), cls.version(id))
+
+    @classmethod
+    def page(
+        cls, id: str, query: TableQuery, source: RowSource | None = None
+    ) -> tuple[list[dict], int]:
+        """Return the rows of a page and the number of pages.
+
+        Args:
+            id: logical identifier for the component.
+            query: page, sort order and filters.
+            source: the table's `RowSource`, fetched with `source` if `None`.
+
+        Returns:
+            tuple of the page rows and the page count.
+
+        """
+        source = cls.source(id) if source is None else source
+        rows, total = source.fetch(query)
+        return rows, max(1, math.ceil(total / query.page_size))
+
+    @classmethod
+    def statistics(
+        cls, id: str, source: RowSource | None = None
+    ) -> dict[str, ColumnStatistics]:
+        """Return the column statistics of a table, cached per known dataset version.
+
+        Args:
+            id: logical identifier for the component.
+            source: the table's `RowSource`, fetched with `source` if `None`.
+
+        Returns:
+            statistics keyed by column ID.
+
+        """
+        source = cls.source(id) if source is None else source
+        version = source.version()
+        if version is None:
+            return source.statistics()
+        key = (id, version)
+        with cls._statistics_lock:
+            statistics = cls._statistics_cache.get(key)
+        if statistics is not None:
+            return statistics
+        statistics = source.statistics()
+        with cls._statistics_lock:
+            cache = cls._statistics_cache
+            while cache and len(cache) >= cls.statistics_cache_maxsize:
+                del cache[next(iter(cache))]
+            cache[key] = statistics
+        return statistics
+
+    @staticmethod
+    def _describe(statistics: ColumnStatistics) -> str:
+        """Format column statistics as a header tooltip."""
+        text = f"{statistics.count:,} values, {statistics.nulls:,} empty"
+        if statistics.minimum is not None:
+            text += f", from {statistics.minimum} to {statistics.maximum}"
+        return text
+
+    @override
+    @classmethod
+    def valid_layout(cls, id: str, **kwargs):
+        """Generate the table holding its first page.
+
+        Args:
+            id: logical identifier for the component.
+            kwargs: additional keyword arguments of `dash_table.DataTable`.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        source = cls.source(id)
+        page_size = kwargs.pop("page_size", cls.page_size)
+        rows, page_count = cls.page(id, TableQuery(page_size=page_size), source)
+        statistics = cls.statistics(id, source)
+        return html.Div(
+            dash_table.DataTable(
+                id=cls.id(id, "table"),
+                columns=[{"name": column, "id": column} for column in source.columns()],
+                data=rows,
+                page_action="custom",
+                page_current=0,
+                page_size=page_size,
+                page_count=page_count,
+                sort_action="custom",
+                sort_mode="multi",
+                sort_by=[],
+                filter_action="custom",
+                filter_query="",
+                tooltip_header={
+                    column: cls._describe(summary)
+                    for column, summary in statistics.items()
+                },
+                **kwargs,
+            ),
+            id=cls.id(id),
+        )
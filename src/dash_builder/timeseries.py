@@ -0,0 +1,326 @@
+"""Module containing a downsampling graph view for large time series.
+
+NumPy is required to downsample and is imported on first use.
+"""
+
+import abc
+import typing
+
+import dash
+from dash import MATCH, Input, Output, State, dcc, html
+from typing_extensions import override
+
+from .dash_view import DashView
+
+__all__ = ["DownsampledGraphView", "lttb", "minmax", "visible_range"]
+
+Series = tuple[typing.Any, typing.Any]
+"""`(x, y)` arrays of a trace, `x` sorted ascending."""
+
+
+def _as_float(values: typing.Any) -> typing.Any:
+    """Convert numeric or `datetime64` values to a float array."""
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        values = values.astype("datetime64[ns]").astype(np.int64)
+    return values.astype(np.float64)
+
+
+def lttb(x: typing.Any, y: typing.Any, points: int) -> Series:
+    """Downsample a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    Keeps the first and last points and, from each of `points - 2` buckets, the
+    point forming the largest triangle with the previously kept point and the
+    mean of the next bucket. Bucket means are computed with cumulative sums, so
+    the Python loop only runs once per output point. Missing (`NaN`) y values
+    are left out of the means and never selected unless a bucket holds nothing
+    else.
+
+    Args:
+        x: x values, sorted ascending.
+        y: y values.
+        points: number of points to keep; fewer than 3 keeps the first and last.
+
+    Returns:
+        the downsampled `(x, y)` arrays.
+
+    """
+    import numpy as np
+
+    x, y = np.asarray(x), np.asarray(y)
+    n = len(x)
+    if points >= n:
+        return x, y
+    if points < 3:
+        return x[[0, n - 1]], y[[0, n - 1]]
+    xf, yf = _as_float(x), _as_float(y)
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    starts, stops = edges[:-1], edges[1:]
+    sum_x = np.concatenate(([0.0], np.cumsum(xf)))
+    sum_y = np.concatenate(([0.0], np.nancumsum(yf)))
+    count_y = np.concatenate(([0], np.cumsum(~np.isnan(yf))))
+    sizes = stops - starts
+    counts = count_y[stops] - count_y[starts]
+    mean_x = np.append((sum_x[stops] - sum_x[starts]) / sizes, xf[-1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_y = np.append((sum_y[stops] - sum_y[starts]) / counts, yf[-1])
+
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start, stop = starts[bucket], stops[bucket]
+        px, py = xf[previous], yf[previous]
+        area = np.abs(
+            (px - mean_x[bucket + 1]) * (yf[start:stop] - py)
+            - (px - xf[start:stop]) * (mean_y[bucket + 1] - py)
+        )
+        area[np.isnan(area)] = -np.inf
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return x[selected], y[selected]
+
+
+def minmax(x: typing.Any, y: typing.Any, points: int) -> Series:
+    """Downsample a series to the minimum and maximum of equal-sized buckets.
+
+    Fully vectorised: the series is padded and reshaped to one row per bucket.
+    Preserves spikes that averaging or LTTB may smooth out.
+
+    Args:
+        x: x values, sorted ascending.
+        y: y values.
+        points: number of points to keep, two per bucket.
+
+    Returns:
+        the downsampled `(x, y)` arrays.
+
+    """
+    import numpy as np
+
+    x, y = np.asarray(x), np.asarray(y)
+    n, buckets = len(x), points // 2
+    if points >= n or buckets < 1:
+        return x, y
+    size = -(-n // buckets)
+    values = np.pad(_as_float(y), (0, size * buckets - n), constant_values=np.nan)
+    values = values.reshape(buckets, size)
+    missing = np.isnan(values)
+    offsets = np.arange(buckets) * size
+    lowest = np.where(missing, np.inf, values).argmin(axis=1) + offsets
+    highest = np.where(missing, -np.inf, values).argmax(axis=1) + offsets
+    selected = np.unique(np.concatenate((lowest, highest)))
+    selected = selected[selected < n]
+    return x[selected], y[selected]
+
+
+def visible_range(
+    relayout_data: dict | None,
+) -> tuple[typing.Any, typing.Any] | None:
+    """Extract the x-axis range of a `dcc.Graph` `relayoutData` event.
+
+    Args:
+        relayout_data: the `relayoutData` property.
+
+    Returns:
+        `(start, end)` of a zoom or pan, `(None, None)` when the axis is reset
+        to its full range, or `None` for events not changing the x-axis, such
+        as the `autosize` event sent when the graph is first drawn.
+
+    """
+    if not relayout_data:
+        return None
+    if relayout_data.get("xaxis.autorange"):
+        return (None, None)
+    if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+        return (relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"])
+    if "xaxis.range" in relayout_data:
+        start, end = relayout_data["xaxis.range"]
+        return (start, end)
+    return None
+
+
+def _bound(x: typing.Any, value: typing.Any) -> typing.Any:
+    """Convert a `relayoutData` axis bound to the type of the x values."""
+    import numpy as np
+
+    if x.dtype.kind == "M":
+        return np.datetime64(str(value).replace(" ", "T"), "ns")
+    return float(value)
+
+
+def _window(
+    x: typing.Any, y: typing.Any, x_range: tuple[typing.Any, typing.Any] | None
+) -> Series:
+    """Slice a sorted series to a range, keeping one point beyond each side."""
+    import numpy as np
+
+    x, y = np.asarray(x), np.asarray(y)
+    if x_range is None or x_range == (None, None):
+        return x, y
+    start, end = x_range
+    first = 0
+    if start is not None:
+        first = max(int(np.searchsorted(x, _bound(x, start), "left")) - 1, 0)
+    last = len(x)
+    if end is not None:
+        last = min(int(np.searchsorted(x, _bound(x, end), "right")) + 1, len(x))
+    return x[first:last], y[first:last]
+
+
+class DownsampledGraphView(DashView):
+    """Abstract `dcc.Graph` view sending downsampled series to the browser.
+
+    The full series stay on the server: the figure holds at most `points` points
+    per trace, and zooming or panning re-queries the visible range at full
+    resolution through a callback on the view's `matched_id`. Subclasses
+    implement `series`, returning the traces of an `id`.
+
+    # Example
+    ```python
+    from dash_builder.timeseries import DownsampledGraphView
+
+
+    class LatencyGraphView(DownsampledGraphView):
+        downsample_method = "minmax"
+
+        @classmethod
+        def series(cls, id: str):
+            return {"p99": load_latency(id)}  # (timestamps, values)
+    ```
+    """
+
+    downsample_method: str = "lttb"
+    """`lttb` for visual fidelity or `minmax` to keep every spike."""
+    max_points: int = 2000
+    """Points per trace when the layout is not given a viewport `width`."""
+    points_per_pixel: float = 2.0
+    """Points per trace per pixel of viewport `width`."""
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the callback re-querying the visible range on zoom."""
+        super().__init_subclass__(**kwargs)
+        cls._register_zoom_callback()
+
+    @classmethod
+    def _register_zoom_callback(cls) -> None:
+        """Register the callback answering `relayoutData` events."""
+
+        @cls._callback(
+            Output(cls.matched_id(), "figure"),
+            Input(cls.matched_id(), "relayoutData"),
+            State(cls.id(MATCH, "points"), "data"),
+            State(cls.matched_id(), "id"),
+            prevent_initial_call=True,
+        )
+        def zoom_downsampled_graph(relayout_data, points, graph_id):
+            x_range = visible_range(relayout_data)
+            if x_range is None:
+                return dash.no_update
+            patch = dash.Patch()
+            for index, trace in enumerate(
+                cls.traces(graph_id["index"], x_range, points)
+            ):
+                patch["data"][index]["x"] = trace["x"]
+                patch["data"][index]["y"] = trace["y"]
+            return patch
+
+    @classmethod
+    @abc.abstractmethod
+    def series(cls, id: str) -> dict[str, Series]:
+        """Return the full series of a graph.
+
+        Called on every zoom, so expensive loads should be cached.
+
+        Args:
+            id: logical identifier for the component.
+
+        Returns:
+            `(x, y)` arrays keyed by trace name, `x` sorted ascending.
+
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def figure_layout(cls, id: str) -> dict[str, typing.Any]:
+        """Return the Plotly layout of a graph.
+
+        Args:
+            id: logical identifier for the component.
+
+        Returns:
+            the figure layout.
+
+        """
+        return {}
+
+    @classmethod
+    def downsample(cls, x: typing.Any, y: typing.Any, points: int) -> Series:
+        """Downsample a series with `downsample_method`.
+
+        Args:
+            x: x values, sorted ascending.
+            y: y values.
+            points: number of points to keep.
+
+        Returns:
+            the downsampled `(x, y)` arrays.
+
+        """
+        method = {"lttb": lttb, "minmax": minmax}[cls.downsample_method]
+        return method(x, y, points)
+
+    @classmethod
+    def traces(
+        cls,
+        id: str,
+        x_range: tuple[typing.Any, typing.Any] | None = None,
+        points: int | None = None,
+    ) -> list[dict[str, typing.Any]]:
+        """Return the downsampled traces of the visible range.
+
+        Args:
+            id: logical identifier for the component.
+            x_range: `(start, end)` of the visible range, `None` for all of it.
+            points: points per trace, `max_points` if `None`.
+
+        Returns:
+            Plotly `scattergl` traces.
+
+        """
+        points = points or cls.max_points
+        traces = []
+        for name, (x, y) in cls.series(id).items():
+            x, y = cls.downsample(*_window(x, y, x_range), points)
+            traces.append(
+                {"type": "scattergl", "mode": "lines", "name": name, "x": x, "y": y}
+            )
+        return traces
+
+    @override
+    @classmethod
+    def valid_layout(cls, id: str, width: int | None = None, **kwargs):
+        """Generate the graph of the downsampled series.
+
+        Args:
+            id: logical identifier for the component.
+            width: viewport width in pixels, sizing the number of points.
+            kwargs: additional keyword arguments of `dcc.Graph`.
+
+        Returns:
+            `dash.html.Div` container.
+
+        """
+        points = int(width * cls.points_per_pixel) if width else cls.max_points
+        figure = {
+            "data": cls.traces(id, points=points),
+            "layout": {"uirevision": id, **cls.figure_layout(id)},
+        }
+        return html.Div(
+            [
+                dcc.Graph(id=cls.id(id), figure=figure, **kwargs),
+                dcc.Store(id=cls.id(id, "points"), data=points),
+            ]
+        )
@@ -0,0 +1,322 @@
+"""Tests for the pluggable cache backends."""
+
+import os
+import socketserver
+import threading
+import time
+
+import pytest
+from dash import html
+
+from src.dash_builder import DashPage, DashView, LayoutSnapshot
+from src.dash_builder.backends import (
+    BackendCache,
+    CacheBackendError,
+    FileSystemBackend,
+    MemoryBackend,
+    RedisBackend,
+)
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Serve the subset of Redis commands used by `RedisBackend`."""
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        command = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            command.append(self.rfile.read(length + 2)[:-2])
+        return command
+
+    def write(self, reply):
+        if reply is None:
+            self.wfile.write(b"$-1\r\n")
+        elif isinstance(reply, int):
+            self.wfile.write(b":%d\r\n" % reply)
+        elif isinstance(reply, bytes):
+            self.wfile.write(b"$%d\r\n%s\r\n" % (len(reply), reply))
+        elif isinstance(reply, list):
+            self.wfile.write(b"*%d\r\n" % len(reply))
+            for item in reply:
+                self.write(item)
+        else:
+            self.wfile.write(reply.encode() + b"\r\n")
+
+    def handle(self):
+        data = self.server.data
+        while (command := self.read_command()) is not None:
+            name, *args = command
+            if name == b"GET":
+                expires = self.server.expiry.get(args[0], float("inf"))
+                self.write(data.get(args[0]) if expires > time.monotonic() else None)
+            elif name == b"SET":
+                data[args[0]] = args[1]
+                if args[2:3] == [b"PX"]:
+                    expiry = time.monotonic() + int(args[3]) / 1000
+                    self.server.expiry[args[0]] = expiry
+                self.write("+OK")
+            elif name == b"SADD":
+                data.setdefault(args[0], set()).add(args[1])
+                self.write(1)
+            elif name == b"PEXPIRE":
+                key, expiry = args[0], time.monotonic() + int(args[1]) / 1000
+                current = self.server.expiry.get(key)
+                if key in data and (
+                    (args[2] == b"NX" and current is None)
+                    or (args[2] == b"GT" and current is not None and expiry > current)
+                ):
+                    self.server.expiry[key] = expiry
+                    self.write(1)
+                else:
+                    self.write(0)
+            elif name == b"SMEMBERS":
+                self.write(sorted(data.get(args[0], ())))
+            elif name == b"DEL":
+                self.write(sum(data.pop(key, None) is not None for key in args))
+            else:
+                self.write("-ERR unknown command")
+
+
+@pytest.fixture()
+def redis_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.daemon_threads = True
+    server.data = {}
+    server.expiry = {}
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "filesystem", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend()
+    if request.param == "filesystem":
+        return FileSystemBackend(tmp_path)
+    server = request.getfixturevalue("redis_server")
+    return RedisBackend(*server.server_address)
+
+
+@pytest.fixture()
+def cached_views():
+    class HeaderView(DashView):
+        calls = []
+
+        @classmethod
+        def valid_layout(cls, id, **kwargs):
+            cls.calls.append(id)
+            return html.Header(id)
+
+    class FooterView(HeaderView):
+        cache_tags = ("navigation",)
+
+    return HeaderView, FooterView
+
+
+def test_backend_round_trip_and_tags(backend):
+    backend.set("a", b"1", tags=["x"])
+    backend.set("b", b"2", tags=["x", "y"])
+    backend.set("c", b"3", tags=["y"])
+    assert backend.get("a") == b"1"
+    assert backend.get("missing") is None
+
+    assert backend.invalidate_tags(["x"]) == 2
+    assert backend.get("a") is None and backend.get("b") is None
+    assert backend.get("c") == b"3"
+    assert backend.delete("c") and not backend.delete("c")
+
+
+def test_backend_expiry(backend):
+    backend.set("short", b"1", ttl=0.001)
+    time.sleep(0.01)
+    assert backend.get("short") is None
+
+
+def test_redis_backend_tag_sets_expire(redis_server):
+    backend = RedisBackend(*redis_server.server_address)
+    backend.set("a", b"1", ttl=10, tags=["x"])
+    backend.set("b", b"2", ttl=100, tags=["x"])
+    backend.set("c", b"3", ttl=1, tags=["x"])
+    backend.set("d", b"4", tags=["x"])
+    remaining = redis_server.expiry[b"tag:x"] - time.monotonic()
+    assert 99 < remaining <= 100
+    assert b"persistent-tag:x" not in redis_server.expiry
+    assert backend.invalidate_tags(["x"]) == 4
+    assert redis_server.data == {}
+
+
+def test_memory_backend_lru():
+    backend = MemoryBackend(maxsize=2)
+    backend.set("a", b"1", tags=["t"])
+    backend.set("b", b"2")
+    backend.get("a")
+    backend.set("c", b"3")
+    assert backend.get("b") is None and backend.get("a") == b"1"
+    assert backend.invalidate_tags(["t"]) == 1
+
+
+def test_backend_cache_layouts(backend, cached_views):
+    header, footer = cached_views
+    cache = header.layout_cache = BackendCache(backend)
+    first = header.layout("top")
+    assert isinstance(first, LayoutSnapshot)
+    assert header.layout("top") == first
+    footer.layout("bottom")
+    assert header.calls == ["top", "bottom"]
+
+    assert header.invalidate_layout_cache() == 1
+    assert cache.invalidate_tags("navigation") == 1
+    header.layout("top")
+    footer.layout("bottom")
+    assert header.calls == ["top", "bottom", "top", "bottom"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_backend_cache_data(backend):
+    cache = BackendCache(backend, namespace="test")
+    assert cache.data("prices", lambda: {"a": 1}, tags=["prices"]) == {"a": 1}
+    assert cache.data("prices", lambda: {"a": 2}) == {"a": 1}
+    assert cache.invalidate() == 1
+    assert cache.data("prices", lambda: {"a": 2}) == {"a": 2}
+
+
+def test_backend_cache_survives_unavailable_server(redis_server, cached_views):
+    header, _ = cached_views
+    address = redis_server.server_address
+    redis_server.shutdown()
+    redis_server.server_close()
+    header.layout_cache = BackendCache(RedisBackend(*address, timeout=0.2))
+    assert isinstance(header.layout("top"), LayoutSnapshot)
+    assert header.layout_cache.stats() == {"hits": 0, "misses": 1}
+
+
+def test_redis_backend_errors(redis_server):
+    backend = RedisBackend(*redis_server.server_address)
+    with pytest.raises(CacheBackendError):
+        backend.execute(("FLUSHALL",))
+    assert backend.execute(("GET", "a")) == [None]
+
+
+def test_backend_cache_same_name_classes(backend):
+    def make_page(module: str, title: str) -> type[DashPage]:
+        page = type(
+            "HomePage",
+            (DashPage,),
+            {"valid_layout": classmethod(lambda cls, **kwargs: html.H1(title))},
+        )
+        page.__module__ = module
+        page.layout_cache = cache
+        return page
+
+    cache = BackendCache(backend)
+    first = make_page("pages.a", "A")
+    second = make_page("pages.b", "B")
+    first.layout()
+    second.layout()
+    assert first.layout().to_plotly_json()["props"]["children"] == "A"
+    assert second.layout().to_plotly_json()["props"]["children"] == "B"
+    assert cache.invalidate(first) == 1
+    assert cache.stats()["hits"] == 2
+
+
+def test_backend_cache_corrupted_entries(tmp_path, cached_views):
+    header, _ = cached_views
+    header.layout_cache = BackendCache(FileSystemBackend(tmp_path))
+    header.layout("top")
+    for entry in (tmp_path / "entries").iterdir():
+        entry.write_bytes(b"\x00")
+    assert isinstance(header.layout("top"), LayoutSnapshot)
+    assert header.calls == ["top", "top"]
+
+    cache = BackendCache(MemoryBackend())
+    cache.backend.set("dash:data:prices", b"{not json")
+    assert cache.data("prices", lambda: {"a": 1}) == {"a": 1}
+
+
+def test_backend_cache_unserializable_layout(cached_views):
+    header, _ = cached_views
+    cache = header.layout_cache = BackendCache(MemoryBackend())
+    cache.set(cache.make_key(header, ("x",), {}), object())
+    assert len(cache.backend) == 0
+
+
+def test_redis_backend_malformed_reply():
+    class BrokenReader:
+        def readline(self):
+            return b":not-a-number\r\n"
+
+    connection = RedisBackend()._connection
+    connection._reader = BrokenReader()
+    with pytest.raises(CacheBackendError, match="Malformed reply"):
+        connection._read()
+
+
+def test_filesystem_backend_overwrite_drops_old_tags(tmp_path):
+    backend = FileSystemBackend(tmp_path)
+    backend.set("a", b"1", tags=["old", "kept"])
+    backend.set("a", b"2", tags=["kept"])
+    assert backend.invalidate_tags(["old"]) == 0
+    assert backend.get("a") == b"2"
+    assert backend.delete("a")
+    assert [p for p in (tmp_path / "tags").rglob("*") if p.is_file()] == []
+
+
+def test_filesystem_backend_failed_write_removes_temporary_file(tmp_path):
+    backend = FileSystemBackend(tmp_path)
+    with pytest.raises(TypeError):
+        backend.set("a", "not bytes")
+    assert list((tmp_path / "entries").iterdir()) == []
+
+
+def test_filesystem_backend_prunes_abandoned_temporary_files(tmp_path):
+    backend = FileSystemBackend(tmp_path, max_entries=None)
+    abandoned = tmp_path / "entries" / ".abandoned"
+    recent = tmp_path / "entries" / ".recent"
+    abandoned.write_bytes(b"")
+    recent.write_bytes(b"")
+    old = time.time() - backend.TEMPORARY_MAX_AGE - 1
+    os.utime(abandoned, (old, old))
+    backend.prune()
+    assert not abandoned.exists() and recent.exists()
+
+
+def test_filesystem_backend_concurrent_invalidation_keeps_markers(tmp_path):
+    backend = FileSystemBackend(tmp_path)
+    stop = threading.Event()
+
+    def invalidate():
+        while not stop.is_set():
+            backend.invalidate_tags(["t"])
+
+    invalidator = threading.Thread(target=invalidate)
+    invalidator.start()
+    try:
+        for index in range(1000):
+            backend.set(str(index), b"x", tags=["t"])
+    finally:
+        stop.set()
+        invalidator.join()
+    backend.invalidate_tags(["t"])
+    assert list((tmp_path / "entries").iterdir()) == []
+
+
+def test_filesystem_backend_max_entries(tmp_path):
+    backend = FileSystemBackend(tmp_path, max_entries=3)
+    backend.PRUNE_INTERVAL = 1
+    for index in range(5):
+        backend.set(str(index), b"x", tags=["t"])
+        time.sleep(0.01)
+    assert [backend.get(str(index)) for index in range(5)] == [
+        None,
+        None,
+        b"x",
+        b"x",
+        b"x",
+    ]
+    assert len(list((tmp_path / "tags").rglob("*"))) == 1 + 3
@@ -0,0 +1,24 @@
+"""Tests for the benchmark harness."""
+
+from benchmarks.harness import Benchmark, compare, load_baseline, measure, save_baseline
+
+
+def test_measure_reports_per_call_times():
+    timing = measure(Benchmark("noop", lambda: None, number=10), repeat=2)
+    assert 0 <= timing["min"] <= timing["median"]
+
+
+def test_baseline_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    results = {"layout.success": {"min": 1.0, "median": 1.5}}
+    save_baseline(path, results)
+    assert load_baseline(path) == results
+
+
+def test_compare_flags_regressions():
+    baseline = {"fast": {"min": 1.0}, "slow": {"min": 1.0}, "removed": {"min": 1.0}}
+    current = {"fast": {"min": 1.1}, "slow": {"min": 1.5}, "added": {"min": 1.0}}
+    assert compare(baseline, current, threshold=0.2) == [
+        ("fast", 1.1, False),
+        ("slow", 1.5, True),
+    ]
@@ -0,0 +1,96 @@
+"""Tests for the layout cache."""
+
+import pytest
+
+from src.dash_builder import DashPage
+from src.dash_builder.cache import MISSING, LayoutCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def counting_page() -> type[DashPage]:
+    class CountingPage(DashPage):
+        layout_cache = LayoutCache(maxsize=2)
+        renders = 0
+
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            cls.renders += 1
+            if kwargs.get("fail"):
+                raise ValueError("broken")
+            return [kwargs]
+
+    return CountingPage
+
+
+def test_layout_cache_hit(counting_page):
+    first = counting_page.layout(a=1, b=2)
+    second = counting_page.layout(b=2, a=1)
+    assert first is second
+    assert counting_page.renders == 1
+    assert counting_page.layout_cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_layout_cache_lru_eviction(counting_page):
+    counting_page.layout(a=1)
+    counting_page.layout(a=2)
+    counting_page.layout(a=1)
+    counting_page.layout(a=3)
+    counting_page.layout(a=1)
+    counting_page.layout(a=2)
+    assert counting_page.renders == 4
+
+
+def test_layout_cache_ttl_expiry():
+    timer = FakeTimer()
+    cache = LayoutCache(ttl=10, timer=timer)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    timer.now = 11
+    assert cache.get("key") is MISSING
+
+
+def test_layout_cache_skips_errors(counting_page):
+    counting_page.layout(fail=True)
+    counting_page.layout(fail=True)
+    assert counting_page.renders == 2
+    assert len(counting_page.layout_cache) == 0
+
+
+def test_layout_cache_unhashable_kwargs_bypass(counting_page):
+    counting_page.layout(obj=object.__new__(type("Unhashable", (), {"__hash__": None})))
+    assert len(counting_page.layout_cache) == 0
+
+
+def test_layout_cache_mixed_type_dict_keys(counting_page):
+    first = counting_page.layout(filters={1: "a", "b": 2, None: 3})
+    second = counting_page.layout(filters={None: 3, "b": 2, 1: "a"})
+    assert first is second
+    assert counting_page.renders == 1
+
+
+def test_layout_cache_container_types_do_not_collide(counting_page):
+    layouts = [
+        counting_page.layout(value=[1, 2]),
+        counting_page.layout(value=(1, 2)),
+        counting_page.layout(value={"a": 1}),
+        counting_page.layout(value=(("a", 1),)),
+        counting_page.layout(value={1, 2}),
+    ]
+    assert counting_page.renders == 5
+    assert counting_page.layout(value={1, 2}) is layouts[-1]
+
+
+def test_layout_cache_invalidate_per_class(counting_page, test_page):
+    test_page.layout_cache = counting_page.layout_cache
+    counting_page.layout(a=1)
+    test_page.layout()
+    assert counting_page.invalidate_layout_cache() == 1
+    assert len(counting_page.layout_cache) == 1
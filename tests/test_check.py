@@ -0,0 +1,76 @@
+"""Tests for the static analysis of pages and views."""
+
+import pytest
+
+from src.dash_builder import check
+from src.dash_builder.check import analyze_module, check_project, kebab_name
+
+VIEW = """
+from dash_builder import DashView
+
+
+class {name}(DashView):
+    @classmethod
+    def valid_layout(cls, id, **kwargs):
+        return html.Div(id=cls.id(id, {subname!r}))
+"""
+
+
+@pytest.fixture()
+def project(tmp_path):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "views").mkdir()
+    (tmp_path / "app.py").write_text("from views import ChartView\n")
+    views = {
+        "chart.py": VIEW.format(name="ChartView", subname="title"),
+        "chart_view_title.py": VIEW.format(name="ChartViewTitle", subname=None),
+        "legacy.py": VIEW.format(name="ChartView", subname=None),
+        "table.py": VIEW.format(name="TableView", subname=None)
+        + "\n\nclass WideTableView(TableView):\n    pass\n",
+    }
+    for name, source in views.items():
+        (tmp_path / "views" / name).write_text(source)
+    pages = {
+        "home.py": 'dash.register_page(__name__, path="/")\n',
+        "index.py": 'dash.register_page(__name__, path="/")\n',
+        "sales_report.py": "dash.register_page(__name__)\n",
+        "broken.py": "def oops(:\n",
+    }
+    for name, source in pages.items():
+        (tmp_path / "pages" / name).write_text(source)
+    return tmp_path
+
+
+def test_kebab_name_matches_dash_object(test_view):
+    assert kebab_name("TestView") == test_view.name()
+    assert kebab_name("TestView", "sub") == test_view.name("sub")
+
+
+def test_analyze_module(project):
+    summary = analyze_module(str(project), "views/chart.py")
+    (chart,) = summary.classes
+    assert chart.bases == ("DashView",) and chart.id_subnames == ("title",)
+    route = analyze_module(str(project), "pages/sales_report.py").route
+    assert route == "/sales-report"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_check_project_findings(project, monkeypatch, workers):
+    monkeypatch.setattr(check, "PARALLEL_THRESHOLD", 1)
+    modules, findings = check_project(project, workers)
+    assert len(modules) == 9
+    found = {(finding.kind, finding.message) for finding in findings}
+    assert {kind for kind, _ in found} == {
+        "syntax-error",
+        "name-collision",
+        "duplicate-id-type",
+        "duplicate-route",
+        "unused-view",
+    }
+    assert (
+        "duplicate-id-type",
+        "Component ID type 'chart-view-title' is built by ChartView, ChartViewTitle.",
+    ) in found
+    assert ("duplicate-route", "Route '/' is registered by 2 pages.") in found
+    assert ("unused-view", "WideTableView is never used.") in found
+    assert ("unused-view", "TableView is never used.") not in found
@@ -1,8 +1,12 @@
 """Tests for the main `typer` CLI."""
 
+import json
+
 import pytest
 
-from src.dash_builder.cli import app
+from src.dash_builder.cli import Project, app
+from src.dash_builder.index import ProjectIndex
+from src.dash_builder.profiling import profile_target
 
 
 @pytest.mark.parametrize(
@@ -26,3 +30,170 @@ def test_init_project_cli(runner, tmp_path, project_name):
     assert pages.exists()
     assert homepage.exists()
     assert not_found_404.exists()
+
+
+def test_profile_project_cli(runner, tmp_path):
+    # Project modules import the installed `dash_builder`, so profile through it
+    # for the discovered views to subclass the same `DashView`.
+    from dash_builder.cli import app as installed_app
+
+    runner.invoke(app, ["init", "profiled", "--location", str(tmp_path)])
+    project = tmp_path / "profiled"
+    app_params = ["profile", "--iterations", "3", "--location", str(project)]
+    result = runner.invoke(installed_app, app_params)
+    assert result.exit_code == 0, result.output
+    assert "Render latency" in result.stdout
+    assert "pages.home" in result.stdout
+    assert "HeaderView" in result.stdout
+    assert "cProfile hotspots" in result.stdout
+
+
+def test_profile_rejects_zero_iterations(runner):
+    result = runner.invoke(app, ["profile", "--iterations", "0"])
+    assert result.exit_code == 2
+    with pytest.raises(ValueError, match="at least 1"):
+        profile_target("page", "page", list, 0)
+
+
+def test_build_project_cli(runner, tmp_path):
+    from dash_builder.cli import app as installed_app
+    from dash_builder.prerender import PrerenderedLayouts
+
+    runner.invoke(app, ["init", "built", "--location", str(tmp_path)])
+    project = tmp_path / "built"
+    result = runner.invoke(installed_app, ["build", "--location", str(project)])
+    assert result.exit_code == 0, result.output
+    assert "3 page(s) written" in result.stdout.replace("\n", "")
+    manifest = (project / "build" / "manifest.json").read_text()
+    assert "pages.home.HomePage" in manifest
+
+    layouts = PrerenderedLayouts()
+    assert layouts.load(project / "build") == 3
+
+
+def test_create_views_updates_init_once(runner, tmp_path):
+    runner.invoke(app, ["init", "bulk", "--location", str(tmp_path)])
+    project = tmp_path / "bulk"
+    app_params = ["view", "Chart", "Table", "Chart", "--location", str(project)]
+    result = runner.invoke(app, app_params)
+    assert result.exit_code == 0, result.output
+    assert "View 'chart.py' already exists." in result.stdout
+    init_file = (project / "views" / "__init__.py").read_text()
+    assert "from .chart import ChartView\nfrom .table import TableView\n" in init_file
+    assert '"SidebarView", "ChartView", "TableView"]' in init_file
+
+
+def test_create_views_rolls_back_when_init_update_fails(runner, tmp_path):
+    runner.invoke(app, ["init", "atomic", "--location", str(tmp_path)])
+    project = Project.detect(str(tmp_path / "atomic"))
+    init_file = project.project / "views" / "__init__.py"
+    content = init_file.read_text()
+
+    def fail(templates):
+        raise OSError("disk full")
+
+    project.add_view_imports_to_init_file = fail
+    with pytest.raises(OSError, match="disk full"):
+        project.add_views(["Chart", "Table"])
+    assert not (project.project / "views" / "chart.py").exists()
+    assert not (project.project / "views" / "table.py").exists()
+    assert init_file.read_text() == content
+
+
+def test_create_views_never_overwrites_unindexed_files(runner, tmp_path):
+    runner.invoke(app, ["init", "stale", "--location", str(tmp_path)])
+    project = Project.detect(str(tmp_path / "stale"))
+    project._index = ProjectIndex(project.project)
+    chart = project.project / "views" / "chart.py"
+    chart.write_text("# kept\n")
+    project.add_views(["Chart"])
+    assert chart.read_text() == "# kept\n"
+
+
+@pytest.mark.parametrize("suffix", [".toml", ".yaml"])
+def test_scaffold_from_spec_cli(runner, tmp_path, suffix):
+    runner.invoke(app, ["init", "spec", "--location", str(tmp_path)])
+    project = tmp_path / "spec"
+    spec = tmp_path / f"spec{suffix}"
+    if suffix == ".toml":
+        spec.write_text(
+            'views = ["Chart", { name = "Table" }]\n\n'
+            '[[pages]]\nname = "Reports"\npath = "/reports"\n'
+        )
+    else:
+        pytest.importorskip("yaml")
+        spec.write_text(
+            "views: [Chart, {name: Table}]\npages:\n  - name: Reports\n"
+            "    path: /reports\n"
+        )
+    app_params = ["scaffold", str(spec), "--location", str(project)]
+    result = runner.invoke(app, app_params)
+    assert result.exit_code == 0, result.output
+    assert (project / "views" / "table.py").exists()
+    assert 'path="/reports"' in (project / "pages" / "reports.py").read_text()
+    assert "TableView" in (project / "views" / "__init__.py").read_text()
+
+
+def test_scaffold_rejects_invalid_spec(runner, tmp_path):
+    runner.invoke(app, ["init", "invalid", "--location", str(tmp_path)])
+    spec = tmp_path / "spec.toml"
+    spec.write_text("views = [1]\n")
+    app_params = ["scaffold", str(spec), "--location", str(tmp_path / "invalid")]
+    result = runner.invoke(app, app_params)
+    assert result.exit_code == 1
+    assert "Invalid view entry 1." in result.stdout
+
+
+def test_index_rejects_duplicate_classes_and_paths(runner, tmp_path):
+    runner.invoke(app, ["init", "indexed", "--location", str(tmp_path)])
+    project = tmp_path / "indexed"
+    assert (project / ".dash-builder" / "index.json").exists()
+
+    (project / "views" / "misc.py").write_text("class ChartView:\n    pass\n")
+    result = runner.invoke(app, ["view", "Chart", "--location", str(project)])
+    assert "View class 'ChartView' already exists." in result.stdout
+
+    app_params = ["page", "Landing", "--url-path", "/", "--location", str(project)]
+    result = runner.invoke(app, app_params)
+    assert "URL path '/' is already used by pages/home.py." in result.stdout
+    assert not (project / "pages" / "landing.py").exists()
+
+    result = runner.invoke(app, ["index", "--location", str(project)])
+    assert result.exit_code == 0
+    assert "views/misc.py" in result.stdout
+
+
+def test_check_project_cli(runner, tmp_path):
+    runner.invoke(app, ["init", "checked", "--location", str(tmp_path)])
+    project = tmp_path / "checked"
+    result = runner.invoke(app, ["check", "--location", str(project)])
+    assert result.exit_code == 0, result.output
+    assert "0 problem(s) found in 7 module(s)." in result.stdout
+
+    runner.invoke(app, ["view", "Orphan", "--location", str(project)])
+    result = runner.invoke(app, ["check", "--location", str(project)])
+    assert result.exit_code == 1
+    assert "OrphanView is never used." in result.stdout
+
+
+def test_graph_project_cli(runner, tmp_path):
+    from dash_builder.cli import app as installed_app
+
+    runner.invoke(app, ["init", "graphed", "--location", str(tmp_path)])
+    project = tmp_path / "graphed"
+    with (project / "app.py").open("a") as file:
+        file.write(
+            "\n\n@dash.callback(\n"
+            "    dash.Output(HeaderView.id('main', 'title'), 'children'),\n"
+            "    dash.Input(SidebarView.id('main'), 'value'),\n"
+            ")\n"
+            "def rename(value):\n"
+            "    return value\n"
+        )
+    output = tmp_path / "graph.json"
+    app_params = ["graph", "--format", "json", "--output", str(output)]
+    result = runner.invoke(installed_app, [*app_params, "--location", str(project)])
+    assert result.exit_code == 0, result.output
+    assert "callback(s) written" in result.stdout
+    components = json.loads(output.read_text())["components"]
+    assert {"id": "header-view-title.children", "view": "HeaderView"} in components
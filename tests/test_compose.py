@@ -0,0 +1,138 @@
+"""Tests for concurrent layout composition."""
+
+import asyncio
+import time
+
+import dash_mantine_components as dmc
+import pytest
+
+from src.dash_builder import DashView
+from src.dash_builder.compose import (
+    DEFAULT_POOL_SIZE,
+    configure_render_pool,
+    gather_layouts,
+    render_concurrently,
+    render_parallel,
+)
+
+
+@pytest.fixture()
+def slow_view() -> type[DashView]:
+    class SlowView(DashView):
+        @classmethod
+        async def valid_layout(cls, id: str, delay: float = 0.2, **kwargs):
+            await asyncio.sleep(delay)
+            if kwargs.get("fail"):
+                raise ValueError("broken view")
+            return id
+
+    return SlowView
+
+
+def test_async_valid_layout_from_sync_layout(slow_view):
+    assert slow_view.layout("one", delay=0) == "one"
+
+
+def test_sync_valid_layout_from_alayout(test_page):
+    assert asyncio.run(test_page.alayout()) == []
+
+
+def test_gather_layouts_runs_concurrently(slow_view):
+    start = time.perf_counter()
+    results = render_concurrently(
+        [(slow_view, "one"), (slow_view, "two"), (slow_view, "three", {"delay": 0.1})]
+    )
+    assert results == ["one", "two", "three"]
+    assert time.perf_counter() - start < 0.5
+
+
+def test_render_concurrently_inside_event_loop_raises(slow_view):
+    async def render():
+        return render_concurrently([(slow_view, "one", {"delay": 0})])
+
+    with pytest.raises(RuntimeError, match="gather_layouts"):
+        asyncio.run(render())
+
+
+def test_gather_layouts_isolates_errors(slow_view):
+    specs = [(slow_view, "one", {"delay": 0}), (slow_view, "two", {"fail": True})]
+    results = asyncio.run(gather_layouts(specs))
+    assert results[0] == "one"
+    assert isinstance(results[1], dmc.Container)
+    assert "broken view" in results[1].children.children
+
+
+def test_sync_layout_inside_event_loop_reports_error(slow_view):
+    async def render():
+        return slow_view.layout("one", delay=0)
+
+    container = asyncio.run(render())
+    assert isinstance(container, dmc.Container)
+    assert "alayout" in container.children.children
+
+
+@pytest.fixture()
+def blocking_view() -> type[DashView]:
+    class BlockingView(DashView):
+        @classmethod
+        def valid_layout(cls, id: str, delay: float = 0.2, **kwargs):
+            time.sleep(delay)
+            if kwargs.get("fail"):
+                raise ValueError("broken view")
+            return id
+
+    return BlockingView
+
+
+def test_render_parallel_preserves_order(blocking_view):
+    configure_render_pool(4)
+    start = time.perf_counter()
+    specs = [(blocking_view, str(i), {"delay": 0.2 - i * 0.05}) for i in range(4)]
+    assert render_parallel(specs) == ["0", "1", "2", "3"]
+    assert time.perf_counter() - start < 0.5
+
+
+def test_render_parallel_timeout_and_errors(blocking_view):
+    specs = [
+        (blocking_view, "fast", {"delay": 0}),
+        (blocking_view, "slow", {"delay": 1}),
+        (blocking_view, "broken", {"delay": 0, "fail": True}),
+    ]
+    fast, slow, broken = render_parallel(specs, timeout=0.2)
+    assert fast == "fast"
+    assert "did not render within 0.2s" in slow.children.children
+    assert "broken view" in broken.children.children
+
+
+def test_render_parallel_nested_renders_inline(blocking_view):
+    configure_render_pool(1)
+
+    class ParentView(DashView):
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return render_parallel([(blocking_view, id, {"delay": 0})], timeout=1)
+
+    assert render_parallel([(ParentView, "parent")], timeout=1) == [["parent"]]
+    configure_render_pool(DEFAULT_POOL_SIZE)
+
+
+def test_render_children(blocking_view):
+    class ParentView(DashView):
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return cls.render_children(
+                [
+                    (blocking_view, "a", {"delay": 0}),
+                    (blocking_view, "b", {"delay": 1}),
+                ],
+                timeout=0.2,
+            )
+
+    first, second = ParentView.layout("parent")
+    assert first == "a"
+    assert "did not render within 0.2s" in second.children.children
+
+
+def test_configure_render_pool_rejects_zero():
+    with pytest.raises(ValueError):
+        configure_render_pool(0)
@@ -14,6 +14,13 @@ def test_view_name_with_sub_name(test_view):
     assert test_view.name("sub") == "test-view-sub"
 
 
+def test_view_name_cache_is_bounded(test_view):
+    test_view._name_cache_maxsize = 3
+    names = [test_view.name(f"sub-{index}") for index in range(10)]
+    assert names[-1] == "test-view-sub-9"
+    assert len(test_view._name_cache) == 3
+
+
 def test_view_id(test_view):
     assert test_view.id("test-id") == {"type": "test-view", "index": "test-id"}
 
@@ -34,3 +41,28 @@ def test_abstract_view_raises():
 def test_abstract_create_raises():
     with pytest.raises(NotImplementedError):
         DashView.valid_layout("test-id")
+
+
+def test_view_id_is_interned(test_view):
+    assert test_view.id("test-id") is test_view.id("test-id")
+    assert test_view.id("test-id", "sub") is not test_view.id("test-id")
+
+
+def test_view_id_is_hashable_and_immutable(test_view):
+    component_id = test_view.id("test-id")
+    assert {component_id: 1}[test_view.id("test-id")] == 1
+    with pytest.raises(TypeError):
+        component_id["index"] = "other"
+    with pytest.raises(TypeError):
+        component_id.update(index="other")
+
+
+def test_view_id_distinguishes_equal_hashing_indices(test_view):
+    assert type(test_view.id(1)["index"]) is int
+    assert test_view.id(True)["index"] is True
+
+
+def test_view_id_serializes_like_dict(test_view):
+    from dash._utils import to_json
+
+    assert to_json(test_view.id("test-id")) == '{"type":"test-view","index":"test-id"}'
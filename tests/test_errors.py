@@ -0,0 +1,89 @@
+"""Tests for the render error policy."""
+
+import logging
+
+import pytest
+
+from src.dash_builder import DashPage
+from src.dash_builder.errors import PRODUCTION_MESSAGE, ErrorPolicy
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def timer() -> FakeTimer:
+    return FakeTimer()
+
+
+@pytest.fixture()
+def flaky_page() -> type[DashPage]:
+    class FlakyPage(DashPage):
+        calls = 0
+        broken = True
+
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            cls.calls += 1
+            if cls.broken:
+                raise ConnectionError("backend down")
+            return ["ok"]
+
+    return FlakyPage
+
+
+def test_production_mode_hides_traceback(flaky_page):
+    flaky_page.error_policy = ErrorPolicy(production=True)
+    first = flaky_page.layout()
+    assert first.children.children == PRODUCTION_MESSAGE
+    assert flaky_page.layout() is first
+
+
+def test_debug_mode_shows_traceback(flaky_page):
+    flaky_page.error_policy = ErrorPolicy()
+    container = flaky_page.layout()
+    assert "ConnectionError: backend down" in container.children.children
+
+
+def test_circuit_breaker_opens_and_recovers(flaky_page, timer):
+    policy = ErrorPolicy(failure_threshold=2, reset_timeout=10, timer=timer)
+    flaky_page.error_policy = policy
+    flaky_page.layout()
+    flaky_page.layout()
+    assert policy.is_open(flaky_page)
+    flaky_page.layout()
+    assert flaky_page.calls == 2
+
+    timer.now = 11
+    flaky_page.broken = False
+    assert flaky_page.layout() == ["ok"]
+    assert flaky_page.calls == 3
+    assert not policy.is_open(flaky_page)
+
+
+def test_half_open_failure_reopens_circuit(flaky_page, timer):
+    policy = ErrorPolicy(failure_threshold=1, reset_timeout=10, timer=timer)
+    flaky_page.error_policy = policy
+    flaky_page.layout()
+    timer.now = 11
+    flaky_page.layout()
+    flaky_page.layout()
+    assert flaky_page.calls == 2
+    assert policy.is_open(flaky_page)
+
+
+def test_logging_is_deduplicated(flaky_page, timer, caplog):
+    flaky_page.error_policy = ErrorPolicy(log_interval=60, timer=timer)
+    with caplog.at_level(logging.ERROR, logger="dash_builder"):
+        for _ in range(3):
+            flaky_page.layout()
+        timer.now = 61
+        flaky_page.layout()
+    assert len(caplog.records) == 2
+    assert caplog.records[-1].suppressed == 2
+    assert caplog.records[-1].view == "flaky-page"
@@ -0,0 +1,116 @@
+"""Tests for memoized layout fragments."""
+
+import dash_mantine_components as dmc
+import pytest
+from dash import html
+
+from src.dash_builder import DashView, LayoutSnapshot
+from src.dash_builder.fragments import fragment
+
+
+def make_view(mode: str = "shared", calls: list | None = None) -> type[DashView]:
+    calls = [] if calls is None else calls
+
+    class HeaderView(DashView):
+        @classmethod
+        @fragment(mode=mode, maxsize=2)
+        def logo(cls, size: str = "md"):
+            calls.append(size)
+            return html.Div(dmc.Title("Logo", size=size), className="logo")
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return html.Header(cls.logo(), id=cls.id(id))
+
+    return HeaderView
+
+
+def test_fragment_copy():
+    calls = []
+    view = make_view("copy", calls)
+    first = view.logo()
+    first.className = "changed"
+    second = view.logo()
+    assert calls == ["md"]
+    assert second is not first
+    assert second.className == "logo"
+
+
+def test_fragment_shared_by_default():
+    class LogoView(DashView):
+        @classmethod
+        @fragment
+        def logo(cls):
+            return html.Div(className="logo")
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return cls.logo()
+
+    assert LogoView.logo() is LogoView.logo()
+    view = make_view()
+    assert view.logo("lg") is view.logo("lg")
+    assert view.logo("lg") is not view.logo("sm")
+
+
+def test_fragment_snapshot():
+    view = make_view("snapshot")
+    logo = view.logo()
+    assert isinstance(logo, LayoutSnapshot)
+    assert logo.to_plotly_json()["props"]["className"] == "logo"
+    assert view.logo() is logo
+
+
+def test_fragment_per_argument_tuple_lru():
+    calls = []
+    view = make_view("shared", calls)
+    view.logo(size="sm")
+    view.logo(size="md")
+    view.logo(size="sm")
+    view.logo(size="lg")
+    view.logo(size="sm")
+    view.logo(size="md")
+    assert calls == ["sm", "md", "lg", "md"]
+
+
+def test_fragment_cache_per_class():
+    calls = []
+    first = make_view("shared", calls)
+    reloaded = make_view("shared", calls)
+    first.layout("header")
+    reloaded.layout("header")
+    first.layout("header")
+    assert calls == ["md", "md"]
+
+
+def test_fragment_cache_clear():
+    calls = []
+    view = make_view("shared", calls)
+    view.logo()
+    view.logo.cache_clear(view)
+    view.logo()
+    assert calls == ["md", "md"]
+
+
+def test_fragment_unhashable_arguments():
+    calls = []
+
+    class ListView(DashView):
+        @classmethod
+        @fragment
+        def items(cls, values):
+            calls.append(values)
+            return html.Ul([html.Li(value) for value in values])
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return cls.items(["a"])
+
+    ListView.items(["a"])
+    ListView.items(["a"])
+    assert len(calls) == 2
+
+
+def test_fragment_unknown_mode():
+    with pytest.raises(ValueError, match="Unknown fragment mode 'weak'"):
+        fragment(mode="weak")
@@ -0,0 +1,77 @@
+"""Tests for the callback dependency graph."""
+
+import json
+
+import dash
+import pytest
+from dash import MATCH, Input, Output, State, html
+
+from src.dash_builder import DashView
+from src.dash_builder.graph import CallbackGraph
+
+
+@pytest.fixture(scope="module")
+def graph() -> CallbackGraph:
+    class GraphFilterView(DashView):
+        @classmethod
+        def valid_layout(cls, id, **kwargs):
+            return html.Div(id=cls.id(id))
+
+    class GraphChartView(DashView):
+        @classmethod
+        def valid_layout(cls, id, **kwargs):
+            return html.Div(id=cls.id(id))
+
+    app = dash.Dash(__name__)
+    for name in ("a", "b", "c"):
+
+        def update(value, state, name=name):
+            return name
+
+        update.__qualname__ = f"update_{name}"
+        dash.callback(
+            Output(GraphChartView.id(MATCH, name), "children"),
+            Input(GraphFilterView.matched_id(), "value"),
+            State("graph-store", "data"),
+        )(update)
+
+    @app.callback(
+        Output("graph-status", "children"),
+        Output(GraphChartView.id("main", "a"), "children", allow_duplicate=True),
+        Input(GraphFilterView.all_ids(), "value"),
+        prevent_initial_call=True,
+    )
+    def summarise(values):
+        return "", ""
+
+    return CallbackGraph.from_app(app)
+
+
+def test_graph_attributes_components_to_views(graph):
+    assert graph.view_of("graph-chart-view-a.children") == "GraphChartView"
+    assert graph.view_of("graph-filter-view.value") == "GraphFilterView"
+    assert graph.view_of("graph-status.children") is None
+
+
+def test_graph_finds_hotspots(graph):
+    hotspots = {(h.kind, h.component): h for h in graph.hotspots(threshold=2)}
+    fan_out = hotspots["fan-out", "graph-filter-view.value"]
+    assert len(fan_out.callbacks) == 4
+    fan_in = hotspots["fan-in", "graph-chart-view-a.children"]
+    assert fan_in.callbacks[-1].endswith("summarise")
+    assert ("fan-in", "graph-status.children") not in hotspots
+
+
+def test_graph_exports(graph):
+    data = json.loads(json.dumps(graph.to_json(threshold=2)))
+    (summarise,) = [c for c in data["callbacks"] if c["name"].endswith("summarise")]
+    assert summarise["inputs"] == [
+        {"component": "graph-filter-view.value", "pattern": "ALL"}
+    ]
+    assert {"id": "graph-store.data", "view": None} in data["components"]
+
+    dot = graph.to_dot(threshold=2)
+    assert dot.startswith("digraph callbacks {")
+    assert 'subgraph "cluster_GraphChartView"' in dot
+    assert '"graph-filter-view.value" [shape=box, color="red"];' in dot
+    assert '"graph-store.data" -> "tests.test_graph.update_a" [style=dashed' in dot
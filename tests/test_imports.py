@@ -0,0 +1,45 @@
+"""Tests that the CLI and the runtime API import only what they need."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ["dash", "dash_mantine_components", "rich", "typer"]
+
+
+def loaded_modules(statement: str) -> set[str]:
+    code = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return set(json.loads(output)) & set(HEAVY_MODULES)
+
+
+def test_cli_import_skips_dash():
+    assert loaded_modules("import src.dash_builder.cli") == {"rich", "typer"}
+
+
+def test_runtime_import_skips_cli_and_mantine():
+    assert loaded_modules("from src.dash_builder import DashPage, DashView") == {"dash"}
+
+
+@pytest.mark.parametrize("name", ["DashPage", "LayoutCache", "compose"])
+def test_lazy_attributes_resolve(name):
+    import src.dash_builder as package
+
+    assert name in dir(package)
+    assert getattr(package, name) is getattr(package, name)
+
+
+def test_unknown_attribute_raises():
+    import src.dash_builder as package
+
+    with pytest.raises(AttributeError):
+        package.does_not_exist
@@ -0,0 +1,60 @@
+"""Tests for the persistent project index."""
+
+import os
+
+import pytest
+
+from src.dash_builder.index import ProjectIndex, scan_directory
+
+
+@pytest.fixture()
+def project(tmp_path):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "views" / "charts").mkdir(parents=True)
+    (tmp_path / "pages" / "home.py").write_text(
+        'dash.register_page(__name__, path="/")\n\n\nclass HomePage(DashPage):\n'
+    )
+    (tmp_path / "views" / "__init__.py").write_text("__all__ = []\n")
+    (tmp_path / "views" / "charts" / "line.py").write_text("class LineView:\n")
+    return tmp_path
+
+
+def test_index_records_modules(project):
+    index = ProjectIndex(project).refresh()
+    assert set(index.modules) == {"pages/home.py", "views/charts/line.py"}
+    assert index.class_names("view") == {"LineView"}
+    assert index.url_paths() == {"/": "pages/home.py"}
+    assert (project / ".dash-builder" / "index.json").exists()
+
+
+def test_index_module_names(project):
+    (project / "views" / "helpers.py").write_text("def helper():\n    pass\n")
+    index = ProjectIndex(project).refresh()
+    assert index.module_names() == ["pages.home", "views.charts.line", "views.helpers"]
+    assert index.module_names("view", classes_only=True) == ["views.charts.line"]
+
+
+def test_index_refresh_is_incremental(project, monkeypatch):
+    ProjectIndex(project).refresh()
+    line = project / "views" / "charts" / "line.py"
+    line.write_text("class LineView:\n\n\nclass AreaView:\n")
+    stat = line.stat()
+    os.utime(line, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (project / "pages" / "home.py").unlink()
+
+    reads = []
+    index = ProjectIndex(project)
+    original = index.update
+    monkeypatch.setattr(index, "update", lambda *a: reads.append(a) or original(*a))
+    index.refresh()
+    assert [path.name for _, path, _ in reads] == ["line.py"]
+    assert index.class_names() == {"LineView", "AreaView"}
+    assert ProjectIndex(project).url_paths() == {}
+
+
+def test_scan_directory_skips_ignored_entries(tmp_path):
+    for name in ("b", ".venv", "node_modules", "__pycache__"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "a.py").touch()
+    (tmp_path / ".hidden").touch()
+    assert [entry.name for entry in scan_directory(tmp_path)] == ["b", "a.py"]
@@ -0,0 +1,70 @@
+"""Tests for lazy-loaded DashView classes."""
+
+import asyncio
+
+import dash_mantine_components as dmc
+import pytest
+from dash import html
+from dash._callback import GLOBAL_CALLBACK_LIST, GLOBAL_CALLBACK_MAP
+
+from src.dash_builder import DashView, LayoutSnapshot
+
+
+@pytest.fixture()
+def lazy_view() -> type[DashView]:
+    class LazyReportView(DashView):
+        lazy = True
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return html.Div(kwargs.get("title"), id=cls.id(id))
+
+    return LazyReportView
+
+
+def test_lazy_view_renders_placeholder(lazy_view):
+    container = lazy_view.layout("report", title="Sales")
+    placeholder, store = container.children
+    assert container.id == lazy_view.id("report", "lazy")
+    assert isinstance(placeholder, dmc.Stack)
+    assert store.id == lazy_view.id("report", "lazy-kwargs")
+    assert store.data == {"title": "Sales"}
+
+
+def test_lazy_view_registers_callback(lazy_view):
+    outputs = [callback["output"] for callback in GLOBAL_CALLBACK_LIST]
+    assert '{"index":["MATCH"],"type":"lazy-report-view-lazy"}.children' in outputs
+
+
+def test_lazy_view_loads_valid_layout(lazy_view):
+    loaded = lazy_view.lazy_load("report", title="Sales")
+    assert loaded.children == "Sales"
+    assert loaded.id == lazy_view.id("report")
+
+
+def test_eager_view_registers_no_callback(test_view):
+    outputs = "".join(callback["output"] for callback in GLOBAL_CALLBACK_LIST)
+    assert "test-view" not in outputs
+
+
+def test_redefined_lazy_view_replaces_callback(lazy_view):
+    output = '{"index":["MATCH"],"type":"lazy-report-view-lazy"}.children'
+
+    class LazyReportView(DashView):
+        lazy = True
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return html.Div("reloaded", id=cls.id(id))
+
+    outputs = [callback["output"] for callback in GLOBAL_CALLBACK_LIST]
+    assert outputs.count(output) == 1
+    callback = GLOBAL_CALLBACK_MAP[output]["callback"].__wrapped__
+    assert callback(LazyReportView.id("report", "lazy"), {}).children == "reloaded"
+
+
+def test_lazy_view_alayout_and_snapshot(lazy_view):
+    container = asyncio.run(lazy_view.alayout("report", title="Sales"))
+    assert container.id == lazy_view.id("report", "lazy")
+    snapshot = lazy_view.snapshot("report", title="Sales")
+    assert snapshot == LayoutSnapshot.from_layout(container)
@@ -0,0 +1,195 @@
+"""Tests for render timeouts and admission control."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.dash_builder import DashPage, DashView
+from src.dash_builder._pool import (
+    DEFAULT_POOL_SIZE,
+    configure_render_pool,
+    render_pool,
+)
+from src.dash_builder.compose import render_parallel
+from src.dash_builder.limits import ConcurrencyLimiter
+
+
+@pytest.fixture()
+def gated_page() -> type[DashPage]:
+    class GatedPage(DashPage):
+        started = threading.Event()
+        gate = threading.Event()
+
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            cls.started.set()
+            cls.gate.wait(5)
+            return ["done"]
+
+    return GatedPage
+
+
+def test_render_timeout_returns_fallback(gated_page):
+    gated_page.render_timeout = 0.1
+    start = time.perf_counter()
+    container = gated_page.layout()
+    gated_page.gate.set()
+    assert time.perf_counter() - start < 1
+    assert "did not finish within 0.1s" in container.children.children
+
+
+def test_async_render_timeout_returns_fallback():
+    class SlowAsyncPage(DashPage):
+        render_timeout = 0.1
+
+        @classmethod
+        async def valid_layout(cls, **kwargs):
+            await asyncio.sleep(5)
+
+    container = asyncio.run(SlowAsyncPage.alayout())
+    assert "did not finish within 0.1s" in container.children.children
+
+
+def test_admission_sheds_excess_renders(gated_page):
+    gated_page.admission = limiter = ConcurrencyLimiter(1)
+    worker = threading.Thread(target=gated_page.layout)
+    worker.start()
+    gated_page.started.wait(5)
+    busy = gated_page.layout()
+    gated_page.gate.set()
+    worker.join()
+    assert busy is limiter.busy(gated_page)
+    assert "busy" in busy.children.children
+    assert limiter.shed == 1
+    assert gated_page.layout() == ["done"]
+
+
+def test_admission_queues_within_timeout(gated_page):
+    gated_page.admission = ConcurrencyLimiter(1, queue_timeout=5)
+    worker = threading.Thread(target=gated_page.layout)
+    worker.start()
+    gated_page.started.wait(5)
+    threading.Timer(0.1, gated_page.gate.set).start()
+    assert gated_page.layout() == ["done"]
+    worker.join()
+
+
+def test_timed_out_render_keeps_admission_slot(gated_page):
+    gated_page.render_timeout = 0.1
+    gated_page.admission = limiter = ConcurrencyLimiter(1)
+    gated_page.layout()
+    assert not limiter.acquire()
+    gated_page.gate.set()
+    time.sleep(0.2)
+    assert limiter.acquire()
+    limiter.release()
+
+
+def test_async_timed_out_render_keeps_admission_slot(gated_page):
+    gated_page.render_timeout = 0.1
+    gated_page.admission = limiter = ConcurrencyLimiter(1)
+    container = asyncio.run(gated_page.alayout())
+    assert "did not finish within 0.1s" in container.children.children
+    assert not limiter.acquire()
+    gated_page.gate.set()
+    time.sleep(0.2)
+    assert limiter.acquire()
+    limiter.release()
+
+
+def test_cancelled_async_acquire_returns_slot():
+    limiter = ConcurrencyLimiter(1, queue_timeout=5)
+    assert limiter.acquire()
+
+    async def cancel_waiter():
+        waiter = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        await asyncio.sleep(0.2)
+
+    asyncio.run(cancel_waiter())
+    assert limiter.acquire()
+    limiter.release()
+
+
+def test_inline_child_render_applies_its_timeout():
+    class SlowView(DashView):
+        render_timeout = 0.05
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            time.sleep(0.1)
+            return ["done"]
+
+    container = render_pool().submit(render_parallel, [(SlowView, "a")]).result()[0]
+    assert "did not render within 0.05s" in container.children.children
+
+
+def test_inline_render_returns_finished_layout():
+    class SlowView(DashView):
+        render_timeout = 0.05
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            time.sleep(0.1)
+            return ["done"]
+
+    assert render_pool().submit(SlowView.layout, "a").result() == ["done"]
+
+
+def test_render_timeout_keeps_nested_composition_parallel():
+    configure_render_pool(8)
+
+    class SleepyView(DashView):
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            time.sleep(0.3)
+            return id
+
+    class ComposedPage(DashPage):
+        render_timeout = 5
+
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            specs = [(SleepyView, str(index)) for index in range(4)]
+            return render_parallel(specs, timeout=1)
+
+    start = time.perf_counter()
+    assert ComposedPage.layout() == ["0", "1", "2", "3"]
+    assert time.perf_counter() - start < 0.6
+    configure_render_pool(DEFAULT_POOL_SIZE)
+
+
+def test_nested_composition_applies_deadlines():
+    configure_render_pool(8)
+
+    class SleepyView(DashView):
+        @classmethod
+        def valid_layout(cls, id: str, delay: float = 0, **kwargs):
+            time.sleep(delay)
+            return id
+
+    class ComposedPage(DashPage):
+        render_timeout = 5
+
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            specs = [(SleepyView, "fast"), (SleepyView, "slow", {"delay": 1})]
+            return render_parallel(specs, timeout=0.2)
+
+    start = time.perf_counter()
+    fast, slow = ComposedPage.layout()
+    assert time.perf_counter() - start < 0.6
+    assert fast == "fast"
+    assert "did not render within 0.2s" in slow.children.children
+    configure_render_pool(DEFAULT_POOL_SIZE)
+
+
+def test_limiter_rejects_zero():
+    with pytest.raises(ValueError):
+        ConcurrencyLimiter(0)
@@ -0,0 +1,131 @@
+"""Tests for request-scoped data loaders."""
+
+import asyncio
+
+import pytest
+from dash import html
+
+from src.dash_builder import DashPage, DashView
+from src.dash_builder.compose import gather_layouts, render_parallel
+from src.dash_builder.loaders import DataLoader, current_scope, render_scope
+
+
+@pytest.fixture()
+def batches() -> list[list]:
+    return []
+
+
+@pytest.fixture()
+def loader(batches) -> DataLoader:
+    def load_users(ids):
+        batches.append(list(ids))
+        return {id: {"name": id.title()} for id in ids if id != "ghost"}
+
+    return DataLoader(load_users)
+
+
+def test_loader_outside_scope_does_not_cache(loader, batches):
+    assert loader.load("ann") == {"name": "Ann"}
+    assert loader.load("ann") == {"name": "Ann"}
+    assert batches == [["ann"], ["ann"]]
+
+
+def test_loader_dedups_within_scope(loader, batches):
+    with render_scope():
+        assert loader.load_many(["ann", "bob", "ann"]) == [
+            {"name": "Ann"},
+            {"name": "Bob"},
+            {"name": "Ann"},
+        ]
+        assert loader.load("bob") == {"name": "Bob"}
+        assert loader.load("ghost") is None
+    assert batches == [["ann", "bob"], ["ghost"]]
+    assert current_scope() is None
+
+
+def test_loader_prime_joins_next_batch(loader, batches):
+    with render_scope():
+        loader.prime("ann", "bob")
+        loader.load("cid")
+        loader.load("ann")
+    assert batches == [["ann", "bob", "cid"]]
+
+
+def test_loader_max_batch_size(batches):
+    loader = DataLoader(lambda ids: batches.append(ids) or ids, max_batch_size=2)
+    with render_scope():
+        assert loader.load_many([1, 2, 3]) == [1, 2, 3]
+    assert batches == [[1, 2], [3]]
+
+
+def test_loader_errors_are_not_cached():
+    calls = []
+
+    def flaky(ids):
+        calls.append(ids)
+        if len(calls) == 1:
+            raise ConnectionError("database down")
+        return ids
+
+    loader = DataLoader(flaky)
+    with render_scope():
+        with pytest.raises(ConnectionError):
+            loader.load("a")
+        assert loader.load("a") == "a"
+
+
+def test_loader_wrong_length():
+    loader = DataLoader(lambda ids: [])
+    with pytest.raises(ValueError, match="returned 0 values for 1 keys"):
+        loader.load("a")
+
+
+def test_page_render_shares_loader(loader, batches):
+    class UserView(DashView):
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return html.Span(loader.load(id)["name"], id=cls.id(id))
+
+    class UsersPage(DashPage):
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            loader.prime("ann", "bob")
+            return html.Div(
+                [UserView.layout("ann"), UserView.layout("bob")]
+                + render_parallel([(UserView, "ann")])
+            )
+
+    first = UsersPage.layout()
+    assert [child.children for child in first.children] == ["Ann", "Bob", "Ann"]
+    UsersPage.layout()
+    assert batches == [["ann", "bob"], ["ann", "bob"]]
+
+
+def test_async_loads_are_batched(batches):
+    async def load_users(ids):
+        batches.append(list(ids))
+        return [id.upper() for id in ids]
+
+    loader = DataLoader(load_users)
+
+    class AsyncUserView(DashView):
+        @classmethod
+        async def valid_layout(cls, id: str, **kwargs):
+            return await loader.aload(id)
+
+    class AsyncUsersPage(DashPage):
+        @classmethod
+        async def valid_layout(cls, **kwargs):
+            return await gather_layouts(
+                [(AsyncUserView, "a"), (AsyncUserView, "b"), (AsyncUserView, "a")]
+            )
+
+    assert asyncio.run(AsyncUsersPage.alayout()) == ["A", "B", "A"]
+    assert batches == [["a", "b"]]
+
+
+def test_sync_loader_with_async_batch_function():
+    async def load(ids):
+        return ids
+
+    assert DataLoader(load).load_many([1, 2]) == [1, 2]
@@ -0,0 +1,88 @@
+"""Tests for render instrumentation."""
+
+import dash
+import pytest
+from dash import html
+
+from src.dash_builder import DashPage
+from src.dash_builder.cache import LayoutCache
+from src.dash_builder.metrics import RenderMetrics, count_components
+
+
+@pytest.fixture()
+def metrics() -> RenderMetrics:
+    registry = RenderMetrics()
+    registry.enable()
+    return registry
+
+
+def test_count_components():
+    layout = [html.Div([html.Span("a"), html.Span(html.B("b"))]), "text"]
+    assert count_components(layout) == 4
+
+
+def test_metrics_disabled_by_default(test_page):
+    registry = RenderMetrics()
+    test_page.render_metrics = registry
+    test_page.layout()
+    assert registry.snapshot() == {}
+
+
+def test_metrics_record_renders_and_errors(metrics, test_page, error_page):
+    test_page.render_metrics = metrics
+    error_page.render_metrics = metrics
+    test_page.layout()
+    test_page.layout()
+    error_page.layout()
+    series = metrics.snapshot()["test-page"]
+    assert series["renders"] == 3
+    assert series["errors"] == 1
+    assert series["components"] == 2
+    assert sum(series["buckets"].values()) == 3
+
+
+def test_metrics_prometheus_endpoint(metrics, test_page):
+    test_page.render_metrics = metrics
+    test_page.layout()
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    metrics.register_endpoint(app, "/metrics")
+    response = app.server.test_client().get("/metrics")
+    body = response.get_data(as_text=True)
+    assert response.status_code == 200
+    assert 'dash_builder_renders_total{view="test-page"} 1' in body
+    assert 'dash_builder_render_seconds_bucket{view="test-page",le="+Inf"} 1' in body
+
+
+def test_metrics_prometheus_families_are_contiguous(metrics, test_page, error_page):
+    test_page.render_metrics = metrics
+    error_page.render_metrics = metrics
+    test_page.layout()
+    error_page.layout()
+    families = [
+        line.split()[2] if line.startswith("#") else line.split("{")[0]
+        for line in metrics.to_prometheus().splitlines()
+    ]
+    names = [
+        family.removesuffix("_bucket").removesuffix("_sum").removesuffix("_count")
+        for family in families
+    ]
+    blocks = [name for index, name in enumerate(names) if name != names[index - 1]]
+    assert len(blocks) == len(set(blocks)) == 4
+
+
+def test_metrics_skip_tree_size_of_cached_layouts(metrics):
+    class CachedPage(DashPage):
+        layout_cache = LayoutCache()
+        render_metrics = metrics
+
+        @classmethod
+        def valid_layout(cls, **kwargs):
+            return html.Div(html.Span())
+
+    CachedPage.layout()
+    CachedPage.layout()
+    series = metrics.snapshot()[CachedPage.name()]
+    assert series["renders"] == 2
+    assert series["measured"] == 1
+    assert series["components"] == 2
@@ -0,0 +1,131 @@
+"""Tests for the batched pattern-matching updates of views."""
+
+import dash
+import pytest
+from dash import Input, html
+from dash._callback import GLOBAL_CALLBACK_LIST, GLOBAL_CALLBACK_MAP
+
+from src.dash_builder import DashView
+from src.dash_builder.patches import batch_updates, diff_patch
+
+
+def operations(patch: dash.Patch) -> list[dict]:
+    return patch.to_plotly_json()["operations"]
+
+
+def test_diff_patch_equal_values():
+    assert diff_patch({"a": [1, 2]}, {"a": [1, 2]}) is dash.no_update
+    assert diff_patch("text", "text") is dash.no_update
+
+
+def test_diff_patch_scalar_value():
+    assert diff_patch("old", "new") == "new"
+    assert diff_patch([1], {"a": 1}) == {"a": 1}
+
+
+def test_diff_patch_nested_dict():
+    patch = diff_patch(
+        {"layout": {"title": "A", "height": 400}, "data": [], "old": 1},
+        {"layout": {"title": "B", "height": 400}, "data": []},
+    )
+    assert operations(patch) == [
+        {"operation": "Delete", "location": ["old"], "params": {}},
+        {
+            "operation": "Assign",
+            "location": ["layout", "title"],
+            "params": {"value": "B"},
+        },
+    ]
+
+
+def test_diff_patch_lists():
+    grown = diff_patch([1, 2], [1, 3, 4])
+    assert operations(grown) == [
+        {"operation": "Assign", "location": [1], "params": {"value": 3}},
+        {"operation": "Extend", "location": [], "params": {"value": [4]}},
+    ]
+    shrunk = diff_patch([1, 2, 3, 4], [0, 2])
+    assert [op["operation"] for op in operations(shrunk)] == [
+        "Delete",
+        "Delete",
+        "Assign",
+    ]
+    assert [op["location"] for op in operations(shrunk)] == [[3], [2], [0]]
+
+
+def test_diff_patch_components():
+    old = html.Div(["a", html.Span("b")], id="x").to_plotly_json()
+    old["props"]["children"][1] = old["props"]["children"][1].to_plotly_json()
+    patch = diff_patch(old, html.Div(["a", html.Span("c")], id="x"))
+    assert operations(patch) == [
+        {
+            "operation": "Assign",
+            "location": ["props", "children", 1, "props", "children"],
+            "params": {"value": "c"},
+        }
+    ]
+
+
+def test_diff_patch_too_many_operations():
+    old = {str(i): i for i in range(10)}
+    new = {str(i): -i for i in range(10)}
+    assert diff_patch(old, new, max_operations=5) == new
+
+
+def test_batch_updates_list():
+    ids = [{"type": "t", "index": i} for i in ("a", "b", "c")]
+    calls = []
+
+    def compute(indices):
+        calls.append(indices)
+        return [{"v": 1}, {"v": 3}, "same"]
+
+    updates = batch_updates(ids, [{"v": 1}, {"v": 2}, "same"], compute)
+    assert calls == [["a", "b", "c"]]
+    assert updates[0] is dash.no_update
+    assert isinstance(updates[1], dash.Patch)
+    assert updates[2] is dash.no_update
+
+
+def test_batch_updates_dict():
+    ids = [{"type": "t", "index": i} for i in (1, 2)]
+    updates = batch_updates(ids, ["x", "y"], lambda indices: {2: "z"})
+    assert updates == [dash.no_update, "z"]
+
+
+def test_batch_updates_length_mismatch():
+    ids = [{"type": "t", "index": 1}]
+    with pytest.raises(ValueError, match="Expected 1 values"):
+        batch_updates(ids, ["x"], lambda indices: [])
+
+
+def test_batch_callback(test_view):
+    @test_view.batch_callback("children", Input("batch-year", "value"))
+    def update_children(indices, year):
+        return {index: f"{index}-{year}" for index in indices if index != "keep"}
+
+    entry = next(
+        entry
+        for entry in GLOBAL_CALLBACK_LIST
+        if entry["inputs"] == [{"id": "batch-year", "property": "value"}]
+    )
+    assert [state["property"] for state in entry["state"]] == ["children", "id"]
+    callback = GLOBAL_CALLBACK_MAP[entry["output"]]["callback"]
+    assert callback.__wrapped__.__name__ == "update_children"
+
+    ids = [test_view.id("keep"), test_view.id("a"), test_view.id("b")]
+    updates = callback.__wrapped__(2024, ["keep", "a-2024", "b-2023"], ids)
+    assert updates == [dash.no_update, dash.no_update, "b-2024"]
+
+
+def test_batch_updates_class_limit():
+    class WideView(DashView):
+        max_patch_operations = 1
+
+        @classmethod
+        def valid_layout(cls, id: str, **kwargs):
+            return html.Div(id=cls.id(id))
+
+    ids = [WideView.id("a")]
+    updates = WideView.batch_updates(ids, [[1, 2]], lambda indices: [[3, 4]])
+    assert updates == [[3, 4]]
@@ -0,0 +1,54 @@
+"""Tests for serving prerendered page snapshots."""
+
+import json
+
+import pytest
+
+from src.dash_builder import DashPage, LayoutSnapshot
+from src.dash_builder.prerender import (
+    MANIFEST,
+    PrerenderedLayouts,
+    _file_name,
+    is_parameterless,
+)
+
+
+@pytest.fixture()
+def build_dir(tmp_path, test_page):
+    snapshot = LayoutSnapshot(b'["prerendered"]')
+    (tmp_path / "test-page.json").write_bytes(snapshot.data)
+    key = f"{test_page.__module__}.{test_page.__qualname__}"
+    manifest = {"pages": {key: {"file": "test-page.json", "etag": snapshot.etag}}}
+    (tmp_path / MANIFEST).write_text(json.dumps(manifest))
+    return tmp_path
+
+
+def test_prerendered_snapshot_served_without_kwargs(build_dir, test_page):
+    test_page.prerendered = PrerenderedLayouts()
+    test_page.prerendered.load(build_dir)
+    assert test_page.layout().to_plotly_json() == ["prerendered"]
+    assert test_page.layout(query="1") == []
+
+
+def test_prerendered_snapshot_hash_checked(build_dir):
+    (build_dir / "test-page.json").write_bytes(b"tampered")
+    with pytest.raises(ValueError):
+        PrerenderedLayouts().load(build_dir)
+
+
+def test_is_parameterless(test_page):
+    class SearchPage(DashPage):
+        @classmethod
+        def valid_layout(cls, query: str = "", **kwargs):
+            return []
+
+    assert is_parameterless(test_page)
+    assert not is_parameterless(SearchPage)
+
+
+def test_prerender_file_names_unique_per_module(test_page):
+    first = type("HomePage", (test_page,), {"__module__": "pages.a"})
+    second = type("HomePage", (test_page,), {"__module__": "pages.b"})
+    assert first.name() == second.name()
+    assert _file_name(first) != _file_name(second)
+    assert _file_name(first).startswith(f"{first.name()}-")
@@ -0,0 +1,139 @@
+"""Tests for the memory-mapped layout store shared between workers."""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+from dash import html
+
+from src.dash_builder import DashPage, LayoutSnapshot, shared
+from src.dash_builder.cache import MISSING
+from src.dash_builder.shared import SharedLayoutStore
+
+
+@pytest.fixture()
+def store_page(tmp_path) -> type[DashPage]:
+    class StorePage(DashPage):
+        calls = 0
+        layout_cache = SharedLayoutStore(tmp_path / "layouts")
+
+        @classmethod
+        def valid_layout(cls, title: str = "", **kwargs):
+            cls.calls += 1
+            return html.H1(title)
+
+    return StorePage
+
+
+def test_store_shared_between_instances(store_page, tmp_path):
+    rendered = store_page.layout(title="Sales")
+    assert isinstance(rendered, LayoutSnapshot)
+
+    worker = SharedLayoutStore(tmp_path / "layouts")
+    key = worker.make_key(store_page, (), {"title": "Sales"})
+    snapshot = worker.get(key)
+    assert snapshot.to_plotly_json()["props"]["children"] == "Sales"
+
+    store_page.layout_cache = worker
+    assert store_page.layout(title="Sales") == snapshot
+    assert store_page.calls == 1
+
+
+def test_store_readable_from_another_process(store_page, tmp_path):
+    store_page.layout(title="Sales")
+    key = store_page.layout_cache.make_key(store_page, (), {"title": "Sales"})
+    code = (
+        "import sys; from src.dash_builder.shared import SharedLayoutStore; "
+        "print(SharedLayoutStore(sys.argv[1]).get(sys.argv[2]).data.tobytes().decode())"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code, str(tmp_path / "layouts"), key],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert '"Sales"' in output
+
+
+def test_publish_replaces_store_atomically(tmp_path):
+    store = SharedLayoutStore(tmp_path / "layouts")
+    store.publish({"page/a": LayoutSnapshot(b'"a"')})
+    before = store.get("page/a")
+
+    store.publish({"page/b": LayoutSnapshot(b'"b"')})
+    assert store.get("page/a") is MISSING
+    assert store.get("page/b").data == b'"b"'
+    assert isinstance(before.data, memoryview)
+    assert before.data == b'"a"'
+    assert before.to_plotly_json() == "a"
+    assert len(store) == 1
+
+
+def test_store_counters_are_thread_safe(tmp_path):
+    store = SharedLayoutStore(tmp_path / "layouts")
+    store.publish({"page/a": LayoutSnapshot(b'"a"')})
+
+    def look_up():
+        for _ in range(2000):
+            store.get("page/a")
+            store.get("page/b")
+
+    threads = [threading.Thread(target=look_up) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store.stats() == {"hits": 8000, "misses": 8000, "size": 1}
+
+
+def test_store_invalidate_and_maxsize(store_page, test_page, tmp_path):
+    store = store_page.layout_cache
+    store.maxsize = 2
+    for title in ("a", "b", "c"):
+        store_page.layout(title=title)
+    assert len(store) == 2
+
+    store.set(store.make_key(test_page, (), {}), html.Div())
+    assert store_page.invalidate_layout_cache() == 1
+    assert store.stats()["size"] == 1
+
+
+def test_store_skips_non_json_arguments(store_page):
+    assert store_page.layout_cache.make_key(store_page, (object(),), {}) is None
+
+
+def test_store_rejects_foreign_files(tmp_path):
+    path = tmp_path / "layouts"
+    path.write_bytes(b"not a layout store at all!!!!!!!")
+    with pytest.raises(ValueError):
+        SharedLayoutStore(path).get("page/a")
+
+
+def test_store_appends_without_rewriting(store_page, tmp_path):
+    path = tmp_path / "layouts"
+    store_page.layout(title="a")
+    identity = path.stat().st_ino
+    reader = SharedLayoutStore(path)
+    assert len(reader) == 1
+
+    assert store_page.layout(title="b") == store_page.layout(title="b")
+    assert path.stat().st_ino == identity
+    assert len(reader) == 2
+    assert store_page.invalidate_layout_cache() == 2
+    assert reader.get(reader.make_key(store_page, (), {"title": "a"})) is MISSING
+    assert store_page.calls == 2
+
+
+def test_store_compacts_superseded_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared, "COMPACT_MIN_BYTES", 0)
+    store = SharedLayoutStore(tmp_path / "layouts")
+    for _ in range(8):
+        store.set("page/a", LayoutSnapshot(b'"a"' * 8))
+    compacted = SharedLayoutStore(tmp_path / "compacted")
+    compacted.publish({"page/a": LayoutSnapshot(b'"a"' * 8)})
+
+    size = (tmp_path / "layouts").stat().st_size
+    assert size < 2 * (tmp_path / "compacted").stat().st_size
+    assert SharedLayoutStore(tmp_path / "layouts").get("page/a").data == b'"a"' * 8
+    assert len(store) == 1
@@ -0,0 +1,96 @@
+"""Tests for layout templates with holes."""
+
+import json
+
+import dash_mantine_components as dmc
+import pytest
+from dash import html
+from plotly.io.json import to_json_plotly
+
+from src.dash_builder import DashPage, LayoutSnapshot
+from src.dash_builder.skeleton import Hole, LayoutTemplate
+
+
+@pytest.fixture()
+def static_header() -> html.Header:
+    return html.Header([dmc.Title("Reports"), html.Nav(["Home", "Reports"])])
+
+
+@pytest.fixture()
+def template(static_header) -> LayoutTemplate:
+    return LayoutTemplate(
+        html.Div(
+            [
+                static_header,
+                html.Main(Hole("body"), style={"color": Hole("colour", "black")}),
+            ],
+            id="shell",
+        )
+    )
+
+
+def test_template_holes(template):
+    assert sorted(template.holes) == ["body", "colour"]
+
+
+def test_fill_shares_static_subtrees(template, static_header):
+    layout = template.fill(body=html.P("Sales"))
+    header, main = layout.children
+    assert header is static_header
+    assert main.children.children == "Sales"
+    assert main.style == {"color": "black"}
+    other = template.fill(body="Costs", colour="red")
+    assert other.children[1].children == "Costs"
+    assert other.children[1].style == {"color": "red"}
+    assert layout.children[1].children.children == "Sales"
+
+
+def test_snapshot_matches_fill(template):
+    values = {"body": html.P("Sales"), "colour": "red"}
+    snapshot = template.snapshot(**values)
+    assert isinstance(snapshot, LayoutSnapshot)
+    expected = json.loads(to_json_plotly(template.fill(**values)))
+    assert json.loads(snapshot.data) == expected
+
+
+def test_snapshot_splices_snapshots(template):
+    body = LayoutSnapshot.from_layout(html.P("Sales"))
+    snapshot = template.snapshot(body=body)
+    main = snapshot.to_plotly_json()["props"]["children"][1]
+    assert main["props"]["children"]["props"]["children"] == "Sales"
+
+
+def test_template_value_errors(template):
+    with pytest.raises(ValueError, match="Missing value for hole 'body'"):
+        template.fill()
+    with pytest.raises(ValueError, match="Unknown holes: title"):
+        template.snapshot(body="x", title="y")
+    with pytest.raises(ValueError, match="Invalid hole name"):
+        Hole('"quoted"')
+
+
+def test_page_template_compiled_once():
+    calls = []
+
+    class ReportPage(DashPage):
+        @classmethod
+        def skeleton(cls):
+            calls.append(cls)
+            return html.Div([dmc.Title(Hole("title")), html.Div(Hole("body"))])
+
+        @classmethod
+        def valid_layout(cls, title: str = "Report", **kwargs):
+            return cls.template().snapshot(title=title, body=kwargs.get("body"))
+
+    first = ReportPage.snapshot(title="Sales")
+    second = ReportPage.layout(title="Costs")
+    assert calls == [ReportPage]
+    assert first.to_plotly_json()["props"]["children"][0]["props"]["children"] == (
+        "Sales"
+    )
+    assert isinstance(second, LayoutSnapshot)
+
+
+def test_skeleton_not_defined(test_page):
+    with pytest.raises(NotImplementedError, match="does not define a skeleton"):
+        test_page.template()
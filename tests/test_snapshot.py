@@ -0,0 +1,65 @@
+"""Tests for pre-serialized layout snapshots."""
+
+import json
+
+import dash
+from dash import html
+from dash._utils import to_json
+
+from src.dash_builder import LayoutCache, LayoutSnapshot
+from src.dash_builder.snapshot import serve_snapshots
+
+
+def test_snapshot_round_trip():
+    layout = html.Div("content", id="content")
+    snapshot = LayoutSnapshot.from_layout(layout)
+    assert json.loads(snapshot.data) == json.loads(to_json(layout))
+    assert to_json(html.Div(snapshot)) == to_json(html.Div(layout))
+
+
+def test_snapshot_content_hash():
+    first = LayoutSnapshot.from_layout(html.Div("a"))
+    second = LayoutSnapshot.from_layout(html.Div("a"))
+    third = LayoutSnapshot.from_layout(html.Div("b"))
+    assert first == second
+    assert first.etag != third.etag
+
+
+def test_page_snapshot_cached(test_page):
+    test_page.snapshot_cache = LayoutCache()
+    assert test_page.snapshot() is test_page.snapshot()
+    assert test_page.snapshot_cache.stats()["hits"] == 1
+
+
+def test_page_snapshot_error_not_cached(error_page):
+    error_page.snapshot_cache = LayoutCache()
+    snapshot = error_page.snapshot()
+    assert b"ZeroDivisionError" in snapshot.data
+    assert len(error_page.snapshot_cache) == 0
+
+
+def test_serve_snapshots_sends_stored_bytes(monkeypatch):
+    snapshot = LayoutSnapshot.from_layout(html.Div("content", id="content"))
+    app = dash.Dash(__name__)
+    app.layout = lambda: snapshot
+    serve_snapshots(app)
+
+    def decode(self):
+        raise AssertionError("snapshot decoded")
+
+    monkeypatch.setattr(LayoutSnapshot, "to_plotly_json", decode)
+    client = app.server.test_client()
+    response = client.get("/_dash-layout")
+    assert response.status_code == 200
+    assert response.data == snapshot.data
+    assert response.headers["ETag"] == f'"{snapshot.etag}"'
+    cached = client.get("/_dash-layout", headers={"If-None-Match": snapshot.etag})
+    assert cached.status_code == 304
+
+
+def test_serve_snapshots_encodes_other_layouts():
+    app = dash.Dash(__name__)
+    app.layout = html.Div("content", id="content")
+    serve_snapshots(app)
+    response = app.server.test_client().get("/_dash-layout")
+    assert response.json == json.loads(to_json(app.layout))
@@ -0,0 +1,237 @@
+"""Tests for the server-side paginated table view."""
+
+import pytest
+from dash import dash_table
+from dash._callback import GLOBAL_CALLBACK_LIST, GLOBAL_CALLBACK_MAP
+
+from src.dash_builder.table import (
+    ColumnStatistics,
+    DataTableView,
+    ListRowSource,
+    RowSource,
+    TableFilter,
+    TableQuery,
+    parse_filter_query,
+    row_source,
+)
+
+ROWS = [
+    {"name": "Anna", "city": "Paris", "age": 31},
+    {"name": "bob", "city": "Berlin", "age": None},
+    {"name": "Carl", "city": "Paris", "age": 25},
+    {"name": "Dora", "city": "Rome", "age": 47},
+    {"name": "Emil", "city": "Berlin", "age": 25},
+]
+
+
+@pytest.fixture()
+def table_view() -> type[DataTableView]:
+    class PeopleTableView(DataTableView):
+        page_size = 2
+        calls: list[str] = []
+
+        @classmethod
+        def data(cls, id: str):
+            cls.calls.append(id)
+            return ListRowSource(ROWS, version="v1")
+
+    return PeopleTableView
+
+
+def test_parse_filter_query():
+    assert parse_filter_query('{city} contains "Par" && {age} >= 30') == (
+        TableFilter("city", "contains", "Par"),
+        TableFilter("age", "ge", 30),
+    )
+    assert parse_filter_query("{name} ieq bob") == (
+        TableFilter("name", "eq", "bob", True),
+    )
+    assert parse_filter_query("{age} s< 2.5") == (TableFilter("age", "lt", 2.5),)
+    assert parse_filter_query("") == ()
+    assert parse_filter_query("{age} is blank && {city} is not nil") == (
+        TableFilter("age", "blank", None),
+        TableFilter("city", "not_nil", None),
+    )
+
+
+def test_parse_filter_query_unsupported():
+    with pytest.raises(ValueError, match="Unsupported filter operator"):
+        parse_filter_query("{age} between 3")
+    with pytest.raises(ValueError, match="Unsupported filter condition"):
+        parse_filter_query("age > 3")
+    with pytest.raises(ValueError, match="'||'"):
+        parse_filter_query("{age} > 3 || {age} < 1")
+    assert parse_filter_query('{name} = "a || b"') == (
+        TableFilter("name", "eq", "a || b"),
+    )
+
+
+def test_list_source_pages():
+    source = ListRowSource(ROWS)
+    rows, total = source.fetch(TableQuery(page_current=2, page_size=2))
+    assert rows == [ROWS[4]]
+    assert total == 5
+
+
+def test_list_source_sort_and_filter():
+    source = ListRowSource(ROWS)
+    rows, total = source.fetch(
+        TableQuery(
+            page_size=10,
+            sort_by=(("age", "asc"), ("name", "desc")),
+            filters=(TableFilter("city", "ne", "Rome"),),
+        )
+    )
+    assert [row["name"] for row in rows] == ["Emil", "Carl", "Anna", "bob"]
+    assert total == 4
+
+    rows, _ = source.fetch(
+        TableQuery(filters=(TableFilter("name", "contains", "B", True),))
+    )
+    assert [row["name"] for row in rows] == ["bob"]
+
+
+def test_list_source_unary_filters_and_mixed_sort():
+    rows = [{"value": 2}, {"value": ""}, {"value": None}, {"value": "a"}]
+    source = ListRowSource(rows)
+    blank, _ = source.fetch(TableQuery(filters=(TableFilter("value", "blank", None),)))
+    assert blank == rows[1:3]
+    present, total = source.fetch(
+        TableQuery(filters=(TableFilter("value", "not_nil", None),))
+    )
+    assert total == 3
+    ordered, _ = source.fetch(TableQuery(sort_by=(("value", "asc"),)))
+    assert [row["value"] for row in ordered] == [2, "", "a", None]
+
+
+def test_list_source_statistics():
+    statistics = ListRowSource(ROWS).statistics()
+    assert statistics["age"] == ColumnStatistics(4, 1, 25, 47)
+    assert statistics["city"] == ColumnStatistics(5, 0, "Berlin", "Rome")
+
+
+def test_row_source_adapts_sequences():
+    source = row_source(ROWS)
+    assert isinstance(source, RowSource)
+    assert source.columns() == ["name", "city", "age"]
+    assert row_source(source) is source
+
+
+def test_table_view_layout(table_view):
+    container = table_view.layout("people")
+    table = container.children
+    assert isinstance(table, dash_table.DataTable)
+    assert table.id == table_view.id("people", "table")
+    assert table.data == ROWS[:2]
+    assert table.page_count == 3
+    assert table.page_action == "custom"
+    assert table.tooltip_header["age"] == "4 values, 1 empty, from 25 to 47"
+
+
+def test_table_view_layout_kwargs(table_view):
+    table = table_view.layout("people", page_size=10, style_table={"height": 300})
+    assert table.children.data == ROWS
+    assert table.children.page_count == 1
+    assert table.children.style_table == {"height": 300}
+
+
+def test_table_view_callback(table_view):
+    outputs = [callback["output"] for callback in GLOBAL_CALLBACK_LIST]
+    output = (
+        '..{"index":["MATCH"],"type":"people-table-view-table"}.data...'
+        '{"index":["MATCH"],"type":"people-table-view-table"}.page_count..'
+    )
+    assert output in outputs
+    callback = GLOBAL_CALLBACK_MAP[output]["callback"].__wrapped__
+    rows, page_count = callback(
+        0,
+        2,
+        [{"column_id": "age", "direction": "desc"}],
+        "{city} = Paris",
+        table_view.id("people", "table"),
+    )
+    assert [row["name"] for row in rows] == ["Anna", "Carl"]
+    assert page_count == 1
+    assert callback(0, 2, [], "{age} > 3 || {age} < 1", {"index": "people"}) == (
+        [],
+        1,
+    )
+    assert callback(0, 2, [], "{missing} = 1", {"index": "people"}) == ([], 1)
+    sort_missing = [{"column_id": "missing", "direction": "asc"}]
+    assert callback(0, 2, sort_missing, "", {"index": "people"}) == ([], 1)
+
+
+def test_table_view_callback_data_errors_propagate():
+    class BrokenTableView(DataTableView):
+        @classmethod
+        def data(cls, id: str):
+            raise KeyError(id)
+
+    callback = next(
+        GLOBAL_CALLBACK_MAP[callback["output"]]["callback"].__wrapped__
+        for callback in GLOBAL_CALLBACK_LIST
+        if "broken-table-view-table" in callback["output"]
+    )
+    with pytest.raises(KeyError):
+        callback(0, 2, [], "", {"index": "broken"})
+
+
+def test_table_view_statistics_cached(table_view):
+    table_view.layout("people")
+    table_view.layout("people")
+    source = table_view.source("people")
+    assert table_view.statistics("people", source) is table_view.statistics(
+        "people", source
+    )
+    assert len(table_view._statistics_cache) == 1
+
+
+def test_table_view_statistics_without_version(table_view):
+    source = ListRowSource(ROWS)
+    assert source.version() is None
+    assert table_view.statistics("people", source)["age"].count == 4
+    assert table_view._statistics_cache == {}
+
+
+def test_dataframe_source():
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame(ROWS)
+    source = row_source(frame)
+    rows, total = source.fetch(
+        TableQuery(
+            page_size=2,
+            sort_by=(("age", "desc"),),
+            filters=(TableFilter("city", "contains", "r"),),
+        )
+    )
+    assert [row["name"] for row in rows] == ["Anna", "Carl"]
+    assert total == 4
+    statistics = source.statistics()
+    assert statistics["age"] == ColumnStatistics(4, 1, 25, 47)
+    rows, total = source.fetch(
+        TableQuery(
+            filters=(TableFilter("age", "gt", "abc"), TableFilter("age", "nil", None))
+        )
+    )
+    assert (rows, total) == ([], 0)
+    _, total = source.fetch(TableQuery(filters=(TableFilter("age", "blank", None),)))
+    assert total == 1
+    mixed = row_source(pandas.DataFrame({"value": [2, "b", 1, "a"]}))
+    rows, _ = mixed.fetch(TableQuery(sort_by=(("value", "asc"),)))
+    assert [row["value"] for row in rows] == [1, 2, "a", "b"]
+
+
+def test_arrow_source():
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.Table.from_pylist(ROWS)
+    source = row_source(table)
+    rows, total = source.fetch(
+        TableQuery(page_size=10, filters=(TableFilter("age", "lt", 30),))
+    )
+    assert sorted(row["name"] for row in rows) == ["Carl", "Emil"]
+    assert total == 2
+    assert source.statistics()["age"] == ColumnStatistics(4, 1, 25, 47)
+    _, total = source.fetch(TableQuery(filters=(TableFilter("age", "nil", None),)))
+    assert total == 1
+    for condition in (TableFilter("age", "lt", "abc"), TableFilter("city", "gt", 1)):
+        assert source.fetch(TableQuery(filters=(condition,))) == ([], 0)
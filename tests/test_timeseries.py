@@ -0,0 +1,117 @@
+"""Tests for the downsampling graph view."""
+
+import dash
+import pytest
+from dash import dcc
+from dash._callback import GLOBAL_CALLBACK_LIST, GLOBAL_CALLBACK_MAP
+
+from src.dash_builder.timeseries import (
+    DownsampledGraphView,
+    lttb,
+    minmax,
+    visible_range,
+)
+
+
+@pytest.fixture()
+def np():
+    return pytest.importorskip("numpy")
+
+
+@pytest.fixture()
+def graph_view(np) -> type[DownsampledGraphView]:
+    x = np.arange(100_000, dtype=float)
+    y = np.sin(x / 500)
+
+    class SignalGraphView(DownsampledGraphView):
+        max_points = 500
+
+        @classmethod
+        def series(cls, id: str):
+            return {"signal": (x, y)}
+
+    return SignalGraphView
+
+
+def test_visible_range():
+    assert visible_range(None) is None
+    assert visible_range({"dragmode": "pan"}) is None
+    assert visible_range({"xaxis.range[0]": 1, "xaxis.range[1]": 5}) == (1, 5)
+    assert visible_range({"xaxis.range": [2, 3]}) == (2, 3)
+    assert visible_range({"xaxis.autorange": True}) == (None, None)
+    assert visible_range({"autosize": True}) is None
+
+
+def test_lttb(np):
+    x = np.arange(10_000)
+    y = np.zeros(10_000)
+    y[4321] = 100.0
+    sampled_x, sampled_y = lttb(x, y, 100)
+    assert len(sampled_x) == 100
+    assert sampled_x[0] == 0 and sampled_x[-1] == 9_999
+    assert np.all(np.diff(sampled_x) > 0)
+    assert 4321 in sampled_x
+    assert sampled_y.max() == 100.0
+
+
+def test_lttb_short_series(np):
+    x, y = np.arange(10), np.arange(10)
+    assert len(lttb(x, y, 20)[0]) == 10
+    assert lttb(x, y, 2)[0].tolist() == [0, 9]
+
+
+def test_lttb_missing_values(np):
+    x = np.arange(10_000)
+    y = np.zeros(10_000)
+    y[100:200] = np.nan
+    y[4321] = 100.0
+    sampled_x, sampled_y = lttb(x, y, 100)
+    assert 4321 in sampled_x
+    assert np.isnan(sampled_y).sum() <= 1
+
+
+def test_minmax(np):
+    x = np.arange(1_001)
+    y = np.random.default_rng(0).normal(size=1_001)
+    y[17] = np.nan
+    sampled_x, sampled_y = minmax(x, y, 100)
+    assert len(sampled_x) <= 100
+    assert np.all(np.diff(sampled_x) > 0)
+    assert np.nanmax(y) in sampled_y
+    assert np.nanmin(y) in sampled_y
+
+
+def test_lttb_datetimes(np):
+    x = np.arange("2024-01-01", "2024-03-01", dtype="datetime64[h]")
+    y = np.arange(len(x), dtype=float)
+    sampled_x, _ = lttb(x, y, 50)
+    assert sampled_x.dtype == x.dtype
+    assert len(sampled_x) == 50
+
+
+def test_graph_view_layout(graph_view):
+    container = graph_view.layout("cpu", width=100)
+    graph, store = container.children
+    assert isinstance(graph, dcc.Graph)
+    assert graph.id == graph_view.id("cpu")
+    assert len(graph.figure["data"][0]["x"]) == 200
+    assert graph.figure["layout"]["uirevision"] == "cpu"
+    assert store.data == 200
+
+
+def test_graph_view_zoom_callback(graph_view):
+    output = '{"index":["MATCH"],"type":"signal-graph-view"}.figure'
+    assert output in [callback["output"] for callback in GLOBAL_CALLBACK_LIST]
+    callback = GLOBAL_CALLBACK_MAP[output]["callback"].__wrapped__
+
+    assert callback({"dragmode": "zoom"}, 500, graph_view.id("cpu")) is dash.no_update
+    patch = callback(
+        {"xaxis.range[0]": 1000.5, "xaxis.range[1]": 1100},
+        500,
+        graph_view.id("cpu"),
+    )
+    operations = patch.to_plotly_json()["operations"]
+    assert [op["location"] for op in operations] == [["data", 0, "x"], ["data", 0, "y"]]
+    x = operations[0]["params"]["value"]
+    assert x[0] == 1000 and x[-1] == 1101
+    assert len(x) == 102